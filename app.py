@@ -6,35 +6,49 @@
 #
 # Folder:
 #   app.py
+#   safety.py        (escalation check)
+#   notify.py        (coach email)
+#   replies.py       (MAXE reply text)
+#   typewriter.py    (typed reply effect)
+#   build_assets.py  (regenerates maxe_assets/_assets.py from the PNGs)
 #   requirements.txt
 #   maxe_assets/
+#       _assets.py   (generated WebP data URIs)
 #       maxe_idle.png
 #       maxe_thinking_a.png
 #       maxe_thinking_b.png
 #       maxe_escalation.png
 
-import os
-import re
-import time
-import base64
-import smtplib
-from email.message import EmailMessage
-from typing import List, Dict, Any, Optional, Tuple
+import copy
+import html
+import itertools
+from collections import deque
+from typing import Dict, Any
 
 import streamlit as st
 
+from maxe_assets._assets import ESCALATION_URI, IDLE_URI, THINKING_A_URI, THINKING_B_URI
+from notify import submit_coach_email
+from replies import MAXE_ESCALATION_REPLY, maxe_reply_for
+from safety import check_escalation
+from typewriter import type_text
+
 
 # ----------------------------
 # ASSETS
 # ----------------------------
-ASSET_IDLE = "maxe_assets/maxe_idle.png"
-ASSET_THINKING_A = "maxe_assets/maxe_thinking_a.png"
-ASSET_THINKING_B = "maxe_assets/maxe_thinking_b.png"
-ASSET_ESCALATION = "maxe_assets/maxe_escalation.png"
+# Pre-encoded at build time (build_assets.py), so a cold start does no disk
+# reads or image encoding. Keys used everywhere the art is looked up.
+DATA_URIS = {
+    "IDLE": IDLE_URI,
+    "THINKING_A": THINKING_A_URI,
+    "THINKING_B": THINKING_B_URI,
+    "ESCALATION": ESCALATION_URI,
+}
 
 # UI sizing
 HERO_WIDTH_PX = 340      # try 280–420
-THINK_SECONDS = 0.9
+HERO_COLS = (1, 2, 1)    # left / hero / right column ratio
 THINK_INTERVAL = 0.25
 
 # If you want the “typed” effect, set True (can feel janky on Streamlit Cloud)
@@ -42,20 +56,10 @@ ENABLE_TYPEWRITER = False
 TYPE_SPEED = 0.01
 
 
-# ----------------------------
-# SECRETS / ENV helper
-# ----------------------------
-def get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
-    if hasattr(st, "secrets") and key in st.secrets:
-        return str(st.secrets[key])
-    return os.getenv(key, default)
-
-
 # ----------------------------
 # CSS (hero glow)
 # ----------------------------
-st.markdown(
-    """
+HERO_CSS = """
 <style>
 .maxe-hero {
     border-radius: 16px;
@@ -69,6 +73,11 @@ st.markdown(
     box-shadow:
         0 0 25px rgba(212, 175, 55, 0.35),
         0 0 60px rgba(212, 175, 55, 0.25);
+    animation: maxe-pulse 1.2s ease-in-out infinite;
+}
+@keyframes maxe-pulse {
+    0%, 100% { transform: scale(1); }
+    50% { transform: scale(1.02); }
 }
 
 .maxe-escalation {
@@ -77,221 +86,192 @@ st.markdown(
         0 0 70px rgba(255, 60, 60, 0.35);
 }
 
+/* THINKING: both frames are sent once and swapped by the browser */
+.maxe-frames { position: relative; display: inline-block; }
+.maxe-frames .maxe-frame-b {
+    position: absolute;
+    top: 0;
+    left: 0;
+    /* keep the pulse too, or frame B would sit still while A breathes */
+    animation:
+        maxe-frame-swap var(--maxe-frame-period) steps(1) infinite,
+        maxe-pulse 1.2s ease-in-out infinite;
+}
+@keyframes maxe-frame-swap {
+    0% { opacity: 0; }
+    50% { opacity: 1; }
+}
+
+/* Older chat turns, emitted as one pre-rendered block */
+.maxe-history .maxe-msg {
+    white-space: pre-wrap;
+    padding: 0.4rem 0.75rem;
+    margin: 0.25rem 0;
+    border-radius: 8px;
+    opacity: 0.8;
+}
+.maxe-history .maxe-msg-user { background: rgba(128, 128, 128, 0.12); }
+
 /* Center the app a bit tighter */
 .block-container { padding-top: 2rem; }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
 
+TITLE_HTML = "<h1 style='text-align:center; margin-bottom: 0.5rem;'>MAXE</h1>"
 
-# ----------------------------
-# EMAIL (Email-only MVP)
-# ----------------------------
-def send_coach_email(subject: str, body: str, reasons: List[str]) -> None:
-    to_email = get_secret("COACH_EMAIL")
-    smtp_host = get_secret("SMTP_HOST")
-    smtp_port = int(get_secret("SMTP_PORT", "587"))
-    smtp_user = get_secret("SMTP_USER")
-    smtp_pass = get_secret("SMTP_PASS")
-    smtp_from = get_secret("SMTP_FROM", smtp_user)
-
-    missing = [k for k, v in {
-        "COACH_EMAIL": to_email,
-        "SMTP_HOST": smtp_host,
-        "SMTP_USER": smtp_user,
-        "SMTP_PASS": smtp_pass,
-        "SMTP_FROM": smtp_from,
-    }.items() if not v]
-
-    if missing:
-        raise RuntimeError(f"Missing email config keys: {', '.join(missing)}")
-
-    msg = EmailMessage()
-    msg["From"] = smtp_from
-    msg["To"] = to_email
-    msg["Subject"] = subject
-    msg.set_content(body + f"\n\nEscalation reasons: {', '.join(reasons)}")
-
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.starttls()
-        server.login(smtp_user, smtp_pass)
-        server.send_message(msg)
-
+# Style block + title in one element. Streamlit drops any element a rerun
+# doesn't emit, so this is written on every run; only the string is built once.
+PAGE_HEADER = HERO_CSS + TITLE_HTML
 
-# ----------------------------
-# ESCALATION CHECK (MVP)
-# ----------------------------
-def _contains_any(text: str, patterns: List[str]) -> bool:
-    return any(re.search(p, text, flags=re.IGNORECASE) for p in patterns)
-
-def check_escalation(user_msg: str) -> Tuple[bool, List[str]]:
-    t = user_msg.strip()
-    reasons: List[str] = []
-
-    medical_red_flags = [
-        r"\bchest pain\b|\bchest pressure\b",
-        r"\bfaint(ed|ing)?\b|\bpassed out\b|\bblack(ed)? out\b",
-        r"\b(can't|cannot) breathe\b|\bsevere shortness of breath\b|\bshort(ness)? of breath\b",
-        r"\bnumb(ness)?\b|\btingl(e|ing)\b|\bweak(ness)?\b|\bface droop\b|\bconfus(ed|ion)\b",
-        r"\bpalpitation(s)?\b|\birregular heartbeat\b|\bheart flutter\b",
-        r"\baorta\b|\baneurysm\b",
-        r"\bblood pressure\b.*\b(high|spike|spiking)\b",
-    ]
-
-    injury_red_flags = [
-        r"\bsharp pain\b",
-        r"\bheard a pop\b|\bpop(ped)?\b.*\bpain\b",
-        r"\bswelling\b|\bbruis(e|ing)\b",
-        r"\b(can't|cannot) bear weight\b|\bcan't walk\b",
-        r"\bshoot(ing)? pain\b|\bpain down (my|the) (arm|leg)\b",
-        r"\bunstable\b|\bgiving out\b|\blocks up\b",
-    ]
-
-    requires_coach = [
-        r"\bmax out\b|\b1rm\b|\bPR\b",
-        r"\bchange (my|the) program\b|\bmodify (my|the) program\b",
-        r"\bskip (this|the) week\b|\bdeload\b.*\bnow\b",
-        r"\bwhat did you mean\b|\bwhat do you want me to do\b",
-    ]
-
-    if _contains_any(t, medical_red_flags):
-        reasons.append("medical_red_flag")
-    if _contains_any(t, injury_red_flags):
-        reasons.append("injury_red_flag")
-    if _contains_any(t, requires_coach):
-        reasons.append("requires_coach_judgment")
-
-    return (len(reasons) > 0, reasons)
+def render_header() -> None:
+    st.markdown(PAGE_HEADER, unsafe_allow_html=True)
 
 
 # ----------------------------
-# Replies (stubs for now)
+# Image helpers (data URIs to prevent broken <img src="localpath">)
 # ----------------------------
-def maxe_reply_for(user_msg: str) -> str:
-    return (
-        "Acknowledged.\n\n"
-        "If you need a substitution, tell me:\n"
-        "- what exercise you’re replacing\n"
-        "- available equipment\n"
-        "- what feels limited (pain vs tightness vs fatigue)\n\n"
-        "I will preserve the intent and keep risk low."
-    )
+# Assistant chat avatars use the same art as the hero
+AVATAR_IDLE = DATA_URIS["IDLE"]
+AVATAR_THINKING = DATA_URIS["THINKING_A"]
+AVATAR_ESCALATION = DATA_URIS["ESCALATION"]
+
+def hero_key_for_state(state: str) -> str:
+    # THINKING is drawn by render_hero itself (two stacked frames)
+    return "ESCALATION" if state == "ESCALATION" else "IDLE"
+
+STATE_CLASS = {
+    "IDLE": "maxe-idle",
+    "THINKING": "maxe-thinking",
+    "ESCALATION": "maxe-escalation",
+}
 
-def maxe_escalation_reply() -> str:
-    return (
-        "Coach notified.\n\n"
-        "Stop the session if symptoms worsen.\n"
-        "If you have chest pain, fainting, or severe shortness of breath, seek urgent medical care."
-    )
+def css_class_for_state(state: str) -> str:
+    return STATE_CLASS.get(state, "maxe-idle")
 
+STATUS_CAPTION = {state: f"Status: {state}" for state in STATE_CLASS}
 
-# ----------------------------
-# Image helpers (base64 to prevent broken <img src="localpath">)
-# ----------------------------
-@st.cache_data(show_spinner=False)
-def img_to_data_uri(path: str) -> str:
-    with open(path, "rb") as f:
-        data = f.read()
-    b64 = base64.b64encode(data).decode("utf-8")
-    return f"data:image/png;base64,{b64}"
-
-def hero_path_for_state(state: str, frame: str = "A") -> str:
-    if state == "ESCALATION":
-        return ASSET_ESCALATION
-    if state == "THINKING":
-        return ASSET_THINKING_A if frame == "A" else ASSET_THINKING_B
-    return ASSET_IDLE
+# What each hero placeholder already shows in this run (the script re-executes
+# per rerun, so this starts empty every time). Rewriting the same state would
+# only resend the inline image bytes and make the browser decode them again.
+_hero_shown: Dict[int, Any] = {}
+
+def render_hero(slot, state: str, width_px: int = HERO_WIDTH_PX) -> None:
+    if _hero_shown.get(id(slot)) == (state, width_px):
+        return
+    _hero_shown[id(slot)] = (state, width_px)
 
-def css_class_for_state(state: str) -> str:
-    return {
-        "IDLE": "maxe-idle",
-        "THINKING": "maxe-thinking",
-        "ESCALATION": "maxe-escalation",
-    }.get(state, "maxe-idle")
-
-def render_hero(slot, state: str, frame: str = "A", width_px: int = HERO_WIDTH_PX) -> None:
-    asset_path = hero_path_for_state(state, frame=frame)
-    data_uri = img_to_data_uri(asset_path)
     cls = css_class_for_state(state)
 
+    if state == "THINKING":
+        # Frame B sits on top of A and blinks via CSS (see .maxe-frames)
+        uri_a = DATA_URIS["THINKING_A"]
+        uri_b = DATA_URIS["THINKING_B"]
+        img = f"""
+            <div class="maxe-frames" style="--maxe-frame-period:{THINK_INTERVAL * 2}s;">
+                <img src="{uri_a}" class="maxe-hero {cls}" width="{width_px}" />
+                <img src="{uri_b}" class="maxe-hero {cls} maxe-frame-b" width="{width_px}" />
+            </div>
+        """
+    else:
+        data_uri = DATA_URIS[hero_key_for_state(state)]
+        img = f'<img src="{data_uri}" class="maxe-hero {cls}" width="{width_px}" />'
+
     slot.markdown(
         f"""
         <div style="display:flex; justify-content:center;">
-            <img src="{data_uri}" class="maxe-hero {cls}" width="{width_px}" />
+            {img}
         </div>
         """,
         unsafe_allow_html=True
     )
 
-def assistant_avatar_data_uri(state: str = "IDLE", frame: str = "A") -> str:
-    # Use the same art as the hero for the avatar
-    return img_to_data_uri(hero_path_for_state(state, frame=frame))
+
+def typewriter(bubble, text: str) -> None:
+    # bubble is the st.chat_message container itself: one element per reply
+    if not ENABLE_TYPEWRITER:
+        bubble.markdown(text)
+        return
+
+    type_text(text, bubble, typing_speed=TYPE_SPEED, pre_delay=0)
 
 
 # ----------------------------
-# “Thinking” animation (in-place)
+# Streamlit App
 # ----------------------------
-def animate_thinking(hero_slot, status_slot, bubble_slot) -> None:
-    end = time.time() + THINK_SECONDS
-    frame = "A"
-    while time.time() < end:
-        status_slot.caption("Status: THINKING")
-        render_hero(hero_slot, "THINKING", frame=frame)
+# Oldest turns fall off once a session passes this many messages
+MAX_MESSAGES = 500
+# Only the newest turns get full chat_message widgets; older ones are one HTML block
+HISTORY_WINDOW = 40
+
+SESSION_DEFAULTS: Dict[str, Any] = {
+    "messages": deque(maxlen=MAX_MESSAGES),   # (role, content) tuples
+    "hero_state": "IDLE",
+    "email_errors": [],   # filled by the background email sender
+}
 
-        # Keep the assistant bubble showing activity
-        bubble_slot.markdown("…")
+def init_session_state() -> None:
+    ss = st.session_state
+    for key, value in SESSION_DEFAULTS.items():
+        if key not in ss:
+            # Copy so sessions never share a mutable default
+            ss[key] = copy.copy(value)
 
-        frame = "B" if frame == "A" else "A"
-        time.sleep(THINK_INTERVAL)
 
+def add_message(role: str, content: str) -> None:
+    st.session_state.messages.append((role, content))
 
-def typewriter(bubble_slot, text: str) -> None:
-    if not ENABLE_TYPEWRITER:
-        bubble_slot.markdown(text)
-        return
+def history_entry_html(role: str, content: str) -> str:
+    # CommonMark ends an HTML block at the first blank line and parses the
+    # rest as Markdown, so the entry must stay on one line: newlines become
+    # &#10;, which white-space: pre-wrap still shows as line breaks
+    text = "&#10;".join(html.escape(content).splitlines())
+    return f'<div class="maxe-msg maxe-msg-{role}">{text}</div>'
 
-    typed = ""
-    for ch in text:
-        typed += ch
-        bubble_slot.markdown(typed)
-        time.sleep(TYPE_SPEED)
+def older_history_html(older) -> str:
+    # Built each run. A cache keyed on the history would only hit on the
+    # rerun that ends each turn; the join is cheap next to sending the block.
+    return "".join(history_entry_html(role, content) for role, content in older)
 
 
-# ----------------------------
-# Streamlit App
-# ----------------------------
 st.set_page_config(page_title="MAXE", layout="centered")
-
-if "messages" not in st.session_state:
-    st.session_state.messages: List[Dict[str, Any]] = []
-if "hero_state" not in st.session_state:
-    st.session_state.hero_state = "IDLE"
+init_session_state()
 
 
-# Title
-st.markdown("<h1 style='text-align:center; margin-bottom: 0.5rem;'>MAXE</h1>", unsafe_allow_html=True)
+# CSS + title
+render_header()
 
 # Hero (single stable placeholders)
-hero_left, hero_center, hero_right = st.columns([1, 2, 1])
+hero_left, hero_center, hero_right = st.columns(HERO_COLS)
 with hero_center:
     hero_slot = st.empty()
     status_slot = st.empty()
 
-    status_slot.caption(f"Status: {st.session_state.hero_state}")
-    render_hero(hero_slot, st.session_state.hero_state, frame="A")
+    status_slot.caption(STATUS_CAPTION[st.session_state.hero_state])
+    render_hero(hero_slot, st.session_state.hero_state)
 
 st.divider()
 
 
 # Chat history (assistant uses MAXE avatar)
-for m in st.session_state.messages:
-    if m["role"] == "user":
+# Every rerun must re-emit the history: Streamlit clears elements a run skips.
+n_older = max(len(st.session_state.messages) - HISTORY_WINDOW, 0)
+if n_older:
+    older = itertools.islice(st.session_state.messages, n_older)
+    with st.expander(f"Earlier ({n_older} messages)", expanded=False):
+        st.markdown(f'<div class="maxe-history">{older_history_html(older)}</div>', unsafe_allow_html=True)
+for role, content in itertools.islice(st.session_state.messages, n_older, None):
+    if role == "user":
         with st.chat_message("user"):
-            st.markdown(m["content"])
+            st.markdown(content)
     else:
-        with st.chat_message("assistant", avatar=assistant_avatar_data_uri("IDLE")):
-            st.markdown(m["content"])
+        with st.chat_message("assistant", avatar=AVATAR_IDLE):
+            st.markdown(content)
+
+
+# Coach email failures reported since the last run (a toast, so it doesn't
+# push the chat down or linger in the page)
+while st.session_state.email_errors:
+    st.toast(f"Coach email not sent (check Streamlit secrets): {st.session_state.email_errors.pop(0)}", icon="⚠️")
 
 
 # Input
@@ -299,54 +279,46 @@ user_msg = st.chat_input("Message MAXE…")
 
 if user_msg:
     # User message
-    st.session_state.messages.append({"role": "user", "content": user_msg})
+    add_message("user", user_msg)
     with st.chat_message("user"):
         st.markdown(user_msg)
 
-    escalate, reasons = check_escalation(user_msg)
+    result = check_escalation(user_msg)
 
-    if escalate:
+    if result.escalate:
         # Escalation state
         st.session_state.hero_state = "ESCALATION"
-        status_slot.caption("Status: ESCALATION")
-        render_hero(hero_slot, "ESCALATION", frame="A")
+        render_hero(hero_slot, "ESCALATION")
 
-        reply = maxe_escalation_reply()
+        reply = MAXE_ESCALATION_REPLY
 
-        with st.chat_message("assistant", avatar=assistant_avatar_data_uri("ESCALATION")):
-            bubble_slot = st.empty()
-            typewriter(bubble_slot, reply)
+        typewriter(st.chat_message("assistant", avatar=AVATAR_ESCALATION), reply)
 
-        st.session_state.messages.append({"role": "assistant", "content": reply})
+        add_message("assistant", reply)
 
-        # Email coach (best effort)
-        try:
-            send_coach_email(
-                subject="MAXE Escalation Alert",
-                body=f"User message:\n\n{user_msg}\n\nContext:\n- App: MAXE\n- State: ESCALATION\n",
-                reasons=reasons,
-            )
-        except Exception as e:
-            st.warning(f"Coach email not sent (check Streamlit secrets): {e}")
+        # Email coach (best effort, off the script thread so the reply isn't held up)
+        submit_coach_email(
+            subject="MAXE Escalation Alert",
+            body=f"User message:\n\n{user_msg}\n\nContext:\n- App: MAXE\n- State: ESCALATION\n",
+            reasons=list(result.reasons),
+            errors=st.session_state.email_errors,
+        )
 
     else:
-        # Thinking state + animation (no duplicates / no vanish)
+        # THINKING stays up while the reply is built and written (the A<->B
+        # animation runs in the browser, no server loop)
         st.session_state.hero_state = "THINKING"
-        status_slot.caption("Status: THINKING")
-        render_hero(hero_slot, "THINKING", frame="A")
-
-        with st.chat_message("assistant", avatar=assistant_avatar_data_uri("THINKING", frame="A")):
-            bubble_slot = st.empty()
-            animate_thinking(hero_slot, status_slot, bubble_slot)
+        render_hero(hero_slot, "THINKING")
 
-            # Return to IDLE and respond
-            st.session_state.hero_state = "IDLE"
-            status_slot.caption("Status: IDLE")
-            render_hero(hero_slot, "IDLE", frame="A")
+        reply = maxe_reply_for(user_msg)
+        typewriter(st.chat_message("assistant", avatar=AVATAR_THINKING), reply)
 
-            reply = maxe_reply_for(user_msg)
-            typewriter(bubble_slot, reply)
+        add_message("assistant", reply)
 
-        st.session_state.messages.append({"role": "assistant", "content": reply})
+        # Back to IDLE; the rerun below draws it from hero_state
+        st.session_state.hero_state = "IDLE"
 
+    # Redraw from session state so the new turns look exactly as history will
+    # draw them (idle avatar, "Earlier (N)" count and window shifted); this also
+    # writes the status caption for the state the turn ended in
     st.rerun()
@@ -0,0 +1,47 @@
+# build_assets.py — regenerate maxe_assets/_assets.py from the PNGs
+#
+# Run after changing any image in maxe_assets/:
+#   python build_assets.py
+# Needs Pillow (pip install pillow). The app itself only imports the
+# generated module, so it never reads or encodes the PNGs at runtime.
+
+import io
+import base64
+from pathlib import Path
+
+from PIL import Image
+
+ASSET_DIR = Path(__file__).resolve().parent / "maxe_assets"
+OUTPUT = ASSET_DIR / "_assets.py"
+
+# Constant name -> source image
+SOURCES = {
+    "IDLE_URI": "maxe_idle.png",
+    "THINKING_A_URI": "maxe_thinking_a.png",
+    "THINKING_B_URI": "maxe_thinking_b.png",
+    "ESCALATION_URI": "maxe_escalation.png",
+}
+
+HEADER = """\
+# Generated by build_assets.py from the PNGs next to this file. Do not edit;
+# re-run `python build_assets.py` after changing an image.
+"""
+
+def data_uri(path: Path) -> str:
+    # Lossy WebP is ~15x smaller than the source PNGs, and this URI is
+    # inlined into every hero render and chat avatar
+    buf = io.BytesIO()
+    with Image.open(path) as img:
+        img.save(buf, format="WEBP", quality=80, method=6)
+    b64 = base64.b64encode(buf.getvalue()).decode("utf-8")
+    return f"data:image/webp;base64,{b64}"
+
+def main() -> None:
+    lines = [HEADER]
+    for name, filename in SOURCES.items():
+        lines.append(f'{name} = "{data_uri(ASSET_DIR / filename)}"\n')
+    OUTPUT.write_text("\n".join(lines), encoding="utf-8")
+    print(f"Wrote {OUTPUT}")
+
+if __name__ == "__main__":
+    main()
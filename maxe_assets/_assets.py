@@ -0,0 +1,10 @@
+# Generated by build_assets.py from the PNGs next to this file. Do not edit;
+# re-run `python build_assets.py` after changing an image.
+
+IDLE_URI = "data:image/webp;base64,UklGRqRdAABXRUJQVlA4IJhdAADQlAGdASrCAdcBPm0ylUekIqIup3SqmdANiWdudzRZRiGO51L2vf07y2EnttDJ3R385G3ZeO2Mvl9HzMOT/QQI90B7Z34fTl/YPSL6SHmx82b1D/2zfsfSA6aH+5YQP5f7KfS78D/g+Wp2R5m/zb8sf0/8t6ieBP0S/4fUd/Lf7N/wfTthVdtqB/0r+9f93xYNYPID/Xrj4vwf/k9gv+mf6b1bf9bykfYX/0/2/wG/z7+/dc796PZS/d8wXuZ/q9yXWpYVGeUgiqBkzX9605zXarjZ5KzRstzswgEZW4WmKivSzRflhZn13+2Tt1lQC2cX95GanQwFWHvCRgqjUWiGrNw/XC8Uz4KH+aUMeIA87F6fHma0mW9eyGMdbDiiFsABnxqV8wh6/L2Ukl8b+rWQ8Yhvahl0LRroT6HUX0oUswf1JFaXZNjV6J5R9OfLlKh2sXC9HWESQWsgXVUNvzve1R2KWJ+TrJkzZR9YUOeMRYpPl2lux/JbXhXLvaMpslo7ckSznV1nUR1khyb3fv/XQ6DI7r+nsbz2VxlE5ZOLW28hiPYAv2juC/9ICLvyHI2HmODbOYuYIRNIO/p7TQrzJLlm+KLxwmtwzxFLJpS4E78vpc0E6NqweeptygI2Zc/aD4a1QOBPOusy7PhcbC5e88EoVYr5j316vA+Hge+zg6bSyy5NcqtyDjgyRUF1j+QVyECu7m21nUkgi+xMQM+1umi6hZO3bpHX/Dq9l5UY7to7PeukEycoru2Kk3lbdFyW3Iuah4/NUSsxky5IJx9m5GpQHxjx8carxEOacYF+KeYtuwIgph+EaMeOLbl1Qsq1x3ljfnInz7z2bfUNSCk30092/AHWQfc7f2paCAnqtrBbqId37TLsBNg7KPk1FdEMTmrxi43aCgqN68MaNK2KspPPzFenvv8DAvGaNmNrrjat3KuDRFBQmEDFRkjvTFM0RDqHpPzbnSQgKzLTx/Y2cISLvM/kn5o90KuzqgDL+FzqDkH2H1wjr2aBOtm8y1/eHFI15JTi0EjBjEzeAuwyPOVi1vXErYO8IukyyZY81DUmQHygAy9IOn7dGGMQkPGSQE/nzAlJVrLF+qiSo2nFFC6ncG3XWSBi41yJP5MtVzE0ESALtCSh2AENwsggGKF8j7blRHBuc7Mf9c9GVem/ZHR4ftAnLjueCRJvwZEBoOCKToNTWG+FHZ2vtjLNeR/0y2S45IelqhCEZTOPXHjYsbSewGsV1SY1WGG77QAmi+xpaQ2MlZ35XY9jgEgONRBBRZeXJ1TGHkbU27bQ5Iro7S/ax1IN+f1+JEz7jFq/VpfEsdRZulbOhi8HPSw7kAT+Zyt34ekFVUrpy890POKUTYxaLPaUB2QvMjz9oiaa7AftYv62/80cWYxuE7F4ONvJJ32rLI9Dp3w8pugD4pLbsc1Kg0vVqJKt1ToABcHz2WfzDwqLr8etuxKjvx3p1VHvD9octynTDiQ0do/kV50dMegoYx+8Brk/XvyDFsIAkbJsZJF0AyuhIgfp14Ae5rnewOFPEPL/IVNG8YLWShYz+etYqDP5IogNY4j4tItf+3MYNjaReTQmtaSKWGUS1Svmpzl8HGqi49FGAD8YxOfTFtKFKaC9BSa8BAc+Xf/bNVeYVoWqeNNFdw0fQfM6vxsXBY8PyeyEJ5jEmtpMBYdjPV1X/mdtCi/d0naTay85EXwsX6NFGWHClohL2u+t3Rd1jN9RNdXZerPoJvTD3uoxev3ghbOrUwF6dwp1EEF4ZjB1qbpti0WtfUaMx/6PyW+NQ07WEsUd/BYEKZXSnaHFmP/tFg9yt/PJp2gJ51omu1PuoJG/MmlKOvcf/dUdh8mm8qEiX0xsQUAUP0gA/SC+xyBgRyEE493XM5lnWRmNB0NcH0QCQJDOVPl1f3aDaLYMamIeGugnmWDETtoigJIu1GYQpGSJQusUsTtATndE4OdAfPcGXtwgwUO9p3Hey1r2nZsoaOdQ+3R9EegiLQTKThQVaqYmGjtOIz/WC5BQDbtXQi1aqzv3c50fs/1qbZRGuSCVQ/vMVEKtJvbv9sCd9OOuXpxKr47GmAapPy4s0y/aIu8KY9TbWDtbHK5TQ08cX3lMF6QcDOc8Bq7RoLWXbIdoLxTblCXMawMj91h4/D4KcoukQn9E168ggdSqsX55bZNCWRvQQXetApxL+GJQix9KFodTb7ZsUGxIaCPZ3P2VQ9yIXXZS3J+wuLZlpZ0UrZutYfrZ8NKKafTy4RoN9FiSFGgHoy4zU5GtDNpzP6Holg8ctXGt+KY+T6u3hVAKMesknAXcsOgRAM1OXf7jjr59m1l7M+oYK2kOUstm0e0dFa26Wm3wl/evHtueZ+eOVabBquCaZMXEG7Z2nOdfj5lX7iCe1rL61bF9s9WSCqz7QhokO7hu7abcHuWhRRfosXrEJwyfDDzVxAA5M+vJqTKsgV5K8pfls0kcF5AsWpnq3XXW9d7Wmkl7SC5/gAP4VpkOYf2FbBwdlAEIRUrFWzQS9pCvYF0GiODjThiDmX99LppNwooX7wydYhojZ2Bpo8pk9CxoEAxBBCrEEJqjIOiisj8qBvFpkI54egc5bp96XGtTVwTDLoMdQV9zg3aLMMEHj/NbIOVEzdKhRI9zpGUNSc/ejJTkYWYwOUczLee7eLTFcb4VA8KXHlssksQSG9BV3tfrh9+FaA8Xz1xdHi/Bty5dmmS8zXhuC2+pVUt5poUJMVJC+0WhKieqoOLgVikG+nBmvwHWbCITj5O4c945oTJ95LeTidUltdVwiIoSAceyY6ocxjWVKoSvX/QdkWXYq0o+ijdqRPuxrEk7D+sDhtdMmuB15CdW5NIq/11/7hGjsYlHVMKIlGmhe0nrA7SgWBCD15Rh+QQYVNbBmJCvrflb2jv1ISwW9RITOej2ukKqqfRpxc3rC5UFjve1eVBrb45x5hF20lQTqthRkaABv1BHdkzyr7a4e8xJVbbsa3M09hrH0NrYcw9V0Xwkj3wcIMTvO+g/GJsNt1F9vQHUKXvjRd7f5ZI419ZBfwnUR73L+8ymYOOxCmiouPZ58HlgOza4tLQ8XGuMuqNnOMEKkEh/Ir4RtMsHlNE9+jl2kOxdDDV7B90GnzP1qhP8c6UP9uSCoJnGy1B7oNHHWLmDfeIG5X76eLnAfZ6KfFzN5bFkXiNFIp/Cpr1HNvdoUc4lRKyBFGj5JHHduEzD3NkDDKh+Hze4cLBs10vyrQfkPlLeVxboN+V9/2pStNzgVDxbslpJo22V/b4rdMddf+lP2ozfZNBEgk18aXScx6OeCKXsTb2nwoagJPcLM49q/rvJa6TJPQTIhjcLfvKy5i9cajotyA43T/o3wHxgni2WTY69IGe5qMKTDuc+dyx9iXc9HfZxcI8e/Nox8c8spNb5ISl2Vbcjpg9Vdr0gDZWwhU1bP1SL8vHReFmfIczaHZbbF8Ofc0xlitPdoRjlk8tBsbkRyGRdqkTV2bTSw7t7cfPR2t8xd6PVXmB1vqlJSpxwzI+FvGqU5oqWYCvbATHmV2cRdcXrRjOXkzjQXgviy4IPsTDyupYMzo8S/HtvfW0dRDOWmi4k7XlBW/iowB/AOfiesS4D/q5vTTT3LOFuGFbq0oLAUCWuGs7EwnQY45mycFdQKJubR1RKOCt61S4OoRRQukMM5qSgUdWRlGdDT8aiRu0aEoxjiuperaMKm2f6+b/WllbqGm5spDrcuUN0Dwh+nPVIo1+dFZTwzWmaG8jgwVH2tlMU7/0wVqE5owKCeq20GkqG36PEmL+VS5DDIyIKvVwK5QToMAtBpc6rbcMCDqEOmHPO54uZNiJh1WesEO2ZEMC6NgEQvRxsKgqUj+C1SM1QHJH6QLm9nh8yx02H3S1OfRz7g+nRa6jS9sIqXk//UbgsRzwmkMxlwhCP4Xk230MyYWIVhGXF8eFyWSdJJmpXC+0J8Z/Lsy/ReTVyJqJwgby2KFCc3cHVKfgeyKCvK7PFKiiDgcaDL74WoEibVFV2j/Ohgj6hFnYXLSqCMqVTjmgSESSk/3Ha6TKFPjgdwkgs2irxsYsBacHg41cxQCoPZf6A1skXzokmNdAN7UqiuU3aOr6vJ4K+i7WFUQyPcvuLKHi8zYHcE62TSRsw9qNpqVkzXsZTyZS5Zy1Qu+fpjOhlKd4L8c9RV2eIdq8E/x95jEoDxTbEotr8Vg6+MixVBxAFTrcPNSugvYvz5FxTK464HhA3tkxMgsGi6GRyYGy1/CWfhjvyV0l60hkqMABayc0o7TtGneEMl1zSXq/5ZfqlT3hUNQzb2IgSeYxqTjtnUC3xboDgAP78eL7fEQNIZ5B6Ub2YBGtXjThPHh1D79HGviqDeDnX0Vvqzr3S/Nsd3gqgW74rs3pdMxb4Q915/G7MPbOCVmHC6BHtLyYkQqpfHMS1jrv0SXKX6QsDaAUPHs76zPzRXS486ah1+Zo7KN2byX+k/8BA5xwED41zo40rmdUMDoza75pF/mveVh6PUhqJRU0bdAVN1I0qJCtsdPt0a6W4WAQHznpv3alS4y6pbYO33+Q9sHhcBzFpDew4/xtwLpXzAsk2JEBGvKbiaE5KeNnOHdvkfdwFRPpV1dJo1u9MlDFUnZmC0BWuOxrLOUSA1FgodgaHtbd8I05gD2rkQItVM0FdfrDMwUhzUXpKBEF2QXF1z104c4W0Cnp881ZFeClQp26jEu95iy9U6wxnGoMbCMXeQA75Kd3AWKTKYevU8nCmM+pStVQTIvD+BcI2TfXc5ifCJpwh5YOkZRQs+aAnx7TG9AwmVAY6hQDJPWhm0q6RK/8pYmEoo7RERYtySUKRAEJmx60jCZDHD3vxp3ZocqjMaDEGMOybKE9WBJt0Zf3hdJXX64Dw+2AsMwJPzrof1iUmm2sZGo0O9Sqag4bbqKo+Oi3lYYH30zyDGEMI5QvkWM1XHjVs7eKhcJJjsj/uNGuJUYNfxQpqK9dXHiop9qMcQBux16p6qhtZBEUsPXsNEKNtVRIZZvXtfpRrU5mGcE8II76pSXaATFN+f2h/2WQEfvB9wCndlhebyns33Fu49wq/mfiL5cKftSS/Ioo4XZTwZcImylJ2TCebvDBFiN1aWuskyDDCCxbN3eb0/xhI8Pe375NcpNt/Whs8fs+8gD+Vt1d5ZmnYYULwypS8i4J52aQAbiqOCcDymwb+01f4IANlhnMi9nUvAWcPs0KHNLEQ/V8CQ1L32Mi2+Nc8w3siOVOzt2x/X4eHri3UZ+2Ll4MPfKRqouYab9P01oBHDCCit9vU3/6nSd67ZH/el7S9dJZZJSeGRLpce17Xduupno9R3VEBc6qS/dlv/nI6XgbGoCi2Ojad3aBwxXMSBr/qws3W/kZShFVQ5L/0m4kGIw8nYtTpCyLSMn1E9qxYQN3gReSCsz5iFxx0GHHlE6jBz2Hj7DhOVMFImBJPCAdM0a0mn9V2dFu4WD664Jc19LXeTPmTzaUbL6c1Ajco1weuS9oL7rEBxq43/fPpg55ZBHMWEaq5IZnstcqx8EFVJ5nNLGDl5XguEWpVM7wL+uPhfoEZNXlzmKhlBHqx3W3UNHoKYX0bl1vjWDCfB6t/H46dU0srbTbDLZnqGbu7Ua9JgJG4A6GgTXIrilzQbEU3fWXQo2Se3hvuuaQg5dqq7xYjqqQgLsl6gTb+SMvr+76Ho0lxqUvoJZXI0gtgehujiFJNfAAk3g0S06hhC9LyX3femNaQooWOKYH7RSTeb1Ddf3JjjYjVYJ0bxIw++GofW0VWiXwzfLty7vAFh8Ys+TDv0uBCbn6I2tnVuVORuESuY+OteIowm2HpVLgZCsAb1LO2kMGVnsX1mfCrUE92p21GiqKIBN+8bEenKMCGvNSVV+q5yGGtxb1+UQNaBlnct7pOPc1XpA5fQv5JAiBtGxXrvX4Sz2/QAlXsDxf8KT8OJKCbTs88/982ZdvG/tJxu8PBVEQHYW5f+HG76Z3hDhc7dm2fKiDcTumwOyouXkF2cXgcJstoFs7gL4bD8XEoBMf+3nCT7f6IHUVuzZRxBqUmIgJosQ1DOwbWVLJ4hfgA+7A6ckvqgc/jdNmi/VrXSAKdV+HkXJvYHWht/s6g/af+hYSrzn1t37ChDY+l/3C5sNYYj4OvA4zDPnzA/8x8/ChBsM5KNzpvQRgS8mkgfcFGxzZkXgzMALkjaTKeV88GgSZlIoZsOYhvx5jK5jeT7QgBqHQ5iAjLGfdmFiDEshl9FxSNxckZf2NmG1YBaaxg8LrBeTL4KmnklGo+KVbN0coHkFRN4Rdd7RsbwBh9mhCeqqT7lJo7pVfAUH1BnQodG5tnXO8vJaPojlEX7zsd/56m53CjLEp8y5jr1Ydre1kOgRcumlKJTw6qESHowb/SJGHPVzyU895y+02CAYdWmL3SGInJgRY68N+R5S1e4Jhb4BIZ88CLjrazBxKcreZHqXoyj4iFT225FK0DzzTXtte+JtwtJ9KYi2Xp4XGYDcFikm/cV0OJo2mTSaKcuVc0yWB8TxTjXoPecir4E6S89g8Ok+bQOnMvdsiy3m0YNknIMMeV0l+AceheQuD7qXFwv8sz3X2KYsYo13sQZG9BabpLpdswsLH6QNVK4d0WEuimZzQeEJeBpSrG08i6xjrrcux+GAsgspyll3Gd9bnMb3uNXLYBLy6WTsunzlLes5vDs5a6xoukr2GRh3JbPxdw1iu7IsYug1I3R8pMNm5wlgqZrX9Ly1z9ud009FNc3MfQ3jFVdrZ7jo9qEvfPxq98NkFjPokvCPTRJpt27g28NYNQjCgvo5N5IgtZEJUAR/IVeeGwN0JESP5JGw+noIeVp4+uObg6Zwr+KkbU62g7OL/PyxGYVqaW8xk4cXD211Z/1ZU+5YrTYJnAZ+85G02wE/qzF+xfKhnltR6Hr7UbxnM4AoNjBXHEShGlqZ5tSbKfD9Xf2uKubfT5IaVL4kV8Of/HEFjXjPigwP/0vzh91aGs1R8D4ZKRyuh/6uwVU7v+oGKOGdzVr6PZEIBty26bW2lU9suJRFLqfkzHgt04np2EfHU85Wl39yhwHbJMiMUJkZWMum7sHYQuq/xmkxEb+yXm3MlQthtqlQz8YQeO40DKqFBHA+BB2kxP6FKtM/PfBr3Em+VH7qLFYCVUgeAv8iT9cjUOyr1KntTnQsmHIhZAPj9aMRfMqTgSSyV+YrN2w45pL92S4UYnqp+zd9s00p2BjrUvQElwuJp+91rFeIfI29+DPvst7pWLKMOu8QEqm5TcW03rDwxxkDbjkEXp9Yg1Zg6O2DvPm+xpmJxVarxNZpNhNHurPsdRhRmPLP3pw3ewwqvN4QMtquAVrClqOH4qwpWaykmA2sVpaNK8r0PqRn6vhAZfRKcLImfPeHzrIdw303Ot+RvsMALe0AGZ/KHFiB6h/s/cHSEPRrlIEgd57DXUdfSFXX/1F4+JygMgf0AkyWgImHmqvA7mnnqmV5e4Qm7KiVcdtHfDlUC1w8yXoDc/0JUUSuTbdpceupkCx+0Kik/tRpEBM+LCl2zN46Tbib4XkyouxuVQ4hexZNRdAVQllAkzPc3jwgK5OLnL2+oMsJCRHzGeVMuGFstiV9lYTunoZ1kYJd6lDMS/3Pvf4B1HFwCyGVVxdCAJCGM4nODXLOXL8R2ZsnmI5CjAFUZAs+i14B4CiGuycy1aUR3orsdDG1bMMI830xR9KQi78L1Ktl2kF7qCHYIcTabLa+8fRFyU3TKjeuLlmsolilrnRjn/5Exl1TFJXzmVa0TsK+o2WMUHwZM5m55BI8+JFnMVCaxLO9r8/Niilv28+nsfWgmU/7Wa3zbZ+x/VQQ8sKs745xKXZ/+ToR+1KpBbURp7N5rW5rmvFBnl0BAgGR8R23Mb2yPvPQ6AQONZa7RdPjGB+fp0YCd+zkpO+mtxhJN29g6umt597AThETiQy1fnFgRak9Aaqkkvm/F1+OiIbtMzV+elLTInA85TH+3bxmZ77fh5ir/V+kbOrxc0BFKgTV+EwKGv7p6FAu5orlpaGxMTl3yzahFtEReA7wZu8EnqU9zS7KGQ8RLp+33aakQim7jDRzLWhI7VXA/ZF0AXNrXCGNduYMGkbCGVI+WX0Hng5Tv/xCSUaFdKrCmN0+nGoS/M30hJ55JcDF6+dZeN5Dm5b76ieYrhoYxqfGGr6v6rXDM/Gfo2pafhHkSw+/MvEcKjM62A3LiZiWbI2iflA2Uy2mJ7F9HHYmxgrFXLbnX+NEwzbFx71CCc6TfWi1ZfLRGmY5VvIs++Wzmt5Liii6BPcon4vEVk21J6XfxbIgH8qVBG6v829JoAnXchSjgbi1gCe8Igr0mmdOol7OxsEdXm/Xcd8WODV2TAdPPxoFlu6apINa50XU9Fv7NjZeRCbu28HSE6YA1F9qX+6duQDrtTu5DmjztxqFFBvwK/QJ3FOkHSU83SNQBVagFg7PoKKs8dCvSGulgdnxlSt1WM/ZSA11wXwsfyXKqyqRySfyzQpK3Obs70HzvPayr2fUVOuVfln97eiqb3JWR07TRLa745nmYEz5r+4irv0xPlR3SFI+ctaE7PeoWMmv0XbarMvszHCKvdAVB6UbXHc7AMbvP5JrdaEdFBXQFBHk53qyEShFp+yvbiCkjplqvgg91fsIMyivc90YO9EDurEi7UJJss7HLj/GwkHtMaDpXYF3tUY0u1N5hsjJwTyQ3gGLBhiOv3PflOiqLhTxI/VdcSAR73Yh2PCZqkj8K+uII3Emp/bh1cD2HI93QSEk7uKbgxlkcruCXCvTfvnkykvkHnpQ4N8BO9yBBJlaPUG97g/d/6Uin2ukmn5BzjAWkMkG6707laRP+ZpeiYP49S+UPHC85tmSrnhWpJbLEtUE7WiVbdWii58Zgiq8581qfKK/OQ1ihDq1LsWi/GroSU01g9a1/o8mTed+UuYUZowTI3UFh6ngsI4MO4W+UHm7Rp5t5MTN1YBTZSQSn/8RSswIp8cGtL4l0GS2OvENdEN14/KdVeGGIwbbStZ1j8f2ORSO8UrgjhnpRnpJEyqkg8b7NDRu3vxMbYsbjGUlRh5auj7fKrwwOfPco298tkDFCVJtJuJnBZ0ukiPlBD/+GQdgH5jip6rClJPjsg5JTrcdDiBPfjsMx1YG0vjs8Ila9jLQoH3ZpO2iap/OTUsHITV3jiymmHTlhzJj1FyvpXfpr0wJD9Dnepo8mgnRt3ro1DxeSXU3ZHhWhkT0P2YU8xQpZuc5c6A+NklEcN2/WzZn+3PDNwS9MCTIWn6waLMnYv0jSdAASYRw+gMMtcvc8za1ooGpYSzFKVCQ6td2O4ROmSs4EC3NAzpIRG3oafEOZ9bGHiTmmewSnHNG4nKCAMJsVwzLGvdjWhIivxqFRn2nGMmdcSdRjclU/ZEDrz4LFsWXEa7lOfsOLCe/uckj/bexOCok17pOj6w72DLP//YhhHPjVdlIY7Mb5BFzj7aOE9zzSTLWQkLGLjufeypEeApx16qRIjDeMnoY65m1uWK15IPhqmWiVr86RhWToNO6D4CyRrjq2QeRPRM8orvNYdu0OUYz7usoBzq7LRJew7aE3mt6yJT8n2kr3pNQx7T5NlPLG+4Hk6HEUrJpN6Ip6JTailVLyklf8HrVbk2g0nlk7W4NsScG7xh8NVC2R/ZXXU/+bD8ERcc/Gi9HkUun0TzVM2LBKz3lT7E4Ry3AlKanEX/RYx8eYDB4nB/zLFDLa1MhcmZQhJoRDbcHkRo5R8xsAD0XfhdsL36IZDwPNSH/pTwA9cq4AmfKjsCzOCF19ReaCsxDqMr+g6ElE56FHk9yc/m8VH2+PmWmLTjFpZESQqV3bNGXvlRB8XEukmrmZYaJvHtDa5eqhu6jlZFYSeITC67p6TLsZpVVXIAkBGK27es1IPOBwNcXSfrbYbeQoMsYpcH1gQcOc5rP61Ewslt9ipiO6cgW05bEzTcKuefXRhJ8lSniCQ6/7TN88WPJ/zekLQ4WM74LcmizWzszzWbRFYdbWjR/OGD5x1GDxaouGvMpD3vBTYMWXqtmjwcESXCjeH2uyC9Q4dt9AYkUGotdinTpdbTllyzX1/WJVJ6r9XRiU+NLcTddvNHf86iEqnbfBH4cj68UOvTMBrLULmUjp7bwZjjbbTOieiAR9A5LwhGA4xiKPXPenPIgU+CN6f2hoVLhnVawreVjdAipiOWVEmYitv0ldGCrqT4T1NUQR52D2sedEq9ZYILwdJGVUVS3EdwEd3Z1XxWqeFgQUZd3m4FsmIGtANCUXpwRbiaJ+ZyzASTDOcsHuORtJz2LR4pLeHF5t4t+h1EtzQiLVd59JFQyLzS0CA3qFtZY6f2QRZnktEMKPeMufOK3Zhby2GD7M+1KC9cyAGFm3/m6b2qhJxeeSjQbPJ2yKDUIK73FlKCRujp5qBMfS2Tfn1f9GfP68UGzCEvbkaZmigkCK84FKCYXoxVXntszL5wy8hD9Kx3ee4fBk8v2PVapPg9/zaWCQrTajZ6vjF1VdHAH3xOv4+hTdYSziGDMr+bJzl9sH7Nu7PixsuqLvOlWhrGRIV/0H/rBNyVTl9VTWlWKCGbFzPAYoIz4sJy0zeQwlF5o1HVl0rhsU6RlhfnzyoHBQyzMA00hZ1wx92CoDYsrHYtKym4lQm8gpDQVrqT4K9ua7kEwAhMEfh5xFtev3+Q39NSDT4cbfUl+lENstzGRVHoYp8TVrs1xuC8WdGIl1dCqoMQsT+UarmBqjqCP4beIPC8EdSsUFSOkHR8kCEvIQMiDMXtwgXIhRF35W2zBK1iZliolV4fLvjSsyvVzxTAWj1qxMvxJxkfj5GGJ/1A9yXbLtQ1bBxnUPmM4rp6EKg95c2sbNuwKuh7JapD3eYr/eax1GqOCoBw5JWqv3wb1AZMym7oVM/Fmj6cxOKNyljV97r8Eqnecg+SXnZXDPs51QtnL0xXThcYMaLG+BXxKlWqmthtPuq3k0WOD0KWhkcC1P2G9W8E4IdiVuh7pFrcPPUf3dLx2zGci3CvDG57syEUhKX3cXfNxkxCVbIR14NXm5Yz7JeqlImu3pnj/MXLVOQ87fb7SpQTQhC6lwB6FQzPieB/QUtau6N+tQEDABSvY9VJkIwbde3B47v5O2L9bOBJyQ6GAOmUuwQsvwgWisR5/fPRl++qE2pD2XoObMNM3EAhNMC7VrYpwlK1LquT1gS3P/au9JQrnphJHXnNzrgyzyD3qfpYBrcEmxhTOZUFQGrP1U1STPYwA2+u6IZWCG7RVnYQqDPk5BGtC/KxI1L7jog1s9kY9TNcfJyU3sq3M+DheYrRxevdMs+GPKagfdF4uQkJRw+A3/l9QMAwpbpF536nja+ARSDdhullHwGJIwRt/u3QIbngcJL2V/Et0DXi9uPHyBnxOeFcgF5Yf+Y9KAk1lP+hZM8Y60w+k6n9KTlIr/dGDsljXMfiv4jI6Z5y6ar+zCFJtRhP+T1T3IwF+TtcfjUFyrhNrrL6dLeJnlPhltiNoAdhO4gfaEMAvOldbKK8gB1XkcLChH8W0mYIr2hnTuY8jH8Hw65hpMgKd58EOpMRUCoeoKCoVvcCrtnuKQBPbeZjp/qJ4Nf2eStH65RNwc0oINb3xElIUvry+/PU4sTZoLjqO/Ex4NwwN6DgvFV4KtXezdlQ1QFFeJNfk2xZWpFjZOVSRNb1M9xKLCyhPjGOMFVZ9oDRb9W89U+wGhJy21K63dtKO5thuKoa5ye7tQiRR5pwlzH62N4c5J8oqN60MEDMvMHM4zRdaxsVlltAA1BB7aTe25qRmaKN/kmdeOXin/33S4/A7UFPd3gj9gXzZ0Z6EyWHmCkTMr40Xt5z4MEQw3nWMljh138V9y0kaG45tKHedgtwItJHcE5oIjHTgJa90XY6dGIq6lguwXwsdJgWUGKzFdySeQYU4hcmuHY88igwr6TJu82hpwgdknnLWhOydotJKbZzQ16ByiSAujyXs7RMO0oIgjqrWoRWwX32V+FkL+gbEv7Aq3J1D07pG9nTczYbPYDgtUEKNF4v+edXkVKjB0t0aqFHrQyNdFFRJjpGy3uo4URFSp6y/ShvNjWiNfO4isadtikbKbFbxzydoqHJCrx5+tGIFJvJydnG/xJSiN9a5scwKwEWu1xRj+hNeUUkR2SxRaF8ICNALQkdNJHSQ8MOtRUzVZvaKJkOi80FBuK4fwpyXNDUJ0oeSaXcth90YigYPmSxGvfKRMgE07QbBc9VpmkCrM6QDkD0tx9eZTXWlzyLJouZda/3RAVLnBVrCPikCJN25777vkfGUBspBneUi1nMZxb+x6ROyDf6ulJJvvUe6jZj8N/RGI3JDvEF+ht76OI97VoNUV7GUJmhkfmr8GzqrOn//Utda97VnCYEeJNgCZjc8Gth38R6yRJPdOM/p5YxVrv9i9ninbrofN35aVEInBJmRa5Vsyg1h2ePrBoDHkYrlJBidvrzePiWv1HWcCrsBJzspZdT80QDlNFGJ9fUDSJj3qV5WBmFiqmmI21s6cvuh/f6I2JMF2zc88RcVfEcWlQy5kg/pnZA439d9ug+ewCnlbd/9cLW7VBzF8KAnXMehFDppzRHV2lGWer31Cl3aRGL0nKjPd9DrsYf3usMji80bSJfsP4o+CsojA1PiK2H/cSTsK4dBT0GhW2yErzCoAs0kZdSPJJz4X0ANO5tAaTwL04O3Pb9Frmnr0ob2f3DWi78fwKJxXcJFDkzajJK/mKYsTKxfiPhB9TLTXy5i4HvZkWkDmi864iDYOOBYYf/4AHMadqQfKJATRMSKYGooG/at5HdGhagbWGpPns4R9uJLNWCXoV4k+IMbQtIlhtN3HHVePhiCOwhsCcDEb77mvPKfCrAQGW+D8bDG0CwAuIelia9nNNy91jaf+AOat3u6KCzqL6XWTS2RdhAEP0xo24rSmC5iP+m4tU0sR1/CrpHJZ/fULQ8A69V7Hl9UejwRXNCGKovnFAL7dSCXNJGwNHMLZEAC1conCslHFxLNuF2dX3CWmcj+xWOh/blISnNR4UYcsa9ShLwIH52K7t9czkYTPfltgSzLp7tfXtTQAyxU3+mDRZ/2kf0vtvTvda2y3+PIrCKA/zz6fL24CEXCeU+8CKTlKswroEb/AD5pPImNp2OBrzhgBefLKPm8YcByFX7YzGwLQOynxFx0lfC+cZS6nnikruvJNoazf/NfynMfzQh6M6WqF/2OSFa//hBfgesiJabVl/3ydrw4dUZ82YU3AbDdcLWKzbSObvHV//TVvuURAypIcmEn/TjULxDRfSabhCZnLQAKnpjqM6Kf3kEHNXeF3BZHPztmBsdaNAicWoEFCNAtaYbwRMnAazJXAuhszY4Md/98VoLPI93xO+oeMtI3vQBvLoV0FRUgd6cj7R+VxsZp1Q1YU9gYqa7uihIILhyaCUr7fB3xZgXFR4rymsFkUzmPU71RE/++F/eotFxwJ7aHeL4G+M8MstK5VsSW2VekW1LQ2xnfvcS+jiWHZUa9nFJwkJRNlLgQ0jFfYELO5NQMq2RHiulZbDEpo2y+d+UZa97cNqygZaUF2F+UmaSNuxV+ZdFiYHNlT1mHKcwguVAq8d2g1RVVYIA0PTtVzVXtpEuYRM7nQKd8m2dchT2dnlkeLdgrbS8C7jciZp8WkAyiAYnNYr8CeTJElmZxmuXIT6fldPHkhIqzVarmbV2KPRgqtKhsyv9okH0bnSE5whpFOG5+Xtft59z9nsguaRsIrRr+ivM9A5WQQeNPDs2/HMDXznDTpljvBauZPoHbGQX0Bp7SkqvRMuT+pf0xURI/9dHywBVZoW/L1sGQRWDqXuX9Rinjfno8dEz4e5cVr/7St3Qe2bl6eJj8QEsP2YAG6gIrf5bemtxxxDD0OF4ZMFMoLS+0uvkejc4xSXCtuwjS9h4fTlVhR2iopIk6w0Ccrzoo3C3Q2ztfohmeAJb7vBkMdfZXCoSm6F9ROP3FdVO0Uf4fgznmmwC2XUTgCqgWF+gmcio/qbgxQ+ERKmkSnuoc6AzPQwK1OuGCBMaf9fKObmI8Wri7IRRgFWNSn4fqXOOCwlfzfQfeEYA15xA18uTwD4Yk4gQKW8SM03zWT3cZktEFE2E3tY7MDAFswVP6NkUYpBsjCMmQqs2UnlcnB5jvv6MUKZwfOPUo8m/82IZ3PPpsD/HXg4Eo0vcs0PaEub5Fc4VfHOMh1WNFRNXq/KCgp1Oa5QoFpkLa5fexZLzkgejZ71GMUxeOlbpfBC0VR7yIbaJF6yyz5e9vKqNEviaqCD2nfmODGze9/3gB9O8TaODcuRRFkYG6tDxSUT4mhOJzU6d4jzTuY1K5ahbZRP3bBWw4afyDDTkNteuQ9ZicqL7611Qjy8maw20eWL8OuVP4lcKX82EXnP+uUGU2qiWC28mDxOrxlTu6OeStv0SMK7KvdrID+f9c48Re7pEfE2QgEOL36KyGXRzOprmjV6ZLHXDR+RMFBk5IPBR7hqgzYki85LNS9/pGT0YERd9vPHUYX26EcBVPcCQlniThzspREg1kCgHYs9/EBaq6ZV+UsbyQ1cvKMOPkzbI1ykCCPlNPm4xw2fEWg9rMO0Y0Fo9ndZUIrs2HXWzEmoSoLW2sqiS+rxbRDTysO+SY9+BaQU8I9ViWVdkJ55lrp/RV5bgosY6poXBPnwdXd/wMic5vmMc1K/ymimWdUi37H8d6nzh4amZE4gUL9uFW5f2oaRwsS2gFjit6RezqpkAhL+bO/+U5tB763T4MWIPHrmcG5/MyaVFUKbeXycZiopkc3K2pJAfs/dAM3ESYMFUSLzRJ5eqLv0BARQariVEp3I0e3377YalHT83u0YI3oMU11l/+GvQp3sB8fUyBmDR9U3xW0XWldLv6Ws0UErXb7cDPUUzsxJ8Gt2hOT3UPczg+AJ3nR1MHyue8pbN3i7noRjRg7raoef9LQx/875q4DMbCMXf8CoiQ/hsAOBodzsyiNKkMzDtj9Vq2rqVxnmQu9miAzvJZytaEikl41RrkZR6EEkdlLFV10AYuhqUsitxkKArz8Zmo6dbCIJnxa5+6bfY6c/1uKtP0bYFrO8uD9ZIzeNK+P9OD/rsfiAJbUcydpiX1nruYqP33B8/XgBRgqa43EpTXfsp5v4whOohxQ6DFByPemxm3deq+HErMNYvwwZHLfZjHkPx8exitVF3NXtQtUywSnF35YJKmBTlJwaZlJz5a/+hAC3dCThs8r1e6PzpQ98z6cwNcKSeqnkifw9caIkK2gi5Hlg8JNOxO553Nicmhe3QvhZq4UIkEClLXxuyiDpkHTU708SLMQKUhgVLGw5RxuLJ7CmqthyM6vjD9sEmPkl2UCpyMJbVV4pV0gLjjWxny08bLsaTweiNsFqvShCdgiWSeTpKUGl51ze6kYls/ZShew7ua87urIUO+JpF+mgF0lUaUIlKEPZ2ntbSleyqDvoQ+zWvnynfjlEUKKGaobs2+0CGfWrao8ia8lmNov/UztyLpoDw5jQCl/825d7r0pTcF1K8bQbYhwOsuE5bCmYmPS71355E/0Ge9tyIF0xmwQ15fjVqdQRpobG3uf3wlKjZmOV/n77jHpWqWAFGYdINDsTm6Uw8WrC1bAUEzpiCwVbbblurWkGJwaXZCpdaBPdkxYp346LuNoB+1uqVSRzgq68rpHCeOlxdAEKz5HQVOfa/5MEZVuMu5Zt7JeTDX2YmSP4x62rJxNM/NvlONGXoHcaeyQ933yixj6JsLbkmW/DQHNiDZmXzFsmkyhU+a3SOwPh2yX2BLgPfxVduAmNmY2hKeFZ7/OiWVdvX16mFgda+5ex9fctvEk98gZgLIHT94V86Ci6RqyT7/ClOTukvecmEVJfS6P//IUzch21ZLOeUXXdJwkK5flEW3iktrONFgT/YbbVHarn1kAB4U4/Joxn1RslAlT/scz3x65oVh7ubew8x1zPGSb8VAonU9NmENxlV0/A9eZmyXXa3lx8NUvGFc7lpgz+OpYxC/Nax/iaRkpgnqWO6PaI1m3RJZCRdtKRsLVBXEqaWkvwU9iMLs8LZZUaqimB8yJMKxwPLNNESq836a1GkRX82ETTd//MPwR0qnYvlOu+Cro+LajMKsAFcWGGcwyel5yhd+9/jHdZ3r3yGprUpnBib+yhcsT/GeIqhGOA7Tt9NVfN8Yc2/Oo9WOi4qcsMRaXfdYidkHeBX9Kp4SCYwrbwwkAukvQqKXvpkVNqIcq6PKCZA8l0TtiaJN5NS5asTvq6MMUg7w5cXPOqhjsJOhGdw+31hraGcllwzZi3mcSz3gQQalV6ewMVCe4Sp+/QAaBe45MjF13+ediRen1Kyd1rjuoWXrIIjnIcM2QDbPhW+idP3xN8EsHj6PGmn9TXIxb+gQYwnA6I1R66+zFgGdJqp6TuiQvQjgVXjSLRXD19bBxaCDa/i8KDE5NE+klX7DTZFXkQ7KhcPVsDDpJIj6XjlUEBHvTQrfD7BKTb0KUlU0VE8lKEen3pbELJbq3Ht0qMrXoVgYAa/eF9T0Sd32tX8d6weTF1zUuy4S0bnUf3MR4nfkLa07Z/qE3UaaxLqGhASoMqjWyEq0WdLOGALMJeHD7uNvHRIvGk6JeNonqC65LVtr6iwtAEi/HkrDTlF7AghFpMRAWhkRpgo/+R07RkBBHNArRMM/Cf4isGT3NYeNuhKeHT9ajeGh1pI4bnoDFC8N0f2UGS/Jl5q3bCeCIdbXkq9x6BwYHEWT6v2LSbmOSIcvcgovr17mqqRyNtVf8tghhF6n2EHU12Xo980u5h4vgdgPRy8iXFGiXYeEAGMuiFtZwv+0hakC/Jzj2C5sQC9mTwKSydmmGe328EQ/LaNpAw3sucUjmQc8ljhCiMbYW/uzpNeblapvjZ7mRG1oNrtXRV/kDFRSwBW7/8lS/+J1fwkwYjTP+3evDB6V7Tkam4366FhIdh6OqgmhF5TNA2vNaeFDyRGVuqfzi5CnCOM1keW0NHhZZoIeYGlw3KFkTstAdcV/PdffmGWNkBvQk5AaTenFhZoAkBcxx2mC1O27+pjQGaK6+efoP/fOeYiyVKazymfq/Iv81K4tG4v7/JL55vigNE8bSttSrhsr9ZYdxUJ8gmuZDJA4IQEdWQZQmtuvcVbXM2BYSb0u2/OGk5nCJhDE+Io/KrbyvwCKocTKFonDLxHSglYY7oEHYdMx9T56VsBpqh0f9ZximFhb9aMKnY16OuJ2N8xIKr0cpIgx7V4PUPpLPhxzYmTnvsODoGMkTOvKLvofGKS6cRiBGth/mWEmGiVcJpJIT25MS1D2ClMWyRXiRBa+qfxwiH5mYAswLCOuUb5d+AO+y9Y7A3RcUXqJ5agfJxABp12CwNc4wzTEI6r+RQMFqjNrIZstalnDmO+lXdG3ik9RxmZI6LfEtG5lgbjS5W9MB370k1c20QVBDpCubd0fx+azeALhLM2WSGC2CJ4Jxk4X5/NC1ih0+jSgCQzhRabIIVRz6k1nx7jGYDZHXJAn0uDKHtcRuez9jnsDJqYcF6oUAj7tn2JKS1/4SEVYT8jPc0s2JIHXx8rMgvKO/FcGp0/yvt9RHY+o5W027ylkGTH7d687ebay1Zs6iIibGfoajmUS1TPDcuoFiaUOftvzilRIKN6CKM3bPyeboWTczmUa6KEWHv429VRaxc95ii0Gy6XRsmrNVbUSMRi45IJNiiI2UTzA5BNsdH44eWITkrmDhNGw2ZWqTpkRPuFR9pKNpkdwpgcdawuvQWhSNE72VchVYY28Y4i6F1fpI9qMuaz8PJtBbMmkn8veinC38LeWlo5UOsQZz127mLuoxRXxSk+p1O0EQWWC2TbxbdH66Y2ZuBPZW7Q21agedNk+TmfD+Mg9y3J/wBjT9Zns3Ijbv21CjgSB/kUKEvSdJMya9GqCB3NdBSJPtaNlsXH2iyLO/+hIT5YqcB9Xm37tzLCo66LbiyeUh+kHYWcG5M6j742ZVy4M3neWmwNQ2YyrFun6qwmIs/PijY0SAPX7B/u2yanpy24dhwKIbjQbMmxRtE1tI0NRzMamK0SdIU/+DdpyInWmmk5AoqNSiJQRErLPoWZU0NVqrH+rdXVRX9cm7Y6XlZjKneGbx1gTTUKdAY3OGxKEFhlesEzikvNd2r2j+rSJrZiqnobCRt+NgqAqwfCld3ap2z6VavLXCUwesXMj+/xJqPjyY7q0MhlmCWBcweGkSe09iCcqdsZKrh4x+peFeheAfE7UiJuFShwcCEhXo4mvsmHgapmGi/1X/8DXSp7u1k0flhcNcJXufGhuHjIrkeUSifvRBcr7WfhWUlXD0sPZvI4QWqnFVoMkCoy//vY6vDjB6yabpKtH1cdjYgKhvVOCRO5xS3J/Hco4FCeaUFCcrJpN3dZqJZC46EI1Gu9SESekmuyrMnRnJKmKqlFM/2O8Nd44FJw88k4JwQOGlbr0BOgzASoxNm/AKd4iYoxfbZPEN4JXJlrgVPpJA5DXduuQvO3oNLRemZMXe1TVufZRV3MeJVVuBigr3qqt0m4Sw/Plmy1xMCd9I7FaztULvOBIj+usCHhX58o5sCN+SRTlV4FyJ2YS6+kyaZPOhEWGM+5nECzp5EOsflPDgONZyexxIejN6QWMy9jhafKqPfJ1TFQFa11COduy0C0c0Mbf3HwIkvo8LgAsYZHyXvQnscqVPxP1mAGrqHZQwohzBYxOf0TOaWiUjyi8W3il5YxvMoDWRv+DsgLBpGNmJ2a5Pp+0CEILZa7OBjjPytPM+Ft/6BYnv8E5k0nKLj3yvOg2+IMEpcD4HTKFEpXQpfRHA9GF2hI3uwcn1bEIp3QX44/CC3Bt9tq+QC74bYToi3jEe4Ji8YOG+epjtgAa7INi95x5RFJImbjAflQvUJ4cFShz3ly/gVHqkXBHVHApwATx34o6gmsOg9pRWijCICvTnbYeSjQbzIYELdwATxj6kJ3pkbQt3EJ+UlKx2t+ppftQ7CN9mgu0uaepFFk/6M1viM94tXrPQi2HD9E5/qWpt5Nwrr3FLCvIRGqZlj3mEqJcoiT7MYWxQg1W/gKoFb01MOs9N3rrjYsY/x6hKPsPar0HUZ3OjDCSm180CJpoW6U/3b4fqmINw2GknGmo7w6qn8c+WNy7wz1vT2bJvGfTta957JLT7692DDqMh1HQxkXF2MtRxsIVGgkgNzI6V3qX97UCRQ56m/ogI1ogG3EJmORy6Bx/lg8UvRvbJvUm/YbjqURQ02Byr3wqKhHINartG5pCtOR6aeaYQzPB00L3bYUpqsU8nu2gfH+vLpAGnrYR1ZOaHTl+KBL+t4hZI5FiypGXbe4JKOJ+mWRXfTkFHCBEfgvP0eex6vJfe1e7EYwrQjNp5/TZgDTIV6bxU40lMPrxkU77R2ENAgB97Pvn9EhzPMfN0q4po56PSq5GAFO+8HMhYNaBYmbRqC/p+yyEpnJPaJKMyXIQ4lcnFyb2MjTFDMeBSs71hY5h1JCO7/efh2XQ65Ch7OnZkGw4blNFS7MdHtLHKFaZ5GbIm9IuAnYQTQnBUIGnZjSpUubqoCIJK0NMWW1F/Dey/wFPNjTX9PQyrEPS0n5/iq74LbFykRjLcWXDVuTCZTpTs38lVowqVuiS/PbecyEPJDzkubcefsZjxodMjuuNbQ736s+BUWB46sQ6b4uqquV8G1dG9idXg6Jgl00qHkQNmyG9Pug5RC5kWm4/kGBXjqeYBZ7p2Q9xEpwCmvf06sH8msS0KmMwov9kt8Esu2/HWiRlTYTpvvYZjrmp1s0zuakeL2N+tN2WZZJ/8Y12Rij6e1YsVGNU/DqY1jkEBpG18F/aHg4RhVXNdJN5EoCyaXTXgT8s4GlHi4ms7opC8Gu/OSokTUPMKZB0ofoEbdjnKneXSMEYC7P54YDv/a6Ff/cMjvIcXVlyVP28mQ9Uj+Oej6M2trfacDow+kppxRZPSyr34szUHARuylakTEA0Z1l2q5VSdknWY923pt3ES+CG4nMVtEbpRxV9xPttZLuh1NMwzhq6CCO6OlZWrEr/d1JHQm00L/+pDOR530QJQmmuuHT0YOy2nlEgbceXcLP9o/m6icjcoqZLxPjN/vk9xjjdrIunODUP/L0lMB2mXbDhOYPYGm5d+oUmXmOnUdIDxceDTCFHbHcQIYfMPVIXbqhwp9CLG616jldBJG8XyZzftmooU8gnSom8VzGJc6+DiuvQ62UkXSmdTFLvhw3fL+/+zqWCfh3apOWZDDHRzaK/vf+mM8OIMJ7otMXpqjrOb7ZkrphPio0kvO6Qm8cnmNdR/H36o82v7tuGoQCg/qmFSDPkMBzeUahwAfo4GA3mkgDb+dwSQM5mz8TSSqxoGL1bUXir1xI9KxlDfdgWjcg1eBaSryuKDGlOnvfWKkyV0mcnxn/jUuBsOaQ/+NskLitkT0eHp6QB008LfWZcUY/nYuOO42jWxPEIrgJ85UntC1fOoScNV34dd1W/onMaSQsPucuhV4hbnlu0R+Wk3mO5ta0tIa65NG534TsEJK5gi5Z+88IlOu1pZRDeC9Eo5jJVzloiIk0cqHCUnhQtjNelvrrifYyi3LMpvMyEg0gGSg62E+SFJdj7Vw35F78ol/QgKQhXKaoSya37jSl2awIGRsbqfECsRYfTgEvR2Y4f7wNCZOJHrTV4cQtPvz90Lfa9sV3q5HlFjmG/XWHBOLtMRJ3VenHzFav0n4sxAt2Txa4RZpfuKw7Q/9Z0nkXuJOA94MNTlOGkL0hKzpnFBehl/lNayy+GcUZXykR3/1bYOxVP2yRpaHIdzqjyN4GTOfhpic5DXHMVtcnUaVYPh34UCP7Zg1D26BHwZGltuR7EJiqvAUOI03BahgIuuQ0g6q52IJiz8SGrB55xGwoMHeTz7WqXgOOy0qYjr0BE+2uukZQ1zIj9Q60XuM14hpNkN8BqlKA8RlNm8JMi0+6OaGh+IYXR+XJOro7WOtz0Z1W4eUE3WZbizTDiLCxiqOsJDgXi4SnJtckXk1DUN5DDSrK0VF4BdMrEpsIs1cObqhrbBU5cqhzfx3GPR3jPTwsmtzXrPVPKIbtOyNMBF/IUq1PD6n3OvMlxcCMfU+8xzcWiWJX4Vov6dTipXIcZwwjDfJ2c1drs1X6BUfN4N9biDvmE90oBOzyV8XafF8LBgzBXGMfrohsnfV0yalU/dGRqjfiRu7QSEPExiE/ElJhPcRnmvb+PyiPxjJfS3HgS4obYriTmvJXt9vRr5H0dCqyJUf0n9S3KmpBMGeWIjnZ6xQz0VzH25x8y0tPgNBFPKSsHeC7sTRdJ17UrotjXajgtIjD+PiCPRA568mFeI768FkHwmb7UpryGfPqTf5pC5fBxCedblJ+V8F+xqW0/+mfeevE8zjeyhmOTI7MbHTCbk1GZJ6p5j4I1+dPxuZ/8tDspw1gAG2+uwTG7tRRK6sOHGsImgQ2hYyHxPNE6tt0ZPHyOCxhwYBzcrxC4bi3ofyfwGWRP4/4Zm7Goeto0tP5z896uauP21Vqebiy9DzhyxHOSOixm5DGCV3Gymb2GZqZUfwTF9zDf0ShF5lTEDqonSDpa4S5g0qDo+B6+92tvf7cPBPQf+wNPcP0ZpeQa6tfagbafi2n1oAvphUo3wD5IchWIPaD4vCm7HPqf17CPZfyO0bhXt0WurBhM3n+6cOfR+jSxzs5GPSkyihEcHObDh9NOYjuORUwLzUPxRR3a08EdclVl2Iz+VefzWy83HB6b5lQo9Ceg0NOdvSaPXuzA993eHk6l8RulMioLtHzbVTLURVC378hbxa5/VRajyCjnR0yLiqckkW9hkgUe04klrPDeqWxd31fxO5nw98Xeq2OMNII1Qs9DmCKEjUsCPMXJZtQ0kbxL3Yww4s1zUOUBv6QQN/Elq/6JisLEP+LB0X0PkLNcgyYWhlo6eYvp9mzdxsC7AnGU69Z9NET1alSUQc8m1DErNRNmq2+dIeRL3ityt+psPBgvtDQJIZVJTrxUgaIlYD4U+bwEiFNK7paWrK8gXAuKW8GqA/q9lvqnDeAFuvtAtUtqm6dN8KXb2qKrWCMWlEwF4EpP3xqrpe8FJdDjccPhkC3naEzfysp5YpyCkfoOdpebiqWOvy4m4ZYcNyxBLCWZB/T8vzeT3jsc6pOSwWoF2EUa4rQukOt3zUhU/SxXUpVZhIAErPrJlO7E6JlZPsCvr95xCAn4X8Zty5eFeLkjsDTG1Z/4hxTnifvtfJCDd6INP82L5vuMnG3kFTdc/ZuXYkb45ui4SlyhLDnpwPajBgyhd6j+VCotySjkIFLO6xWDM1ED/uzd3TCGLs78qvRrfIW42WRxdSj8bfwj7aHn85y8xC+rnLPvtEPtiRFPy9Sua09CAcWodhxRPXTi8kJf0HAY63GMOdw8bWnxYpMbInAWGQf8LIWlWQccbbSrml2fYXLSoOTJ6iPflzA08PNDOuZ/SQvOz1WnXRjdzILeInDqXmsE/x0uZTt21SDcEfTFeut2ndMlZVdibHe9w8ZAdFEijJ+NXy0sy2xWIg8FIj5Ze6KJSNnsdDLMsPGOgCMcGmgSXf0LGCmriBO16w2obWoTvwnEICjGT9MYZMs8mLU30h43A4AZsLuahH4fNVNAXgtGGvQ16ZzCm7LGzFiq2DP+qH2L4nGbeinmfiaRkeskvZPfPzXY2asH0mK9Whwyr0JCcmzkmkWzltG46uExt/I9QnL5AhQaZ3RMm3UayvD/YYuJlYAPnTRdvNqpp1aJ61Tiq9PNqq5/Ur6bH3nMcdt4Q0djRZMpklDZNdrBoTBPdkqiRc3C/8UnR/6r+6H/0/aTlwEDCjpOn0ScLRk3bw2ZET282z2EQUAEcASdxGV4zcLDsrAIEt+oIu4Xh11mSwa1tZ93m3dsxtGMJiu8+APWss9hY/QyZR7j83XxtzeJS4o2zy2EtgSNDERw/mWpTBR3Ftepqi8sFWDFvL3TNPFjyjjbQdsKGH5OHLEEG1HzqT9px1MQruiVH30aBG4eOPf9x7vL8+CZh4VEbrAeanv3JHmDtOwNSpi48kfTJkaAdoBV0LE8CkfyEwS2R6P3fKDtONMHgkR5a8+U16uiuu3GpHRIEUWYmZFUzGtTpoq8KzUZ6L6J4E9Wn25u5kH/DRvU/NEUCNP+suI6ZC+Exf7h4WYXjsB3kwXctn03wF1f+Cz82mTIGt0EoTuwAu9OSykRRQ5NaVr8myS8KrLJuZib/thDYJG0rebLWbWCjUzEYvokRwqA/UjzTvudJ6bjbLYqKYKJue4ExFR4m9Vxdst/Vxa+EimJqpstRJbKAN3xCA491Tu8NpJ9p2gPp7gfWrmyPPhPc0OYiOHHJNyjUvs1z5MFFzA5ZgSRXXzuD6c/hUxDwO7coSwo7sQ+3XifsRrgaQpe+y9r0hPDXyA0RgOOtwqvaHqJ2iBFPxyY1kF7dGjHJl2JuohXlUkLCsTTUVjBb02zSVtwfHyPcLUrF/teeyEFR1u/Q6k6eMlF2/IEkY8AEXsg5Ery+wzsJvz/lO9zemDYdaMmW6hIPjdAWGOZbiQCXlVdGODAYl1NKWFd8Z7DhRrrUL/vP1mMSIwvxkJLgCQiwBr98xD4vKDJMdgesO/tH0WuAAuwG+w6cHgNm0ppzB9SRlRN2lXKjnt9TwiPKQl+pDuzNwAW8SKJSacJFK+muMsQIGkvd5psGCDLtgJBuhx6dHlhNZ+32QxCgRLVRhvs/AB/9VsGT1KS5e2fWgw+SFdu3YRY6+dfVndhVWtqBvDd6RufZI9uKVvda5djyWerhUawJ5ne1FxpTDPhdMwWrRiSOf+1i3iWwwRDC4BgxIE7p4fMvwZv6vRFCCdwr8tpydUNIj3bzVSIVfI+jpHPlsFU9M/S5Kwc69UZ8tq+SKtKWpQhZw9aaS6dGAZBC52qrgWwZ2og2E9Bzn9PJwDrxyAYON48h9zKVOsyi7Cgy38e2SNvPgNKDaQkUqGby/aBO20BA2jiRggbC5lgX4qnt+asrsxx8Ex1UWJhUJMnjSLDEDsdX+Ev30pdNx6pkx2bHU9G+gt5z6svQQ64TWOL/dZHSh6Rj2cqClVyX9OuJJztY5eF/HdL8RPIt5hY3eZIEPSc5r8uPFnKlYbzPVYRAB2rZ562Rc9FG+aKMfZ2fh/CFGJ3p+CS8f3FB5atQu2FhGGgn1Ad6jIL8rgmhGeJzNMbj6A6m0aJISSqOhFal7Wiw1tn73r9/hmMva1onhX1O+P1EoGFTZUZfDFVA7WLDdXkNc9SFYc6HjEsXYyXvXx7WPJNqebrzVcROK8APZIY4MrG66l0juSRDWkLJCFKlvrp+ZZq8/SiS9bVuQ4+lhZhPZ6/0PE8of++5CuJCPJTWwZ9bCEn3Mz3xSkeFQfZE9HGBvJSFYV/BL+v69DHJxoU/My234kN/6jiwdPgNJA6hGD6LVsqLGf+NXffCE6WFGdX7EEjEZa2NhxEGZo04eXQTHKeW9crMx70OEByWQpskv5bly0exz1WMjKFEUTBnjMZvZTQAglN9n7+4yQTx29i+Rk4x1MxakT8gfaxGU6Prhxu7NZSlwnKK1aGB5tEBkHOQU+t12X23eYflssjKfPRrAb12s/6Wg1Rjba/b/p7/m0+kPT1U0ZnlP3TKv17FjQ3cnLOymSlVy/mWjfqhSFHYFKVL6hajmAIf4iYGrnKxXAiK7dqJyTUsRGY/qqTlaaXWkb+W2peSuohB8qa+K4PVTvN7V5j75PefVW0ZjDEZUkjUAI3cP6c3PPuF3fqQpOzkcCfq2QKKu4REJU0MbDgUQE67OIIg/2WrEisPP4UQB/H9ISpB2IOjameAzUsx6Iirj5j8lSZQ/gR0WWt/jKhlcz82BJ1NArKMFSRRY4EOgz3hDkB1shdj8EMIPFUvWEz/q88VP6wbCiU5y79N9jqgaTSFrB/1pjB0jSi/Joj+IOyygxS7y/8In3em7RqO7moPEGc/YsGthDufaazunUHdUSkRTQN9ScZ3hqp6/YxUj/YAVNFYX7xMKdVSRh6LP3bqYbBcWkpKHqJXInZdtRxHQ+MrycNZ6JpOT002qzLxVHQvX3IvVmhzjP1rA2T63xhxfU8lbN+YHJmWhVk2lKRGUyZzyfiJ5RlskFZc3H6+EKL3gdnBGXO+HDkry0q0+RpFgrqwtAsQ6tR2YMNEYlau0EZWWWcZg9/JjnYiblR1BNmlHSijCjFyG1Svi4n7sfhuqsn4UzI1pI35uJHmJqHI85DSNJT63NQCT7KAKz1hp+bX1KxavD09PAX/UISuNGcCzvOy+GicE5l/WWIVppo6bisF4XxAWuczipb+LXsaI4w9U1L15RxYrm1w9RRPh+4DWkd8rK+Vvmsz16RgQROp0rlDCysfp6tyTfB9dbqVZi5IwfE6yd0lK3GKvUUkPA57L1roQ0cU64wGavh/S8/nK0xj3iXe7/CzB64HQ9hPTaPHltKunzdiDMLXN8NrEgOqDX5LKSA7lf2uGmLOn7TR9dlPL+yGmUVSe78CHIcGF2kjApKNN6WkhPI++bb4UHdhfq3p3I/m3UCrKtbXQDru2Q/LL4pWIwfbt+JqSfwP2XZQmtdOqWOJNzT3v45Sj4XA1lBJyc8AeitbkJjWW/mgpnSbbAlisW1wBjqj4oeuZoF2vfD7qCmXVtv9eTFZHJ4k0Ou/UwA3jx3V/u6tJP3fuKSv+VEEQ5W6USjcYaxY/mNw4RhYNvHWVDmYOaeeIjJHI4cGYyWvXuBObJxO8qh8a8/RLXJ18iadxRDM+jSnkL9C453VCl/o3rQ0Xo5cGnL2g+AtnYmzD/o4ZZv5DAylqfjvCjIQ/F/WmCp1DazgwfTBZd5ThUSPp5QfmMUclzQyJO2xfUFyuY7cKfC3+JuKUsD4xWb4O7bfPqdgeltHFR9VS/tCXngEk+v9cFSNXw9lCV95yYhBoCH8S/bLHZB2AqBYZwvCzeIeA9PzAZMR+zEkPHRrfneLWRWUK+5VTXcnlv8pPd8PW8upkKz5QGdy13J/PLsdbJz6LCWisW5K+eSqi+5HxvyUuY6EkcLR6IJJhRRLreWy23rY3Wi8Szavp2ij14bGVseB4y5bxG6cw+wwABoJg53GIv7vP1uTek3WmJK8qvZPjfBoeS6/63WkeU3btdwUz/h7e3RhUiIqUqB3r1wuiRE/LJrry+QXqQkNoxo1vfMmyiGrEW2Y1osYOuXYwvnCwLRQW6W0XYr6KxT27Ib/aAtBf/H4UtdSskFMQgWz1idZejv/JCQMKlPzqFAfKBKfSxLayNATA1OQjrvw7/aHZZCZycNeqM5LJzuTJCXCHdOT8AKtXwkRoFOEiw+KH4KgPxd15DWiuBQSrmg2yt7MHxltJ+B5SUMdPzosv5KmCpcHhWkIPIkJogR3aPKLACGR5by4/okg5rIi1jZiQWlPi4s9rofuGPvui6YqHTVxt4kZwhmzWBpiM7G/54iiznWoJSqzFoTurrykX2jLYfyZXKAXS2dYfjn8syhyDGwhIxMe5S3o2ucrqpxSM1M0d2fo8D/L7QP3CsaJPKRqBzdVQLw2l7/C/q0wR/0l+c6cPN1Nun9FzqAWTCychcFxvE9x4IfrQkbX7eaXQNMKOtliKosZe01EsBi9OaKb4f5IMIvQpS5BKDXabPpjNKICyReLEuHXJzJc2ATnjm3PUrdJ6tpOiCYoeoT6ZNz5963WnUyaz9UiuxVm68m8s7FgvBWDICrXj4D45LQ3ak55JeE9Ghlwu5VZf81/BkSb3mbCvaYh2+7dFb1+ZkazI9jAKdPIgx9g6nvU340/uosPD7dF2ZxMlxf2siBcTAOeufsGBru5v1LiCjzD/6lsDG/H/dBIZXC4tpFYPfUu7UoZqbZ/vB4UC6Hk/nwC7iJexAMbrIYsB7riVD+tHYF1Uaj72Awf8Xq6yaylVvwSp6H3bUCNTCOToD/9U4U5e24xulILuzXl3Qo5uG6Nh+VFZX0Otv4cNEj5PEDkf1XxXou5lzT3wK6V3p56nduk+iHW73pBWIzBXujkWqWGtIOSjo84+vnBj9ahk4PLOnYEIo1LIx+42MNzScA1+Ryke+HNDTWpopCRtQ9RurmdQWKVPk6rtTbRRtWD6uruj6BQdVshPOhTyhvjzopwF93dvxqWjKQraxOhXzoZn+1ezqiAzrRoicNZfWReENxDHJHbTu9wZLMi2kO+LwMFORGwHslnJrghH0iG/8n8FN1YMRYER3eEL35rRqtO0KRmj7YDuxF39kQf37b5at8BYz9IHmyZhW6DTKI7l0arckfXz3X9NLUKq4qfEj2xonyqZcy9uezvubXNcp5IxCP2+tXaQxlnpWI2uVVq5yy4FLOi47htKiWUSPlz1OFeZEklXUwDmZz+teIHwyhUYz8u8FOeW1mCbuvWUwtNdDVftNeK4DQp994a1q7NJ8vHF5Zk7IrnyWl91vHKEO3juBoL5TuSO1LCuIjvZpH9zLiMm8OtNdm4h5VD0WE3pIy/rpLqfBO/A8PFItlNBBdzakHK6eJ5GVQeiY9olp7HbrwgZADyhd/5GqV5UtgEqeZwBgCjB5b9S37iXkUuo5OHwZOz6DNDPCQMQVU9alNRnJxUbbk0L4y6w/4gofa83ePlE/lo7gb8ydrUqHNmUYEWKjLOJrsZ5K3pDFoaW+5DIjbOr7zLHGsidWnYJBqcX4+1mK+xBidcDSdysnIsTr6pPdJ5AXbAOqU/gF4AburizyFDnEkdMKBvUp9yH7smfgD2rIIknX2ABwsxi+/0L8wZwL1C4XMFBgeZf1qaR4rp9hzOrXDrJBEjhVQdIKAJinvZTjdJhWkOIRtY/bElP7Iq0HlPpN+DN0Ra40q95uIiCtoRhvqWC6rZi1VqjMSvnr8+KUoU4CCtfSbnOw2GLXxKKIdooI3HV3vYMUyDreljO4+PXpZdusqhMfkEXczShIZ0uLcWBc44O0QVf7ZaKkNOm7/EWyIyRxgHtGV3udJ8rrWhAE+t8H+IPiUqpyDI+fHftfmv81HKB+NOkeQBx+W69lJQbKG2p9cnXu+zlr90LwxqI0IADQ7ozqmezd4FtPM+R2Wyqp1pMGL6Hb6Fn2BYaIamYrc8T8nCUJ+qLo+Qm9J283kGzkEgnou/pqinIaGTpJRexOw04b/jnk4cD1Aj87khpu7kyAS2U6vKXqyUVkRd40AVRdAtktJSLYy8FrU6X2eJuGLlKv89K+AapXLNOfReRQnEePW35RGSfGGDR0XlzsHWb/IHtNP/3TXhxtITYKctkiVdisBe/Mx78gxsobW5fnmnZX7BcsFvk5GSrcEnvCzhugkDuOXxqYcsvxRfbuUiddp8gHmRKhslwt8S7zgvIl+9Gtfy8ZHt6ncFusT8ZrYPC0ylBjgzR7ICPaK82DkUtKn2/aChHrnDACW/DxJOFJT+O+NEopGrO7ACdpViWHbGqLxKwvba+ib/ZfktZxZO5bf4gUKjW5K7YYUF0Qb49nLP6AwYirggFgzcY+l8j4FxOvFR3b0Vcux/D8zSqJmwcPOer9/XRk/PP5TFujXu6hShsji3VrUcX1L/cgiuDVw1ObD77zvhbQvzZDsQq9fCR25Bv5Pb5k3T/DhH86I+oTmOd5pHP7w56n4/MeEFhQXVSZnikFQGVbBxxC9OKR3Fn5HVos6YH5WFk8ba1B+QO/SbWcYhWFtlbA3MTI4jrD/WuIN2dcoOpJiJ5vfrwAyyQY3dHWKhQ9ea9K1fA+qVCVvx7EAB6VF2uDcTCKCK9GqL/fW006PUjBMiODnHY8AP4XF+B+YGF+eXLr4MuGtuXNTEiDrINmwzCqcavorVzP6jdsvx8Vj/HcBLdrbz77hmP3neAK2AakT0tkekEJrb8hNWmd+h8BkA5VQ10NcoSRQq9L/bmnPF7t945gCGr3Uz0/X7kt3vvQbp1HGszIjN8EQjih7aNPSqvv+OsOVfZszdewDnD37MzmGad6jt94k6Uwr+hle0OB5XutWTg4J6w3RXyF7PXU0KBTMp93n+5Rfjz1DNx/G81BfSDitH99F/jEjLcAU3D8u/311+xP+bRZj5oCmZgkBz9QGT68pXxS96cc08x9+p+kOGfrZNX0tiyLCdwT80jKb351XWL/U1tn+QPC76+mmxg4KtxgygnuhyBMCLk3Wgse1m9QbyV+p3taw3tUdiBOpj6QGSUUy0CwvHKNJyDxQanVEwO0DrrmM4zJcQ+ABC11ZAvq6DkCw1qtXsXIt8iu9bdhJD2IiUyTHz6n/Ycpqvj5qc11cg8vqQua2EpFNqR3nGbMBb5RsriuknGpqE3Cqgxx0DOCAeSv0Kr7Ya1HbdQCQSJbhRvlqcVN4d8H7gRkKjEN4hP7xz5h2ABVRAV9kUYmY0T68PHy80Pf3uUZqw1izrziintiNPSaObjwyUXKa5C0BC14WdZRRVf0qySqsqqQGcpWOgeWywnScUsU7Llq7jjPDB9Hd7onk6fDynhX8hrHx1s5v9RJte6fbegKpj5PCZ/Vegb/ObIDoYacvLaN54PUFSFqOhNsMfghZ6zjqJrhyULjr3tWaxM/NIJHVRFGbratpS6RIl7nEdM8mAVwCnPaVOr/lh65cCQCoSe/tj1764Xbi4V2SzIPohboocu4oUS58oZV4K43E08TGwr2x2l8uoJaKMNTcTbHkj2pv4ntmUzwoxT56WBFzVusCVrr/S16z1WBoisVWjF4HQrMhgCooDlkqRgc1vGO/EIhPDzNJQkbsLYaaiGKtBgFnWb+7Bdl2Vz+9GYHlLGQUCyqUTOlT+dk9w9pd3WIjo+8iyhMt+k0F6/uRJYUhXOctqGdWLZhj/yedZiNxyaYeCg4Pzxv1+OH2zSpBmvKwO5sFe18GDHJ46lFbNdefnYfyLcs/s6PGA41kgfBKeRzuQRFFT2nY1HekE8nG8rgr8Mq3V18WZcXrUkoP5sbF7nvKfbgjN2Bkl6tUYnJpUEuCKGsn5aRUqUxZhMDUt4mD6S0VzVytXrFV5N2Ggit5007Gcz3xbY8T8xIYaf++oorhBfKUktsTZFpC+cOhCnpJsL7g0WMTbz6v/h1btE1vXgU58Q5jmsJtnuzY6Z6YYLTp2RVmc8TnorsCPIXbrnxtzwgouVFz54VuSJ7/h7fDQEwv6LSvfA0RJh/FUYlLogtTuHyYdDF8T3aKERUsaA81sbyAKfVOzfvo5SnVfv7YFoAbXsx5gmpXnmHgteDkjqTmpttDLjSBDyMMu41A1ilqELgKA5JB2ahhEcPdPLsDZ7PvnwtMnW6/eQvs77DYSMXGGqBSz1EcdnlM6LAwsHw51R9caHP8GFcB8dCKbu+7iddrMyALHj7iOjp8HJCBRdYuTmjPEdUE7P2kMCU1q5YBxRhL8o4H3ITEFla+r1mb/MgMgRtxAdbDR/+p8MAhDxxq5KV7grQssRZkuPuLuYUT9vOBOCxyI2ucxybGdWhcoXq2U5JROdsMZQuvrVgEJBkQGByLyXY6Lwo/ITc9ezJ44JltMriZn/Uc7Yh6FguDAH7Fu+XCDOPmO/Px/k8yq/N70Xwrjd4zl+Ac/Y9o41Xcbn8sr+zn5wIBLeT/YWLvxF233dpIs2Y8+mVqSbKEMYyE3/nc56aJzOnR+OsTe1HmCNnqKH4QaD3406rIwZo32c6ODwowSj2Rbm5Pojhouk/jZIer7lGCvAW1i/k3fhgfkSANWXPwtUnDjibeov4XPS6mZ3FKcoakw+V8BGhpwqHkWn+4RSDMB5zaAGcwHJb7KeW9kRCdHJrzCzgZlNJr9BQ/Xs/EItJoVeoh8S1IzYKWKXqVJd5htIUwHbpzCRXbMDJrKYwKLufz76SU4EcgpgsZsKDkpIDG9Vd3Os+tmzEDdvAPzgnh0je4UHiB8k6i98LW8xkRXOnWGOLNyYOdDX8P5/ZRJQrApwVQBBFnEK4o9JfpFrlhWBvofLM3/FvfDf3aEbOUxmzYoPe0lwI8myh7uJOywoZ2Gd+Gn4wCwQOe2orWIYDYrSPuDq4lFF0hDZyroz5hHWcYkjyalKTwVaVPLvAVpCxoZV6/hteXpN9O7Eyx1MRe9VtNk1TTCyIq4xt5JR6pO+BwZAGBW3QI+Y/kfGtV4JiFIGYfEJ1BE0tzjzhDDCYno0D4Kmi7SQsg9wio3QqeObe1QaeEa2+x01rjiVu6SNNc8YQGMTopzx8KDYuGm8syHiNcM5XnobjvRQIGR5Kdy7jhxvQqR1KXvklu0QxYg1Jrb2v4+FnW9epxFnO6h3hgORRtIm6uGUoWC3M1sj2UNmD5Z228KvaxspmPaeqIAzDufZjrUyrJWyAHKULR51L8eX/X4ETTI+uTi7XQmAAMpVdGxyfCMvMsD0+C5z/nlIPm55ag+u/oWvy6yNiy0C4A7Z9hj972eGxMXvSNWXpHsJmlV6wir4FqPUbnB06vuJNgXKkn5g3jILuKz0JmtnpbDYbyaSzdEalU5JXhkXBXOsS1KfU6pbL5+8GZBBIwAObAoGZ8l7tSNPuNXClgS5I8NV5U4KEg1O4JlJQMUpdCF6AVcTwfPObHd9/44Elnvhh0EZFa4aN3JUEexZOsc6uzutaGGA+M1wxsT61wmMn7upsv3yOcRYD2iVyCmzRFBvNZ+tS3kLG7GzY9HGnHiCs3ke+O/z5wuTyPnJfo6XnDP9Ir4C/4EW/7iEAgH+f/fSCoNLttHVR5vlugdFFF4Pwy8kRdXA02JBndM0BHvAJ29Q5Nrw2AfzsTWYmaPhi7IniBUPGZSpfOfAFuGFHLeU28v3KxTA56zeyXi4sphu4/RUjXzTkED9weLf2Qx751ycnvOa0Sr+NBGKqbQ8lrYaJes2eyZSrzGJC+0B0Miqi0XrzBc4AFcv7pa2cgILnOCS4dnNC+MFPGy+PKTf0w5DrsXM38EF/zTZVlS1eeUnE35wAA=="
+
+THINKING_A_URI = "data:image/webp;base64,UklGRpRHAABXRUJQVlA4IIhHAABwLgGdASp6AdcBPm00lUgkIqIpplSKcTANiWduvTKY5KMHtFZqUsUGkGjrHwYz0psn/SL8NLybqfk9MP969HPo8eaDzX/UD/cPRd6pb0K+mK/vW//8IN/69sXzhfHtFF8p+dfmf+t6y/8DwV4BHuH0PYMnbbup6hfvr+H/6Xn+/k+cn229gX9e/+j7B+Er+C/7vsDfz3/Oerd/sf/H/Z+jb7D9g7+if33rafvZ7OP7qlgZZTgTFwzgjeoi1VAD1xBtoiGV3PMpvsW1D8DeX0YdGX9xYKiR8gLOgyfhQ3mvjWVhTirHzam966gn5I6LgA4o9kxC+kmgfe5Sy9S+DB/uUfNY/T31jc7nm+ABpKVboJ7gRsB2UzGyDbFZhxxQBCyQPyXLFOWNPLMk7TSVMAXUTcQhky4y2LeW20tL6JFNTPnuPcuFNsfWP82gnVA2djBvfnPRF9X9HKLqWmfzMOVcF4ePsj+wAlpf9Mdx8aUM6CJ7HqthC+E4yMMLx5mEE1q5D2vL3c5XFLI9iSZBb54qdpPQJVUUdOwpMFSIgxKC7tGuByB4K3faXDosxQ4GP1f//rZrUdZ5BipwtLjzaM3MW7lFv7ERTB3ddSAKdNBJ9TIhfB/khSIlrO+kOchsGt2ZlhYy9qfRXNksvZLYcRx6L9bHqTgk1twVmcAcrzeaKUUcEJMVkAjxhdR7cwpuScCjpM5EZ2gsEVuEcHxawfpbxf5Ir3tElYS5Br+aBcnnrI3jNuky7yKZ/f6kfqhybBlJ43vxn7xLN7kPIOGfEej26XgRxruKrS/F4D7zSUeGyrKwqnHEl9NQm6Q1vt8aYRmMEsuWlw4qtEdvbwEXrkcTlfg9g9tBXldcqgCSm8qqeUV2jxMtMfv1pLg3LxCooyBZaN1GJKoAKr0V8uea+rEhjkf0UdJy73ujFlA0w0+7M0JLv8kj7BulJ/BlMSqsGNleVfO97V6gOLyJ10KVpgcMZItNaZRPYcbUhR6o576PtbmDbIRk26SInF5VnMAlcckhLRe8zOoaJehIS9Q8cT4iM48SvOp4aVJNmgQ9lJQ2gXdPrbixqeS1d4NJm/HaOzWq0ATwYEDHHcyxjNNEBcDk6lI8rkTc2gSC/sgTQMb0+V8shDzH+r/jiD5ouXA5GXr0UamFzrO5ynI4RYviGfDkMSKlFfT/P4OBbbjKmdh+ld4QxQLZ+6bzn8R9jPSEZfkHLBo8TnEM2BjNBpN9BbC2p3jAJPPBahapB4qTpbX7wmglc1qBYLM95eCQuTr8K9RgVnH605pzOcBRhgw74WYjCdQD9aQhKH9zZ2qMDPrDJA2Tfpd6ehTb35RSbxkFEgkPJTZh/PSPn98GvDoYMqomhtU/UkclKy2vbmODmV6YcaIeKe/E954xRquAzj0ZUoFwWbh1Vu5Bda5w+L/EFfSd+T3NDvoxuGBHtheaEWdSCQkg81J1Jqb0J1jcc8b1uhLMvnruudmoxAfy2cJZWDX5FmdSoz5Zh9HAlT6NCI7RnpLTc2IUjxn5FoPdITQIVxf5+HZrWLJ+QYtB7fVZtQ+ZrO64U+jKvHZz8t8akaFyMnuFKmwE747aj0fLamh7VVrgXH54t7iAwcpPbfx3I55t4Q7/L53BYe/ZDmiExyCBbIssnR1s0GqQUiAOJDc9hYHxH4jIQGUjw2heq+i2c8OgnyLf7dV2OGL0PWg5tUZC+wsjNrJrVHqsst+Vf9wrZfyJ1zrXcZ8L+aKCO2t29kp0GAflNVeDL6h4m6CuWQ8QGIDryIOy9WL0IqPg0IDMLzs3EjNTRgehYnuOPNBkx/mKCkB/AhT1EJilCEyValOCd+VjHF22s5PeJ7Ku5otVj27QKCOyaUWK2wTxNxbVXSL7kmtmBpHdu5gnFTGLSJV+GluMbmRewWlZbHPzZnzksgncqRiPYgEXtkbX74unXxrI8YdStRQJ9/jFL15y/QSQ+1waMIBUHKW3WDLqKi8wIv+6JbVHFl/+9I1sRhqkJqBszPDqWDFGp5YTk/FrFOPsUUd0qga4AdR1ohcJwpA2pwqoFNfOkDWrYwjceP9DMCcA8cBYyEUJ+FUsDPNjPQ/3uKe51uPIX30QlxKrO2XuRlLIM3o+pB1Uiv0Q3PkQjWxZYd9jVFxf9kQ4GQvsHGJJtkYOlfmumMQoGOpJWVAMp55Jc7olQ9FmMnEywKaG0inYFjkJrmwmnHuWpDQAvuiPemGFbn4phRhe1+z9HeuDPz/SLoBQ4eFTB0agnzzz52n5GabmaHy6J8OCB4SZYy3sqGzCP13UlBz2cIWzmPJe83Vlr9+9buFp4MCdDB9YiaebD4wlfDfkq+cL+CQtjDy7pIxX/4VdnTa5/H8Lwf2/0F77FCRcipWMBvcNOzJ3gF7W7xWkAJI1PQ5sFA9tPGWImq59Bssr0LsewLu8ajxl/kuX+KreJZ5pmDrEciW0akyzF6YpQdZysiRoKeu6Uu1D0YqKCICqOEUZnBvbm+YAcMkm34E+P01bGXqboW1g2Aa80od7UA0w3cM8I4qvkYIzKxIaFbBgP3Uh7rkyWLgImSFAfOpp04L68jIodkjtgHM0iStggdpTdTElu1t/BzFtI4tCqjR9D4wAI8fRg2hfedm6JY24MVb3TvvqVbb6kjsdUzigR6yZCf5LQ/diAray9AzGySY9teRV7CTHZGqZp3Xbti4wJjY+1YT4kBiSaX4yaXRIt8px8E4D/WaQPKWtEyfgfbVbC5vA8tHo4Pzu1jpkJkj6ac6og9Kv5o3t/MkwFA5VfChiP18XU3b1EMbVe5DXQXyDcF1leyht0Ab8LTnTSMYuwKxpzmPFTpORVLpPv6H4mrZ6ZNpClmaqgy7r99r1nihdpppKAfDr8B6UqzHh3DTp4BPQm9iFs9vMr5ECVZNgB4SpLFFES7IkqXIq6lzAD1dFhLqbOCxx39qXFBqpPFSi1PfE95Thsxg5VpXB6II4u5JeqNzEp0YVrHuss0SjAiGyZz9gNdwDdSYd3dKE4ObeNKM7c6LeNBQjk9gFIZ6doYc4h6tBtKfpw6pLnfgcIRADT+l7S1DwJB60et/plnhQj8yV0ql6FWsxK6TKCwRCa/lXKJpGvLaFaVcAZ7zRyUhamb8ERCKslq4rf7ZTeHSCnIIgHx8gEQg0qtOW2firreWZeb3vCOIm+td0Bi3EWmv1LHUHQiV49L8xJj87FJR+She1CQmHOLlMC3VowiKlfTV9VBAzD+AAAP78Ve5dXBCfXCrxK2/lWknT8tsOQZmJpffuJSjDw1VdVIIt3AcvLrOjQ/qZw5RcyjM4mgXA99zc3HpKlj52XHTickV/8Spi2mZAOyvBQCW6jFNfWHdfipOXvCSmnWl8bOH4DrQtee+PE59Ufs8wNiU6TTZjlry/AWR0HUi/ZWJP0UvoMKXxIZXDGHYAEEeV9ung40DWpT2gQLFzJVBsZ+LO1xyN8V9Hfofs0n+m+f8J//tHTg8XOR/IKy5Bn/ZWD2vKNmSMv34tcpWb6pTwG9N1oIThw6+mPgTUTM3F8f4Hs8WxltpCQ7geCDrBpYpUj+ryzpS6SwzwyVeW6LsNKXEPtvUFrGr4c1VcbNH1ccoIqklCCud0vn8smqGAyWPJaWoF83Y5LMm+51GjySmJ3rwiTDNQexoayP6c00rvg9Et94mjwUvr2RWJWc2TVK2rNZZO+TRZKghty80g7Bw/pt8IyksCF5em8xSUJQVXhCedZ4PEBKgey3aHwdRft7ZmneCKLg4DYYSuVvaYRomhvd9DhGzx8n9qa2XhcddEVbBVPQYeOVCPBgEZIXMQ6FZH/iGX60nmcQ/TfW5k8c1vnoPmtsWKCTOcm01CQUcVE6D5bmz2ON2R2WIBoZlM4FkSx54td8RC1ONiDSjGhhLmpXYGmgqxmg5/SNmQWdR3TgvIcgOkQ1oYvNx2d0WLD5DEPjgRIAPZY+VIzVD0hXwaawoH8A/OT5SWoqc/ujLWa3nhYiRQaEo4p6Mvt5Td9/XSZVDfvVjgjBN7XjMPbj0xSAaCmNsy7N/Gvf3brDrhZ4ts21sgkitDqT3h7udZwsRqgTuxcfJvMUjuU0GMmOFBRnSSMgPGv92PF0fHJCqatQWOE1YrDO0VWJyMeaDjOOyI54cWc8Hz2dg6wn+qbo/QK8wdRIxaIhKKdy6EwlMdzlk7doywRn/bHDR3gKF03BpwjKB5t2U+8AW4uaiQ7sJrpX+QZWW/X+qQRrBUN8/7rJz6Z5iAkX9BYz0G0b5WodQaD6y/hJe/NoO0Ofz9WwM72YPXghkcruqcOUFZQze5hunBckkObL45bF3ZsMkwkT71MLzjy+K/eIX4EeRMld7mTMFJWScSr+r10O5afcfMJAfi6Sdfb/4lDX4FuD78I/yJb/eNSCsToXW3Wqfnwh4K6+0maHAt0ddtzi/nBKsoVoKHxu4HRrUGMRKq14d8LaGaRmB420MxWcwlyLNToontrkuG846kwOqCWB/FsRyjisgxWL4Sqf8eRuuY+j/0PIS+JoFdmxqMK3nrZIkVf6dDnllY2yb9v703mBlHWlaG58+2aozz8sm00/wxHZY5El9o3YiIxHyfXGsfrpaWF/YfyD8NRGsPO1hKuSQcAnXr5WEKeW+fDEMOtX1j/EDvCI4NReVmrDrIABE04iODc4E87SM12GZcQYVRDDzD+GA463CQwxYz/56r2J6lvUAxvJtU8iXg1UQvZYxf/tqvVV92qDDmCYrpMMkxkcHywC6auUkMYUxtupnvfT4hgE40PJnQNppYOzDtTdX4Iu6cPpYgJ4H/OSbTzHULNrsWBiHnHsCEp26odqTTQl0b+W3LhPeA8JpS0zE6vKJxjSAyMIZSN3cyUCB54Rb+kli1SeIFtxPiiFgnNCGO27pRaG8WbiLMsTCiVz9cO7OjTbKcCVTxOwWpx29CHUcMvDP59kXnarVKtzk7srsPaq45A3+UEv2icdDOPc4dgUV/gA6S+I1amegoOjrxlRWeOYy8vAmxu78fE0ONRON4NpMsZPuW9GvBQFOFkj3GU4/EDY5FBb0CaXh4v5tsIxmsAmHt5Zll5/kO+PUxGLbc/rZgAv5cA47kPKFVBYzc1/8oF6G5wkbxm5c0SfD4JzbM5vrMW19yeQXBYytl8fxRMk3SP3RuJhc+OcP5PyXL7yvQPzEX5xEABqcDEhDeJ1Pk7bNxr0t5hvsQTRhCdGtDwBldODWnfZ8YiKIXE1K9N6dZr/UjSPJPdPxuHkd9PGRTc52a5HnCA/+1VfVlqFd5MdaW6+ofwjNH8e0s4dNW76wEMgtEJYeeD+UfHez+oAAQBkg2ckTHjX/7992Ue0A7pt9ROEcEEG/8gEU81fzDT8ivkWq9Lt1HA9074Ax2qtlFoMta+X7Tp+deeBVkd2u72T/g6PzfRldURJVkh+bDBeLbaZ6+p8GzYAe8AcaIUWduBleQhjQuamT1wwXc/c2whfjXazNSC63sRw/DLxvfgh9WkSHYEB11FpbrgDjVwTTAvNw3uE3JF1ZU8bZiYuGHenC2jSzeXL6W99FfCw0Q3ua2Ne3nao83kteEJM2i977lQDtMhU6vLJJZ4gf9hRQ7PxS0aMddA46azhHjkp9otbv0ynFigkVXCbv+WhSgWkrVDRKQLB6CxkZr23eP+NJolpqotjuT8ydQ/HnXBCPzL/CxAAvxKrWatsot161eA1zp4WVzhM7t+/DjX0Fc5LYSpM6dNXFjDO9uk6bvQksfuiODrYTltAeq3pQU8TZZHddG8hU9LmcEBBFWt/zlN2jMBHqvo87uWoeSPEU202wBaX3fh+bsd3vmy1Xdkjby0KbGnQsxXbgZArpu/uffsVdmHitxPz4L8xC8Gop8M0JWFb/3LlftZMwGmLemwZ/G5hE9uyo475/YO4/S3TTzZVLem1G/OCBkW2xUmMUABZ+l9+VUgSCwvEHPInPJssVASHlMIl51OvAXJaPld3KQkxpNFJ2zFOyWbC2gwWaOeS7S+AesKDGfnWfDznVK2hVY2oRQ0oEeDuzlN6gQbUAa0GEQNoo8lnMk4y8ge+D+QP/rr3qTZbPC+iN1CbOkoMLhyQ02RFidR2uAQli83rmly4mXnvxzqFQa7casBnkVTy83YV26IECHGs3aRybeHknL6Vv6PVRIVM507QC6iVsTAKMXj3+O0H1kGftmaJ0PQagMaooqyO3ZAfWVvJG32XiSKz9caIOIgpXyYLwNYy/7QJ4yA97/JhTevYdQnjeL+FQL8aqV+j/XWjNVl8HCxjguJbgxHNnsMVNwyjz/awsQ8VLAaDY4iYYDaxcXYiuJ9XKA93KCO3STdqqFkajLu+L1m1XbTUgEQCG79f2lcSY4E7CwLL4VZqXoiF7FL9MSvQjU78dG9kijIkr5dnS94kdBty7c/vEGknLESMgvyf5H/vQKBX1XGw+gKEVxJVDAB4H87lO3Z84STDml/EUWo+FptNcB1F6mIDCqSUnrcTzzAXIxGDHfIAJcbeGHDbB7Mi0w9h1q9fV9pB/b0uUq02OLsUcKCY5MYi6t18G63OurzxaQaC551kraWW11gu+LsOq5r94vDabAxamci+osNgczSMspiakMq6BdzN731Zd8wnkoVbbuCX204HVwq3nXdV4RXhBDbc4HS0h0C5strn7yU32NLyiohDS6s6Ca3AJ6tirGH9WFPzCKS5RaFpN64gMBRqzMsv6Qu8pPxjupPUieVl2MViLxIhPLgkjdANMV8/+Lbs6APYW0qmSe/zJ8Q1sQ4MAU/o37fD4EuNfPL0lEDCqjJ2tfRR4Kv6bXgspQwEkA9iOScAFCiAYPbSA+JzD8AjZgsBZvB3K3zekFMsWiRNpUz1YhTH0EVrEUyT9JRa6jbXchc9TQdwqh/uLCRLNqAVH6UzYwJLQnv67T+JtFVxQsY2h4IdKpmq0IWbQrCjNXoj0SoROjAIZ53QWzJod/rj3NuTMaaGmTuc6J3T47c310BQIBiXySpDm01/rVfxw9ec636HdsEQJZbWVrV56DMHfUY3r1iMbimC/M/nO14ZpOxuyLJNCohqcinhg61iWAsPu++hLhBxe9DmYZHGl6YwrEQYEQ05RTWb/KCODKa2NEhEXbaY9a8ySfSovUyU7ryanSmsY2f5hCLivkd0TB+cY6anRRaus2LkrO5Pg/gkA1OswcSvQI0o7xjzjx5V+8dZsLwX/R3GKaMIB6Lj+lolzHuXQFkw2VbF32yvqCgYbDJ2l5x5FUMW/9aOzhHVRoOZHTq5qG6fMMDuudGX8SK8jrUqK9ysCvsiMHABSCGRVB1mzXbHeFGqksRznMjtwEgoMy/iOmDdwG048pjUhqcmgjeRIQyhgqcjYGJHy8BsJ26KRxTpp7eZC6Kr7kjsWUWeYy/JGMRDxoCbx+D/RP/tP7GYxxuofeQu0MTIM2ShvycjdmtDX/HuKNedevfIiCAT1bqFNatpjlIPzHcPCnFBfgheTWyfLH8uwxtW/Hwf72C4yF+EoW/XvCRfg1+MIW+4eMwBpihveNQfOEBWEw8lp6Uv5g4Pw3b8ZhOfJlmemoi2SVP+7vsCl16yxOTBUK3uir/CcVpNxdqhXGAzj2pkrlqDmYWlw+DL8JNAK08BZCawZPLtr/N/ry6Wqyx35SaIXNWmR6nC5N1sX3zAQJblTqORfVCxj9BkVO6LbTtsrXjvKHCeAEpUWPS2exKuUdBTfNNt1wtY6QwwaMOwMuOfVEGmuGaie0fXlmUwnPvoYG1H7iMdm4aCIpobWGc4UKeulb3G8hfkZByf1hH39rZ/LObtwy46buZ2zJC4IA6GS7wCRqO4C8lmW2KbE+dkC9uWhc6sFvgixRFdAPaYA/vrn9wvtXk1cguO2fN/4zBFHvauydgiREfb6OYJcZmB5c7IsmTvNBqEYcMBFoOk8oMKqkjxAZDlizufQoVsCTRUPYJWrLvcdl9v7JNuToOAf2Qr7iN7a55QcHVrq//mhUMUmYQDRxgryWNBLZ/k/CYdH6wPgxMIKW23uw9gcmq8nb3ZLUa3/OXNFr/4S0Ngjs2ZJu1NXDgoNosPSTbzDayGRaPW0SS0sh6u63OZRjGMteutipvgW92MaKkme32i0g5dK0mA1yFLPhNGcgBdV20oIiCj6dFOVQPrUXXESr1HLHjJDVhgRxpBUABBihSJNuFG7+9G6AfN5dTtAEdyEzqdAQLem19y1wAOve0mwL0LllkzX+6vYqO/deiNEqVd05DR8SPGfRHtGWRmLrIdTQ5pH4OU2S0KBRK4PwPDEinQ+lYYl7/tnRX7Umg2Wv0CYSHGOgd394fvE+nkV6oBfwLYR3PV5h8iiGwHyspR8u+cz1ERtONLt1YcxThPg8uUAMoE7o/RrJEsRErx2WdTUx8O39aywGJQAnX1C2oQ8Li1wrAeDw0V0DsIEKRYFutjHFpDKGQLWpqNv5UkkzWS41AyDE/x1mAQ0yzg8PsDg5dbr0TKelG8k92f4dRW5A596cxb2jjfAwQCNAbSmkSS3fEmz7Mrvv8xprbalmIHT54gL6/hk6alJ6U2b2xdVVqN5mXtY3weFVEPPrZFalrZ+b4+BmWaIf8F5N+3zkcF0aWLYkkwpBo7lCGxhHKarnjNMcNzOnBfzQawWIBvp3ROJ/5Y7KnRUwt1TJP7vCPblX1hcJRSiUeWyMghGgn2AoYBJJAubHWXbs/xYQvL+jlEmDswKTD4eFw7gfxhpB/aEHd1zVmuw1w9qLpNT1ZNxXKGPnoeFYunxBoeSfdzCZ9eiJOcstYG5ZEiiCOIICbS7w5IRUJtRmThn2amZ8JPocthtRn2YrCQvqgm8nX9svE8mkz3cKKOWlkyyHs8UwUN9Y8FrSiRkIvpbOTy0gvqF7+VvQAFygjoNaWjYerm+rBec5NQDzUGt6c684IMldQ4IxJ7WE3D7zD0cvk+0aUWnoxxxgEk7N3B1l4nUQS4tOWXrVpz1Kg9tbiCI5Nr1ODlyyWp85gQUDDdfVyNtEfHvc6/LSzW6ssd2KjNxpEovxDE3xTvp3a+Qld2AFSgqTCo19R66adPqSg0ISMz4BoQQ/i2M47d2OVYe+DVsgiWRyqXHolfYXbH0orCA4ugL+ZQBgvN9ZWAVqyZM9I4DSszPDFf0Gl7CR1H83sluXSvY/RyN783EnHcCquikXV4IJrIv/PqQLufAP9iblznHCF5s6+wBShO+Eo6wlRlqBWOGkYR1JXtIJ25IhzEvbgu3fbn6x2Hzx9GzUgFKL559TawoWNXrCrruMErdx/Ey5CpbebQZY0L1CnDv8f3Won36Y837qMvBpwgup0ovYHe87USDT4ZDzmjpMlGYKiL/YYjdGYyRVPwEJz5mqZwMd/E8FweKwFDLFwk5NO/QCYNtUMWBw8NR1GxJOfX7dc6ryGnn9REDYnXHTTbfiufCBVEEQuWCmHcmkd3ItyrsKLmEhya7H12P4FQKdg2GDlexaAvfcMf3Bvcj8XSdjk4rPNDYwytLcRbYqPUjcfHZKVYrxQHZFO0tz+nnxGnPUKPUFcRXXpvHgj3vNAM1Z+0iU1jNTQzlBnc+JTKMtVOkebTeFDtM+PDKNamZYkOTwcWewPGgyEkKfIwD6D9831AbAPDimFkqiMamugWkzLHbZXDaqzab+eIx80gR9Bqb0QpZij6w7zRPbKd/pje2Ujpwcbb+6Ab9Lx4/TqpP3Synw3g/bVURLjm4ZwlVAQi8X19eVFepo52sKqyWvXHbQtK+FVLHG0b2Lq89P8jH2/H/g13XwvhPFScLYOwVsoVS21TMEEg+ptcMQQxa3KSuelrCwpbQdhvHP/36Qi6m/TlcoOihPx3XahGafcs153A2wVGjCn//9zLq0rFhJVTj+TrAyI0qEUaypmo6LblclopwlPh/yUjRWOUzJ42P4fut+c3jhoZEwwemxAcRgR0jlvemFk+F9ByCniMh+75amBjoLqgfkXzimy4zJyfDAH/PBPiuwBUzXDUQXmxGjP7vCP54ZrLMYtOZ6QjAjedAZOrmazOGXZwL3oG8SL6KChlM/iriJvD650ckrFi0oHNqvHdjDyY3uQnPRb/mR38qK+83/osoeTVm8GEJBAsR7ac++i260ERLWVidpxkyoqt0TQ9vPmOFKmue/GjCFeTIrylG+GJco9aIURGNUL9bUh4rcPFYKPjJ/0cNbWdqZRhoyEoIq5TzwUZ3A+sEkzcsqsloxhkPV6DxUh03qPW5YsDRmgqa+KJFefPOTFWjAHdI9oIAmC9vsLvqtgBxfrC70ahYcSK6pFW8sq1RoSmxXT+BE4eHituOuAbumAxc3sjMxYRZnkA2dznT6tu6JRdYzrXpXtJtO7MjfnsqRLy5YL8jaaEut2jETIvNBdhevDcIksimHoUtEVd2hmbMQR/HCpenq4PTUzqNFIKqNsvMEUaoHDxtx28SwihhX90FVfIqm05X/LZHtcuoNhlPfUZ5xzzvLqsg9vfuP9JxIGa80ZFbGNdXV4oTD7lnAKENyqZdgzU0WVjzetPB0ViUx6aqijtJC1oWkGJTBzhjzoGbudscm/vTg8HcIR0vPyp1mTAIAfmxZOkHwSAAvXXMrVDK0fb3NjZbigp15QmVbK3jRBa8+8HIqJD0j5doGmG25ogqb88GW7AVB3Uv6QPhcoSm6LoZcGIGdrTwIv++S13ekYJ4I622RZn5Vzu4ECNEBMjV9hXDmiRxhmwyEWrIcabY5RuHEqYBGSAlVvrYQkyHXxeQwuM2wqoGdW9sU/tSpkhRN8KTh1TdAqbm4+aUSIIfVdk7GxZpT2vrPIpYLhQg+rEwKuAL9dok9X+OnEDCrGFnVB6PiTH3Qx/kgz/xACx8VSDnaVFnUcTlhK5vcBtHUAqdk6W0i53hDi+dPQPiDoGol8pfjf4bzTEnD8YIa3UPEmDnENwvKQVnQePXbuRjjUU32N3q0/LSUNpJBO5R0GuMt88NptxyU5LPO360vWRb2pcX/Y5UbOlGZpYxrMw5o2ft1Bs5dYswNq/S4Th0jiPLov/CWQCViGCeWsLBzRESnSN+8UWyIVc8LyT1msCBFoU6YqhzARlnY475sFWgtVVy63K+CVywMyNktdgrsgWpsQf77w9+nO6OtGlEl7Oq2dOJ/LGrHCMadMDhkbT7oRxdow5k5F0QsKlttgLFIbo1JwhrhR4z5Y1heqKhRr/kZJBirmzjiomBGUk48+qLu5uTgxjb7YOk73i1Q5VqxKLGo2ggwaFX5OxBZ0A5r66B4Hc7IvZOke1TG+P9YLlYcreIw06INYwFy1x2SLuYitjslM44a4wHf0jQ8TELs92HUG4Iav0DZtg6chGFVXFcFa430hGjcQmtXDYXYaVCfuUuOHKJZJiX2aOcrWnmqvnQCPmYS9nsx4GitIfw7cvzuVINkCdgkTpXGznCZDnBzUQYYFfcWYPRVKmvttcb6U8CzKKMjFCVKdpaWcc46mPh8WusqJbJlR03zCxv4P7xhwTgj2Ge+2GZlj73j739OPmGfI38sNL/4+VtLPcX9VeCREhlWQ8GhZtbHYkv2/C/DTeeZgd+vYxPz2YLy8hH8YKcCD8SuZYzjNzNRyli2+DPUUQbOgEbjAViskke6Asm3qH+3FK7bQfjmkV+ZoRKto6J/2Bys8e79U8Cmz+HBjbYd7wCKJdA+Nu2D4vaQC/3vwU8S2ZnnJAZ+PBAXH64/viI4p3/K0Fr1FucUywOaOt+t1i2MV+bL6TnjsryMqxaQM9g43UQCqDpYyacgE+KWB6Dr8P4OryHeK2JljBnQW886BfCkZ/D7UruyXeSO5mj9Z6R14d2KBm+a5dl13Hf2Yne5S8zkJS298EPYSXvUDYnVsTR5jsmHdMlNFm9YRXBj2pkL9Ng9mB3i7quOwf7vT90tvm5v6zxaEOLX2taHk6SjMkeXhmxIeruyofQg3H9uuh3Wv+67Clonzb8YOo79oOrEkFKPj88zBkrR17dv06fN0n/GUES+pruYoN5Vb7wxWJJUJtfRsin6zsfRaICBc6Ksx+Yw0+fH+TEeKrQ/c5sttwzPAKzJokzx5WShR76hBPCW/rL3WSudQZ5vQfdmhW3zstNpmx1cVzvxSFJf5Yx2rcNe8S74b4iN1PJbIJAC6ovIsgTsTv7qenZE6CqQNItgJe93MLLxTpLrZf/GWsas+89T7F3sRG0fK4HawWfaLhBTTy5WEVOiFkm1LDYZ8snpccs3h9LNNfiiW9gaddqjJcD70uHTBxIzmdFoK4nOwLPepkvNlr5YTbqWVSo+nIu4ar+1c5EcxRDfMVfmwfBssaluSlr4dQBpfJ2i6TAqzKf3ACuV5etDuOWe9xrPSGG1jxtrrw5KlQEjpStKw1T/S4wg/Q7wQWWHpg9L1tb6VNfL/dUHSDzcY0JRRr9MGe7jMFOHsDXqZZQi4kiPJvi4eF/ikhjcTM1zT1pdHo1HMdrihreN5bUtQw1g2ZA2ESyKwtA1vi1zX8+Njg8v1NxqoLtOnKQZ/bZAXTptVJ5h1m95EMJtCcbWdTBIW0KyBwXaB5uzAKfukyO8kLt1OgKMX3Jlhw0/qXje6B6Et/cn5Uk8tpM3qUajrnUg3bAPCjnvULwjXNTXoin/3lPzXdznlOJqgXz53R5pv3RjQ3HPZun6ZRjp1t9BT67IomF0/Tx4Q2qyj4jAUmRabtcUuRciCqcGaUvW12Ge6SjCxkm3mbvp3bbIT69M5CqEaVJoNYJx+7m0LWGLovMl5ao83VXxJdpjD1zk6tBslyz4+9sKDqRRx4/inZgQRiUi39O6Leai4IIpvWFGJBHcH9bF4m5O0YivE+SOkFqSSG0Rn8s43IHPswb5O4j1Al4VToaIf8496EwpQ9Ku/+aX2N7OegovzGfRAOLW3uzPXDVPctJb47z7GFCMP3+AosURsX+SVg8iClJrToo/cMrRBFSfB6oB+0yxo5v/yWP1Qkf063zO5lCueW/rTVaqWa/jXgkOx/TFi1aLgMmuyLL2aIejx0yt/3eXJFk/t5SS7qI0++1EtY0V8K7qsdtkXbcSI1ZI/r33ZBG29f6ZPPHCu8BfGG3lZYkWV+KSDgobBpfIcTFg969l9phSjoKIzFb1onxnpu1Xwsa9n1pIOT8nTq/JsPIiphZhSbU2bH1DMs7Dx1944bOuH1glhR88yTtRw7rso/iusWpjS6dXSDjV8eG/NXVJLERBs9A61qVt+M1cNBpTfoAGH9v+dzBTrpEtMuwJwEDxWhFU3dfnHDQ4vSpPpBwa6dVfiHtQqJeNhY9LUBqueq0DmFR4qBnZr0/Q4wQO6BeNwim30NpEJuNqkGRsk+/EEm0/1JRglABNbMhaAY9BZMOD3F1sGdnnOCYPB5P5tIrPuPlz2hDhEjMxOP3mITufwmF8rc16lbXQ+lbdx19wFAcx3OjTpPJTxToeRoDdLqNabCV/BeVLcAZODEYC+/Cx03RiaY8IjccmGAJuA2LZbg/W80CIgbpbTJFhwOPIESKRs/s2R4JgHHH28qPgBzL7sbYEhn8mni/+PLwTiKt0/82/jAGVQtuvIYZ9J0ORhuYCmmlNNn2lip1A8AKPzZbUJiC6I/f4RFn7fdR7mrN9VgQzOv6FEEcEG+p9sbItPi5vCt0RxnlFkyI5dtOOEeujPeP916ZqSoGyO34BpcRvI4GaoSS9XWKMyVIIsJk1K2VBkM0+mLULabO+WHa80xXbLYVK1Hoj033RX/sqdwFZs3YtR04f/pjm8acu7pOsndlDQmf3ocU6TosHGr+Rxg+aBDI7Ve+s+oBiXfT8f6mmxT27y/be7whIskt36PtDAI5DnOU6PVuT+SrAtRYPKND/iXd9ekdmvCnyoKsuLgICk5p4EnDzQyWWVQbQmab39J5d6lfzAtSqIwCdT7EK5cKw3s/xRvmJPrqNlccJW/ILANFV48D1vmgQUuvuPNKE4Azw8ULmXvVROuRPukbecFLQYQ/2iQ6n33xqe/OO1+xNlRfltX2NPj9RRFtoMYMC2cWhj37z4hu9RAnVYE22RLG1JLiDwYNf4dnIkrege8Eo4+dqTMtJUrmbKVHrPLkxCJVABPlUCMFuaAA/a93NU5x3tMe6X/XeqANL8/X7i+VRJsyPCfLHfDdgnlmBCnZqVAvLBEJGBGrzRyql857fLCw5tehxDzyEKzuRUJGqmS81Ot1eV8/JRI42wTOTI5RJUmJZZ17Au9jXAIRaT9q2yadUN/K50El9Q1YDwM8xcQTBdDhQQypJHfaV+jy/W5TdM7Bxf4msVhA/5uqUdtiVDGEMna8JjoL3tXAcpTNqIT/YzZyCOTjka7Kz+pFku1HJwvnVpSSXmbLdDmWvsiRAAJlWSFxeRDobXlshWcnGYDY2YOryZX8Wz+YNuKBEfpQtH24FCFtg54BtICGBczBE3GnBBiPc9TtwOlXWgVoc5FDiVBCer92F6bBtrdFrd1y2l9lUkJGxcRYxcsnXMvk4577w58bnvQfF7aJB6ABc7rgY5kC1+e7YUZQdrUzMnRwqqVvOVqsooBa0h9BA5NiY6nZfeO0YstOLGjWdbXLk6tVCjbf5+hsZP1VHZTlc9c0UJaLQIxV1zj+COkYRq4+JCnFuX9jn0BnFljJJE1JxfBc8hIsMkdNraAkY24WynaHUzOqgmDjdYfVCxQEi6X1aabFuU/HihjhXZN0kytVC+7rc6rpSdoliXn1H6CSqOYLElBDTrkZdF5TguN8T5jvjv0qMwHo90tdYh8hSP/JxghbadsSrtc80EizVQMAOnEzuLc6+w0LJHAJq+emDq8HzlIjby9pWLuq5626dVA9R3nJ09mQRuFOOAym5nXQPjB5rDGJOn2SEtB5CEsK5WD6MaQ6VMMqB+/g7sOxNA7FttkQHIy9BLeXx7MM/i7D4e6NT9FmxIRfSIdGwAG3A1aOW+IEGA7lVxJf/rs2b2j7M8jdduF//ZimYErB3oa3OwkwTYeti/sld2+bZIbKyQ0SmU0uMQvmQTptNkJnwilRlz38I9WsfIJ1uuEldNi/QSx4qzkML7XfZodtqaFRjJ5m/f9XfGwmt/LfgUe1N6lvBAhmRCblOEGv0D6hLYScMXRS/hRqpdX2PzyHwlRm2WyG7uRdkZWTt5H+4ea0J6Adm/lREJEQX5uGfFyRYG1uRFCyvS/RqZQIFLVJmcNth3CzaTQiwPjiNkR7J1FLEALoJIcEHUdEe3HypTbbI5shAEdqChiPTjxXr0tr8HoGnk8Ej7a9XN0S8eEXIef5dPABaaNxHg4zhL1uN4o1YGBwJ6Mt5ZOPeiGmd/fC6QDlZlc/YhakCk8cotx2WcuZ/HsFvC3JBSt3i0K9Qgk/rc3KngZx11pDGqhvZ4RdEs70M+c5USdbU/7ttnZp9W4f/pUxq8q1Xu0sBqkIxUFTXgf7sr4ghDZFsnxQtq/9mo5e/voZM0TLjpWJDNWMqdUQPU87qVIyM5N3fTRbNNPbW669mFXFBKGIrT2gyddpV1TFvhMEDVGiGGTGjCySkf43G6wvnzTr7UjTKcKQQ5S/kTFnzRypLxy3AXGcNpY88Oio+dFxH9Fb0p/5tGpbsnJXBIWnHHtw+BBLeAyk9DuhIjqmwvc8B6rUQx1zFBJNRj67Ug0MeKZTBHFa2wWEHMVbGBV/O7RtmnBLoIfWK4F3mEApORlQyDMbvDEhuyyMEwFXHJrFaDyJknrkzWO3MDux2x/UuXyxecy9zAxJ5YQbdAV60eNeVHWxh+d1QQziHhnl1pJcwmqzDtiuh1frI8O/P/WZCPcYIwYsPZzThRgjjabnm1SQq2m5+zgaCUb9S6DInoUQkf5Ofu9FAdbHXR0SR21ayz4Olhyjpgvkkqf3CNjKNbfBog9d7iOPUAuCGEazZ/F0DsCx2fMh1gFBLJ7mawctK9p+yzY4SOjcLU83GqearDgSLH0oYuY1MU/+Zx1zy/d+fiPsq2FRKLhfVCswoQ7xLmbgib8HLdmWTHb7umgXIlSl5HwnhN8o+qkZfwYUqlbOdsWGqptW9dhaOS7z0b+7P4obQ+rURmnAZibnUNHw1EGWyHURdzp28DOpfmSN3XGnNp3yRupPXLdW4w0wtR75jx2g/2OggSl+F1XT9ifK2Fb3trUtj/52aj+t5xSlgnvLz7BjlkeVdTU0a/2LNydRu9BJGWwRRScHt8Fq3EpvElOcGM6lnfWpKxsYOCIc5YzeZJOPk2pD2xZ2ViAil6x7nFXqIcr4QOYQrkWYq7104YVpk69y2pGpGvFsu0bLjxMMt2u/ZsmTdrTgzJmzOxStOS1v9KQg7PKQIqv9qks2lgGInfg791NRTNHI9BBSRCgfF9KkDzAK9z5Q6ijWks6VCBm+PhjPZV4aM5dh07Aa8V2FhByDqTgqxIUOAG4fk0OGLclUoIVmybal3c/dsmH8lyxggPMdg2rfdqcqeENxg/tueXoghsNftHSWqlNwSTIoLBZLSFYF1xSjxAQbbtraGj5rZCYD3m1ICy3roV+etGKPgfWRd07YrGWGd5xdMUcf5zD2b+3b/6FKfTG8QLbf1dNSIfB42SpgNvDWdmgsIi4lB8byxXhoKBnmGRlUGDTFbuArPO7ZmRTarNFvKKcKYDWH/QBYCb2A/XsTPuDswGlqCUpYgfHnSqznekTurnfm4vc3Z7NVt9jfR8sstSQxhNIIiE1IKVRNdhx4yoldyuFgIeVbu8w/5EvDjbjxnuJm/UgUBUl+y07wkvdXwRv8kLplhuvTjLiWcDUv7i7W32OxFn+rItGn9hmXGIqVLMhUuXe9d3zSBWefsf+1RUGGebBoFXNjCmW3H4GIm7P8gRqds5WkTi7RyYudikx2sGOBuTXSVcWU7Zf4OeNT+biDnakXQUitOjqOXU6fxF2vkv9QMzElxGqkUKfGvKKbvDTaT+gcroIwOs3VckquID1dKLBGPkKtQD96EJ1STOdxGcOTKcM6hvs7TFL/syUBjq4e7nD77bQXMcQWMxN7PwgkOwSc5VU882L9dmEXXRLlSG6DEe/57YIA5VbWsSg2rQYnveyZYB7DNKUjWzkx0dlblU0td/Ib6eyUTE6Uy3dShOIIgV4oJRpuTlb3+t7w/ee7ZYS5gF5tL7AOai1zS5yyDfCSvg+yamXpvqwplaFbgCrcVrUTq7m/aujbD6JUqVwofLJqbIjHOmldnrSOjg5unFmiFOAfAAiifBx9SPPGHR81WBsvzQ0Sc4JrQrn2FkY2BBdhSnOt2nnnATVsDbkc2E16mFiw7xMx/pAps1JJj29C/6A/D/lH0P+j9zHS8TD/6LXayluvVJzhAVLFaqHzLxFX2+51vjaycn+EFaDGxii8JSWcWyHWLe2fyUJF5WwiSebt+3ft3FgP//3G0Qai/G52MwR2zT3OkqiEhtmFfo2fdHpnKT5rWilYtWGh3BhH9RFJrS5acvMVB8jBCaaFy3gpPNo/HKtvg6RraLNiAabRp38WUfmpRg8NgeClmz1EgqQ0HutUxpVWm2nkPoW07WzpNN8W0h6F41krsH+ebgf1qyTA+7nlTmk0jO/abSDQURqdXbRpg8sahBl1z+c7pGoktqpdBzjkaPfL5jk7sZA1AJSZeo3HJ0GneukdlEMHFpVtWjq2EkFdfLFab5lYzC3CnVSdgrHu73X+nG+td0RGrPhURGDK3qvIkrPE4SF1zkp7co5AowmBfgi4SOTZrQzps4UZhkEoty4tJoKAmyiNgTrUM3YBHh396dIBJvglLkGCN69j9AiDdtGa6VPEP/s5KMuqJ1L9alr+Wm5n4dm9uzTUo3KuYvMouSZ6Mn94wXvbp5BSOLXqUi2V0+AzJPEGXW4uh4kv/xAXh8fq3wH3KCb61PdxbFLHFq9D1q+Ey6hIgjB2KvwP/jxCIfr8thDLTl4Wzl52kSdj1K109kB7nCh9ZIMXsZvcuL5zlVTdtxst6OUuU5n7aOE+EILgiWuQxE5W19LQK1KzAKr8y8IgmmRaG0km0uK+X03Vci8UwCNqKDaG2sQRju4U9VOr2dqA4gY2AAWzmlAOPbMxKypUn9rYv7Hiz7P5Z+AQ2xCYbG9bXjXV8zjIgN7n6A033v1b28aYO/qTNvLuApTUTEKk+DJLhfkzW32Cr7eOD6X1aDMkwnY3r37li6bf5xUj41b2vKL0vTuuKCIotQ/mMHbhPpq62Hy0fBWB+oX2VCOQnyY1Zj9LNZz8xp4utbwpFIdgPjh3LCs+OhZauOVNV3d5E/faNj69jqDMZXLC/S00IQjKNvbuYBdYYrSX+elwK109TJ0SZcKTeUup+cWoo7Jj9o709sLBtgISdOdIt5fFWLEE8ijAOETxLUHMRheLO9eTFmKcP5QQZza7wUjYSQGo+fk4f2ktHwiv5E3h/goZHL59qSBHhdBW5UUt828CKqSOU1kCxnLky6Ia8gbdLPdN5k6LI922O64PmJMNjz3pWdIFdluLLGyDIFViHBQeEdZSvDU7JuIOo35KdaC4thQavgj9zbupNVxAkcX5LzUwAz+e6tr0juQt2DvF9Oyo3lD6axG1DCjVVo89mKYWYCMxIvF9X5d1/FVEJ/HPXvD7xcEzCo1KdiuxOFg1eBTVZS3CpGq2xrhWMCgTDKDEV6VJk1AQ+dr5sqiJvR6Foz78ByWEelxDCdTXG5YlqPgd+A+D/KL6o+2/YACioZEgADFjg0IE8msYmrPpEDfZBvwxDxGpCRmMerapGkDNsiXtY3Zm5q4WpUmphrckI/sa8V0jmegCISBE1d6Eq7plnhmAwGjDcwYf3h5i2KK82YEkzIvjg6WwHAm0GXIvmB17DZo6ywy07ANQ22gUV+V8Vx11SEUokFVWD5BMDnseQgwzYMNjSA6fiAJZkDYx1E4lXK4LNhWrzEcRw4orbEOywoewDkHKtFQL3v33qoFMRAxPSHQ3Y6WNIUSR2ZXaKeottEPIVidEemA57S0ucA6cJ+sFWogFFcEAk76LMNHEU16p5l1aPm68gQQsP0dfSWl57Q+5p77KUbhhq84bnbO2V3Og6BIy0ArJ2fZLR2FITjiBD0a294GnvrCCg1cErE2f1AlYc3HGPxhT9L3Anch2ex9qRDTRnbzfgy/Yn/wCeT4/QXYsZVEgotYLtn0oIRLRtAmCziFuPKRvZdlKKeKrYWz9/jT0t/DL2/tY8IVEHdGcq53PULEHcrKYK6Ecngz4TQvNFgx6s+5+DVyBLybMU+0g+1COZ1SBmSAQ1AoJ/jT1gIa8pc3MAFfVo3gEuR96YlHBCPB7nisXk62gBjSSjc2MpIP1vDys5TmeUaFFP3HVrxLVmhHUPNIcg/lSigdtbhxhw2weuYtG0H3iAPWNBxfJ10K8fTknzCt5PtS39z8O2fSc+dqFcn6+AVf1SMOypD9dqGmWDLMI2Ih+NIwLnsA01Wh79uVEfu5UiPvk0ws5yuCZ6YsWZUr297NbK9GyLBmQ1GfJ5jsQjsA0yHmVgV3MTgG705AQIcBL63ZICF2vGEelM6sZFtd/L6twv+Un348Al0PIunqNXnujdaRBpwkDtaX5lw8u0pQXsSaxR4TKVlgGClEv7weqAzEwC8sROclk5aXsBG/avc9iCnrKAdSlH7JUo6ufBrqvoyzJ6zx2lqe8Fo+DEyz5/RqU/Pd9AepkJQlBCod2RuTewfV2jtEiZqdn3t7nyidYPtcN/bN2s84CzHBbzQp6/KmusnM8w08TBNCTlLFMHHcq90h826sErOBNSH/I2Q0/bO/AHvq0a822TSzyXzOmMuuKzLImTYS8QjoGar92auqL5ZJOCyFdLNqSwAAbDZ53YJDTuwWiJUKzwXjznWNcVCNIlYyeD2in3HxZI5FkJSLl0q7K94vwpAf0WoaHvBBATAp7Y0f4rmCX+milGfsKek4CSNcXB6mbDDM6/pqwNxlKo5zyjsjWd+x8aX0qz5dUU2NdzUsHWhzto8RiWjNuHDWg+ZgaW11ALJq0yUYE6r84PdJ209PytQI92XnTm+wXkvXmZu1pUJaDqlu/s6YBN9dCnf98NJ76MpY9yAMUbaErlw6/5ZY/+QihjrOudrLYX5Zr+3MgfWGh5Y0FgcXOdv4psBrYm5aHhdHtcK6gQStDqUvrfh0l7t1YlDN6e+Z4jOdFGCrRvXd0tzsRKqnMow0n77QSXfDT4YXV3owvw99fV8Vprl3QNvFmmxrOpTiHIQqCAZdfvP+Hwghg44d/WvnkAI1nhxYRQ2ZtWH/nvGJ5o3XcHmQkgaEgmd3eL9Qjpk7OrW/WEnUXoKLg1johpFvOJGFpDRoWmDqzedJZBe6CnxljyT5DcYumv9riS0q+X8HKKPTthCwxmFjKD4TiQxxZ9jzBm64tSXbcQRyRnS59tK9Q8ktWTeYVCQ/q7mndT586MgyfnFxpH5ReGlCVESYWQvDHqrTxWEN5wRQuKBI3d8pAbpbliO25CXucJOra/Iztq8zkpjjw1No8OxJbtEp5K/6+9T8q158HqYt3XnTHzPbCgETsrglK7Otd5+8Z02Faxvvg8w6OOFtb9cTUH/vsnree3Scgsn/WATcX/DMd1pCb3bayBmO3RKvQApuC9tZagMCvBCV+HBlJx3fM4FujNoTjIbhtd/fEqD5zgeyUsKbbniTvAdEiWShuubd0JsM45WiVH4ydw8pz6R70YSgfrvxoH5lxZSG78OgD9xbQbF4sRydZWuACupy4/VaEhXMYLmuvNIbAlsWU7lqJaKKYihTofDlBF/PABQfY4HOG5gk2huwyhXBp04mnMA/tsvTd1WMgg2dHu4r5rb2YdZGluJPnIV8T3YwGwGWB/L8o2FC8nt+YdcYBJkUz+3Y6T2M2HAAttgZ+FUI8oiNVX5chOvhZmWz5xoKGADo9yUa1+EXgtnI/mGnDeo1Md9tdJLhgCGJMW/pZz4bUyw+/bBZS1WFDioStV2uRbQ+63Cp/nusuR08ziP2jPmt59PYO4mlj7etqUzjQe4cqP+SOw3HaXJlupgRVFihghVk2Y2Dy0qAfjgf7+4PUPnP6cP8xoTaJBGCcdL9JQZVCHqzmTXunh8pFBH/miEo7Qf3o3zkO53bQgJJn5toKeCKTgINSudR4Doss/ydNYWS7qsvlRde71gpGlWOIRvp1YKeEOfTWnNPulkgWuJ2Dph5Sx02UKpXDXt0t4YGFAvLAAU00PJuG1af+jGJR5lhQyXznF7BNYMH95AKlAdrk39T4/ccP25JBbQFWpI5FKPQP3LRn0J1FYIBA+NEP4L+YU2qoXwwk6smfT/0hZ6L/O9SRZpfKxh0Z+4gByxKqc2WtQxK1gBZQxb5SP/lcpo/Mnz8AMjizriGro/Q8yViGouJTTjdte/jMIq9+j2LBBvB7uV79h7MRM3oQJLnA30aXNJ5EtRuYo7CRojYr8EfS3py87eo/2MnNe8UPVEV0nBEFrQNdO6Kveh/89kUgC/Fvs9P4QaJpfHbWsDdNgJItG0X9cRe8lYI8WKwjFG08EapVPDW9BhvgGXT3dSGOoLQ1vZ8aI9K22s3fw7/1BZ4SpvP89GBXwcQu6QcBKO3D8R2wjSIazE/4S5+5uu/USSSsGXx6kCh5l1HLyxR8e5qqpfeQ407wjWn7Ooi3LBhCi+xAP8qwyiE4IeNvWj+Gj4OKGxFHvYgn/llRjiLCWWxkiuB9a0ihoKBdlvUdTX3XruDYcRsYQuQg5aaYkzTT0whCmKTXAmx6U5c+UZGfRpdGpP1DT7n0NDQzflnPXmH1OKiVXUssjYqN0IfM3VAeV09fSbYC0wZS7ajRORPKVgieU902NPlS+2aMEuuZUYONzdvAXG8aVZFKJat9lWqtTHljB+oi1LiK7LL4klUg5nzaReS4X/GJEd1KCaTz0kFQJ+Wzxt2JLF4wZPLQQoM8SOahzKwiaDiLMA8QBpAjUNh0ceHLyNAwu0mck1RPP+/5Os46qPcxtgLcLjmWlpcf4aDriq8vIobBfzNoTlwn741y7pwfh1KLPW86MGi3FXnLgkeOvOaiNn5p/c1IXFLf8+daMaGgxN3LTisQaIBlXb9kbTkv7haRloiqaDQyPVlxl5CD0kjrm+UxlmD2XO/hab2sy/xMVHXSaQ6znc7Io/73Q2YUVPua4rsCfEMf4T1w8NpX7s0K9hW4h/VyIuZ3GYGpuogfzX19ZQ4OXYeYL767Qa4yYZvUjJ1I5hA9cfF2pLHsAkMTBhxV2Fkt8+3o+CnoPAia5Q8WLxz5wZSyZzLtmpmGyHC0Gj/51jh1SM3jWQ+otvwNuIU7+BzsLGvJXDrE4uwHZDzQTr6fGGN7tyH+M1uLdR55QRpWRjXd5KLkBjHK46Pz49iiQk14MJbNXPRJnA6OyAlaEy7shUqfM9k0Wd0OdzmEozv0Uh7bukRLCZ/bcdXWmBuvcOPNUdENnPb6Egts2F/uQcSQBgk9rm6WjYb4KRwU+YdhZe38WoA3hRrXevUJ3Ga1trKpxQtUhQuG02E9gA9gPhetbxNvL04R3oEmcTYvCdsspnVJWWjQM0gFwhnrbdi5ZTNBDX+HkFg2co/dUmwiOIbhVg3bpqYEWXDRkdUaRxqZKKF6bdzVLKY1FnB/+zbIjs9lv3ucOtpLx/lUxM2ZZiJ6aPcna5LS5a9T4M/1+z4TjdYC47kkFOHwx9QZtTTVSjLJt/r2PNU0tCG+hshwKjPbZJkMlPqU6qQ1F9A8xUnU4xzKc1xhyM/V8UxQn1lkYjEEFggLuI35K1INPcPdaFrx2qnF6xy7nQHceiZZk/JkyAPklhgQo/qad2LkkSJwjLec41nLurfPJngY8rujcju0qQ6pd0XecWuk2mB8L/dFS91g3bE+GrgQ99+hRTwaSaFCtU2S7PjPDjPPEg53bhRCYOq9lDiw8XwHXH6suB+cCRfqjCFb+V8abEt5sjHID9CIPcZa7caZRRkkVOKVnjjvyjVfjKeAiFBb3XaBQRec7Hw2D8R9qgc/Yx41cDuqiXz4ZzcMrtgqW/0IH4760K5hEYGol06q6I0zN86BH7ucCi0F0dcUGZ3MAPM/ov3ejsvhpNhhrc122b6w8WDFzciHEfH0icPvKGBkaRXyKMCcCaFu/yeNH2Uxuxvl3ms/L3NcbR1LB0m0oVp5OL4bXxnbnJNifmq8Gv5KDcQR7liXjXzVjy36dxwov65Z0HL4nOFz6UMHUrAe55NlIEXt4wJbT+iS4/mr7L+oRWlLV910wCcTu1UHaYfHRiy0NzFo8dr0deLhbqccnlkKCr/2JGgOyQM+RaydL59IBSPrColP5jUnTsiTBSgu84n7Jl5xTLbwoOb76kyl8GHNu4/f2gybpzP0SbSv+vkMgUJu+wWZRgkxXcdrLmVwuD4/Nd+xVRBDRVRIP5rCLink2cFZrKFqDQHWeG1hEgAe5A2PAJF+nBrzfHxpVg1jFeC9yuYQPDX0n/PhKlk+HLfRJxLhbgi9unvfvvUcz4ZjMQyStyzbEbXzx1jCBahshoNu4J7MeDhykrEjEnf2WWRG0NEoLJwQgxTvjNeBdtdqZhwmD9caa08z0s85SV77xQJMfzmHu4hbPDzeS/QSAQn/6nDcKqcw51nyRz07HNf0MMoUsNBo8XEdQ8RzMEboJgvbQkylAH2KALXb7+NIvSLh4coh0qjSVdbTr9b2BIPxQ8GxDPtSFKxqhS35+4uVuGNgyhIWgZbhvjzgY2rtGuYxhc4IHRtSQoWfmdFcJRwvWMpPWJPtLmUAalYAPycdZWJPcNWObzKUVeVlzclmGTEb7XLL02aTGFrGVeTDisINXIP+sMEaaKT3BaYpdPRx9YH6aQB5Ey+2EBlYplah4cMwrYjuJBmpg1pQADDeJ47AVJrU95yNAjw3wQP9r2A6JI67g7Sn9QjC7H01Xm9C8wcQc5LgqbFOf/hGWb6jTX+Nx4UIWH27KXdQb7pEFGkfQwAhE2FYAcgjdMwviYIU+7bYY9qQ1Md0Y1wZrq/5NCvJFtG6X+W6UONgGUKUGTlu/1R0B4z8qjF9iLKqUMX35PlTfR3BbLyqGasoGio5cMMKro+UIRyhy2R3wDaZ6JEhvVnfLnI0bQ4WdTnVpoASrZ03sOPINCosooQDte01+lgWZ84l5lgn5KR7/myQ4q2gCDXfIq9QMbcGlztkl+iXCF54UgYZNVxsAqP0INVPrmo/4bKjifRGu9gTqjIbYw0j5c3izTnUG7XXwHIeXyU/kSUh5Vm2aFOnJtgwdq75ZeIwvfpdganL2EuY8NKoSLjud62A8B2lDQuWDFcbnT36j5/hqMosf8LWykRhylSq2vR2fdQ4dqZbmO1FgFbjZ6rPSP37IRCGd/1cm8tG6Ppr00jJLV1IHGC/EZ1TTgmHVgm915RAt0BXZ+44stfQOGRSsuH/4IxHsoYJkEOPUzUny3P4YJQzP2CX1j64PNuqQTGttcKqFDIDzuoalzlAVs3imAAA="
+
+THINKING_B_URI = "data:image/webp;base64,UklGRtJIAABXRUJQVlA4IMZIAAAQOQGdASp6AdcBPm00lUgkIqInplQaWPANiWdDHQ6EMZPginp47FH5x3hI2YMoNFKP1R/pTZZ+W336Wg44+16Z/7b6g/956O/mj823/wew7+9+of/aeqF9BXpjP7dhBP/u8+FmXpF+PaNL5N8//MP9f1r/5Xgn9D9Q73Pvb/C/9D0CPgf73/0PFR1ffGHsC/rp/1PYP/n+Mr+H/9HsCf0X/L/tT7Ov/p5vPsj/6e4T+vnptf//3qejJ+1v//K3gumZCWKA856BequtkBNmpfRLsiyO3G/zl+uoUyzg5pprmi9xe0U1vagW2nyCZAREoDPEGmMceHT8SAA+UWsbHmK4qp8300lGyNAP3hMKVGoHtXLPnPdvHnE4htW6mqtFPyzFSrd75e2Tcae+aa6Y8odadHbQznb1T++F8X11F0omggfrmttjZDRnOq4z8o1pfhzM1I76yfpElDP+mfiJacrYk8yPq+8rK0PwuUqMSu9e6jxXO70+p080vwDSuYKLEmD1rg8Awg9GuCarHajwW1ABeqEZXle2KbvI4fH5QQAFMvzKEkNUTQk1Gw7UCdnAQoAkS6LKgGatdmMkTUtwMEe/jW7iYDmc4P9zfF7UO7DQEy3dM62q/Nz7HR4KWViM20wc3GX97tJpcGgCgEtVwZb7TI+Yuxe8gDOH2JmZKeX4hYbUnyaqgB31rCstQD6iTLR+77dIHBsqBwkvwUzs+T30DN8a8vXMSfYvQYtBXWX132FpxioZZjwFDF0a1b/nx8kxYp9voL/gZ2PEpFZeA/9LGv6mKzdlUp8AIC8dmBnjQXgVpUZDFWq0NHtr3DYlTjt3WCKburEEDo2wMqY/BqESRttyNzkUVF6KaJ92+UZF+0xXLr+YbgXJwQHUK8jkOyb8jfiaCQ4pdiqKsUzPEK5M6B/9dmpQKFlDUQSYfJeiYNvGnk4mj/TBX4yMRKM7L0O4/TIpxMgF094AZ7S77uZBu8WzGGaY5o/aQr1jp8VWQJSks6bVfl+N+wyj0f42ilbAfQqR6zmor6Cxu7AG7xRahBLnnuBx64fQGxqtST7by7f0rKXF5zw4IBvWugJyOG3aCIY6fbNwKCDMOaaESvrC5wqr9W3xFUYN5pJrl1ShBLiPthqdcjZaIhy3XhbUpss+tDkMc6MudWWLAalS/Ka83VWJkhhHUaiEXMeOYY5zUQKtlUZk3gn7+WpqMbiMKccwB+SAZR6CGiFgmsZe9l/tL0zt8VrmWIxLhICP9ne7MIicK3DrDDIwAyfm2ybbBD4/zMOQL6zc+oj2UUT+HsX3QuLV6TXtyXiXrV8sZgsTMCOuRacZZ99bKtdHTfM00k78sr5VpS/nYnbqfYyRKzsRWcbOX2VI5ivCedr6lp0VfmDdT7Phfw3QbIT307NRsNg1fPtDEniSnysblJCwdhknYI9OTnJUsXCVIyk4MsVLXeJ/J7Y5G0B4+JndEj/hp+2ltmXVbHuKSBeJ6dEPEw1KJXZqd7neByeMBvxfuTbUUZ4veHmfbYq/WxfN9r8xQbHpxZQxJ3xCyy/MC/vGTirNXj6ZLYo9niLuNSJt94F9OlTjQ1dNS2qO2mxxwFPM7IeOsJYYFOm9sp6tnivNNv4lrQg8pAFceOFipCH29a3yNTfDBCuI45UHOwl14mT4xjvUzghakehTh9e01a12dQCuVUICoJjs41R1FZbqQfMoGTZrKeHBTpGHEWgEBaoaFngFfwhe1HVFcvh0yeXQJsYJkho9rSBewputOFWKJKKmXVUV/T8qfhRNZI/G8Rhy9A3MasWZOjPW0/VdGSRMgo9oFnDPlWXWcB4ukMAPOZgoM75flSygdeKTf+rX+UCiM5T54b8W7lW4W7bu6XpoVdtGJ84rLMFEUjBL2fpe4myJW2XMB3hm1SJvYy5eY9zXBWeC/0ZIL/tVHNOIr4n7P094hb+st9WQm6+FL7x8i04llCp1pWRf0ivesdWpkPIvP/tjJB+msMNWETGQ8bjXD+JBSZ4nM93hk9jv5RlkZMDXQpDgUGNHCjGLw3TBhVUpx64L8ylrRWHKUpPd8cVCWUgS8g6rhAATez5m9IFrOQmBiPwtN79mVc/TIk/WayfC+NF20NGtfrUzcs4o3Ax8ODH0OI8jvZXVRE6+2PIvmZwrQkwPLpLwgPFcH8Vj1RxLXABh9ND2FKP/SP9mRS2mlRfLasHHrujPwDdNMAIMG2fYtn1Nfe5z/+IdFAzEBJAWVGU8x+YJTPP/tdAw3NyZynzyf9nh1Z7R2bhJNHCb6RhB07bEWq5x+UZBuvuuNBTKDQf7E7e/vq8ssIIQhSuNQTUvvNV5kqEJmCnFCSDRt7xreRYy9EcUgTdFOoDDuwtWo6xBFmsDBPVb0Cwy5kELLxvUS/mgDioZI60VRbnjWxsBpo/T/oCzh5kal8AZ3PD+BWkhiQif4jcKQ+3ZtQTkreV/zwJFHrb5sjOtADK3BF+k7alPRab9/xYLwYYbT8dx1to9Gcq/wjFkvs0g1w+WuVLmyhFhVTDP7h2lWhlDhdU3WZf3HOXHy19YQIfxTOPqL0M3QSM7enmIUVDPyg+yX7i8j+mSriSPWlWC6uXXwFNJ+3J0IyBCx+l2NJQc0O/wnLD8HUZMrp3XOSsfK/cBRbntnzu1BKTtz50c2R5efT2gY+9R0bqo/w4DPvk3JSp4znniQx/BbCDvQPkPSyQ920YhWTnYyt5TeE1b5YVK6XIOqh4jdUTx/3KUL9snJ3Mliag8d6d4Z27Wm1iaRgCwK6McuB13oSEmaJvVOpdVN5RTUS4pbwmg1XqIHGy+/U6LDtWU2CzUBhA9oOnpvwwW9tWAFUY0lVkTmvNTb7/J7Yrec3cA/+tefamKLEeUAZzMPajjtBeBwoHUrDSuMb58QjOEpeWkG0lkK6NIx6nVedc/CgK25CFAqDGY2WJq/J71ynng2wpeckp56eASava4kPRYH18SUR+7lKoJf24w7TgVFucHanLZLTz1/6CNi27UUnMl80po5PQIHqCzeyPXoYysWgMW+4ZaBPPHNPUltKEHKf1tUcyxfIo6vhvM3Ar5dp7xaeGHlrvyCEAltUo0OvejAbfReifWP9PT6ghIQ4yX6DN7yvBZuwlO9tpfqit2JzynOruteeAF+kIKIcEEtYeYtFgqBOmPkrD4n1Tp+N8LSqmMDaog/yUPlAhFc2fB2Ou6aRQPoCykiQF/W18vH1iGKiTOT80BuTNxcBTltMVAUdJichhxdlUWL6rBB1kwZA6N2n6O5XkKLCBYZm3vLjfwjnn8envje0QlkG2siIKf6pYU48gQtUxMTSsu0v74y/2M8XcoRnxaD+TEk6jheYvoAAD+/GJR9t4J278Z9ck7klrBjhlBkAAJcgtLqm2Y2MuRsYNp93JQ4lPKRX0j0Hyis497FRPuqk0YIVlvbfxbOfOSAARrEGmBsVYldbpue6VDdMMYP/EK5KxeqI7qHVzbSfj1g2iW0Igg1n0X8BU+e8fM5KY1y6tdDg3gATLIAUddO8h5a0zZ18X74iXj0/y2jroDKCTMdVCCDa+erDvUI3tH+Z+9bCP+GfxKMH+zJ6ea9iZCXjwAFtuaZguFc78C1mP/16K4YkYbPu8DGCK9hJR893MZdEcAEPJMQmQg6pIwjFBULE49wJrhAf+cC5ejzyxQlK+DovijuT66JK6eEYifYMekdjMyeskeieYcRLl/imExgoT6j401NUn46DVkIsjZcBCXUS39e2zaz1NVM1zgN7gV/fKeRHaZaFGZpUZeHJNYu3aFG7GiGDC7uUzhS3RM4ONfkXZuz0BHdJ8rWiDgTh/oCq246GUtmVdOT7VqZQU9GIsf74ETiK4XfYsNiXg2CnNxB+CKSS9MVyrB8T1GFLRO/yV1jHus/I6Mngp2N+JP1NoiSQWW5oU78/tkkyiJ8SE1cXslhrXAHtqCTzRg/C+35QVIebJezCzm9m1qHgRWBvWqQWA2rlS45+mlH1nNyvjtuNcChadnY0OyTTXKPaI5FTZi3MXCgm56kXSoq9aEAB4gbt9AaJop6dsPQpsSkcPCmso79o7nRodhlgfBD4CYg+mp9bAUa9jZjQJD058UNUsNFgY2OU8k8xT5SJA7vTfvzgKOOq9cicQGuY58ALXFKwyVUsb8HD6kRRIWSJLwU2snU3nIceVkSmfK7/cIgXAPSz0L4CWegws9JJIgx+ee7ofT8gSetmP7gwb9ir4uJUXUX8kFxvBy2mC4IE5MjOrj/8Q2+dkCdqtL6RPl2GpjP3rVRBTdUVl4sk/5f/wXJEvvzu66MRkqJWGkc/4v8KQcEGdvHLHSVfdG9L0aE+mWlPC6udDE5iwBuydIddMZTHZMGTuxnTPDW/rrdHkMF6M06o28Oz39Q/Gx1BnKs8DklYYwWpX/KEQ1XBqDonG2MgS5fzJIPGwrPJpgRjnAwNhxfr3o1THMRn9/9lcKveVIWMHDAUMH+2pGG76eFa4vnbjH1e1Q8yU72AhAZ8QsNDdkGji2W3LgqD5exvQkl/vCudpHeRhpuMeeGAjAUh/WlbptWT0/PACNTdNtYuqR6mQ82kj0H2Gxmz9XYSH9NZDgH4rGPub60MDKnJb7HxT8xmJ1YSAEpWdauhlfULMfShFlSTYIMbaiOJM6zUWNhgbIhe4eFqWBU/aMrUSRPF67YbpftPFI+APnPO1Esva2mWyU4WlE/5SgT2mvfMyUyVtOSGAXFrT0vz7doliQIe/RL9I1+qy3Txl/zB1Y2IvRnaADsG/TgGuadZCRUeckh5QaAgFx/ChupEsAPVFEWMk+BNUVASgSOaPw6LyMm/CJn+Zbr2IZy5Vy6ZdC9KUK7mFdvcZ1X/5/yVLm8yKuxbtXJsHAA2YRM91JSOOmZteNU+klwelXv36HS4qN+zAMpjlHX7TC/xIX+rNjAt/InhmbW3sWU3VcolgEsUiXrLlWmCsyQRAoJ8iIcoqAloqNA51cW+YGsXsBJg28z2cDxqGWe25Rn2OHtECsjakQPdcTBG0VZYPhIEgyIcE3Qm+q3+CCv8XsGel/+cw7slASa+tUZHdDKM20/8t0Y34S1HcmFI5teg0+Mdj6XTVy2nR/SS/ZcShfnAm3bwgqrZt1TMmUSMkzJk8cJjcTZEkJ2QF9i+zjpwiy1KSs7F2tB16gFNTZTVX+GfYh+56AQugybab5U+ErH6EEK1cAvfrRmt1XVj8g7sPmWf3wL2xZesvUhLAKzi7YzcUKVPN7QE/CnCJlHeA5QDodaZhlRsN00Y0/ctC3xRt2UOEJpVR1jwHeVmvLSWbTTS2rt1QPNC6OjB/dk//Vw+h6/m65Mv6ge1WRquEQqyLEvRQ5E/yVxHXTgcYxphGZGtt+JXI9X5+a139ahnidZH/RuNh9aUsDUiC5S/9tufyKaY4Dk+dFnxZOyV816vk62BbHSbQYtuFNDBa9EKninavPFplRZ/Z3gq40JjxmBTGezpnB/nv20L8Hx+lzw4px22hRkdS4CP7YB9X2QDuzh+JQdc7XtyPVy5TKqiPkixcp/nd6/5sNZlSlr1rPQ9xP6iqAkJ3q/W8cwuQFWuFgn/hEq3WLVb8GU/1OdsQP8rWX71pTl6/lbMnbDPrWIr0Lt5oZY8/TbmzRX6dQiZHXvAaXPbLfhZOjUOBwGJx32aRg/1Vr5U00gX/N2fk6KXbpO3cg2kwBiROD1nIasmDc1i/gguP2WezovHJRgnqBdMIKUKG4tSu7pSgZ7/+uA9xjt7ofYjMgObF5uiR1/AesuC7yGckFSQJ0ke+cvy2cjxv5Eus9m7ztq8R7mjjA2NoflrmkbHIL4sXHi6QP3fm0DQTeotfc11Ef1+fw844c9AaAV/QhKCHatdnzp59CSsZeDhElGwcJgDrMo4iIW5MFVn9iuqjRvfEMpHv18c72PE65m8wSGK13ZRpEj+L5+VPnMTlXhJrEwvm6Ri0eALWkitDI2XCqEPgQbr0G5qmn8/T2Wve9SoUTBNTcSaOShP66uvj7LXK6dcern3NRa35MinFXeKvd5PZgHEhwlUdhl2gkytW+O38w1n/DfHi9rjfVv1Em+G8Ne13cz+cpQT77BCjA0YhZ8T8qfjr6GfK4N5s7ccwQ3M7S8movnLTrUzPuOuxoOYVUvr+AASI7SoavTgv0zfGwKoiqM4jaHVb+oUfIda4xACFJzR4cbB6VCm+sz5vr5eWyZ24IqiBNlv9IJYgdiVDdzRC1Jsyr9C+UJOt1EWogafeFX2QK+ZPUljoSOUYIO1bT/sEjEcxpjwAZyyjohijrVuTr5G8GNpdTtlj+g/+4PJzfbCg+6e/UgMlEpKPoX79hFMAIJm369y4g9cOvLjNJMiOhOF/s4MrgI88ISDBh5u57NQtCJmQrTHLA4rX9jlLAK+IN8fP/X9M6oGNX/z4QTAt/P6hm1NNNIYkdQpATRw7WL3Nx/0dHjvVtu61G9AXvfyk2//XZloea/vX0FrUKm/HweFIXyzac6FJOabCAvWic12FIHvOqaOsyL/vOQyETLh9vPFoWvmV628IS5KyN73WvguT/4h1vtqrLWs7ZpdoqTKJuwOU9O03i/o4nfPbKWKhw8Mf+krpBk+hemDQLSZp20E4DOIz6hu6TyDRdGA/iN3WNivZI4LdR8nyc4NqInPZjSP3hvUolFOF8+yMCjbGb8y9XIj9EwNOKeoY6YGPLjHi01WmJJdp+CSLG1gUU8080XGueRcBJaBc2xreQjoQ/c0pRl6/mu3qmurO/Nv8Y7SYoj4x5dy2pNobmhf5oc6oJLAbjP0SXMgQ0Uil+A31ecan4T457/Owhm+lXcu+xxs6Jgf+B80Np9pcUfTyvDaGGTV1xk8106N6wDg7lXqgVbieivpQsM01meEVar9+mOh6KWP46MFJupqbIFXvXU1Yf6PZ7XS6b34aDOpUyfjYII3GXpq9VXKW0w9ZIVPjR5Dfcr7myF/v1zcFUEZRNxiqLhrw2JQmtBSG15PFHM8UKX/WEKxbFvsvFjBqzRdpb57GluhuND3VK9XKQEy/QCs+e/7lMX6pnam+lnQsMhIz9bcJg1sYvvPo22849W1drP4t2OQyRSNn/L9KdxfdHubcZZaiwtRIEPtEGtvTDedJ5jALJ23vlhgypc+0HHTJVDScDRTI/mB5UEJStK9HGO/WLJHWlz7Epqr8tnH3tLW/ghKZSj9aoNADIBv1jGrnomqkGNity7thoh69Lh+LedlOP+HdVCMwse60J19pEjHA/Pnc7yHMzORkwnkWePDD700sAYs4RdjWvc6VkGAwGYhIu9PysKVk9NLLtmt8QZ3b4UOOUBy1jaioq3QL1H0BaGLRzip0kSXSBL/ZJV/CvL1/FGNPdbPXIAkaG8CTO0PxNFxOw64sZ75p1xxBt7hwjlT2PyYbmaRDH7FH0W0pjz6C8H6m80/3WhZN0JGdOgTZPoyEDutntOLadt7wrhA5av03aK5OVFt7KrXQWHwyrfEkyUxcFkb1//ftATXKEH/agHHt3nVYY2EYQ0ejSVy15rnqUe4BMdvyly0SQfJNVYY+mNJ9DVWNNRu/w1l9W7a80Zq+sgS08lG7i6AI7M9nJn8+aqOJO7FMA2n1tuZusQL6Tzt5if1dOu1FuxJVZo4GnMx5MeVV9pLEZ1EuZDrwRLt0reGfl1bBpo9IPAKt8mD9A0bkq1UHCeJOLDXquMh/hc8vS+WkQRI5O8tESyO3ahjHmpaK3BAv7bn9mmTljwNLr/0bPtf7Cl3aeVwBKEnCa5WJlzJ2686iojxp3iJW8du+ok493j3J+6cJD4kY7Ggs4cLg3r9bJDiO4riHKG3/XSUbuy0EMLeKJ+LvQSC+gcAoUsevYC9tZ5tW67W3NAnWeGXW5cIKNPnjrHTWAlyBK3qT5QOl32+Sp5dkJiuJ+tRO2zaGnQNbR+sh0sdl60oHrjhsbr0pSjmq30JG4+NmUuog7T01jTTGJa04S0r9DY+rZlAW41qYvriDyWSuCvhA9WSf6ww++qEsepYd1yqNaBMENsr/LTPEW9JDKD/bw+cDt6jpoz+6Y4Uk2hByhrES27UJgAgIROeNZeChJAyP0sJ0J7Oiws5JwfRd2+cRtmhhWr2x1XqDalucv/fMVsaBwaC4Ke/774TNkWdKK3i9WfPWwc2cPJt7VZhfEoUEbVRI7bmVIwnzJ4MpDFvrCeTPzYpyJCblPniEfPUG8IgphCjJAbmCqlKPuuN4XrgVICr0+S5cUOGJKmdCm/47BNBv6IvghGo60vwu91BYjeNFIlN26it6+Xo6iSffrN6bAzrcDzAnPK8BL42T5D+gjdP9F2Vh7/6BruZNu/e4RF+run0EOkS5frrTSxPeVAL8F+b+m8MyI0jiLfsL6T70CSA+h6p3wGxcX/eg4Kz7/OdbIDfa0FQg2/krUazp5qesXI5fgmY2VU1Wn95tt/Y/5DYSv/I30GYLRhjYGQgxWJlK+OJC6tKfp8225vLGAJl4zhep/RD5TTmd1SlhA7MFqZAcM/GRv+c9Hnt9jCrQ9bvL+BLhxmfiw0pRVdh5TTNAOIMmYLyVTUBryXDmVjqoVR5XOqCBq88giDZKs/wHCkSjQvPuJofA8KqV6zwPf6L/WugMizzVMdvVaLugUFy1FKWObhN88ffgAJwC/jSM2Dnok4xL8yErYLzJmXKsX8wQMukilhJ7GSFd3l3VdEuOaRN7nox0O+JjMMGpWYLskzhnN3W419uIBCKfFKLffnWzb1vEB5qEQzmGuRhel3OQ2Bwo29p6SxyXpyaFGDGrRmfSYYIa5W21HqLxKgjKqCvBPjo26lWMW1Yd+A9HfywdaeABGNF7x0UoGSmssoZyoI2O5R80Pb3qkFv+5SAC6U85kuxePzAS2wM00NnCyuSxGBJyjVtZ2ODhmY/6re+pCP3SWwu9Ngt5syNzcCGFV4olqIj4ZUZpPut+oCucoZqiKbHQ4sDe2IluJAjNZmSqylf2zu/QiihPH5WFyvade8nk5yUbLmZu9RoPl/cNqKu7ZaxTQgqCGRua3Bq9x+K53xKok7vk4mCRRVFmYy+cfkfxxm/Z0QgMM5bUkOGN5ZjSbYj1SeRzh6+9u+JrSgZo0uL18cAaKYI6m6YlNkT53n2VRRAgcJX3vS23eYDL8POJU/QsXdlkhCXUxwNijp6cxau1Fr6s1GEcwvJCvIpI/AswFKTsQpF93Z9RNJ2Iy7aPjc4SrsWkqd4oID+jj97upTTJuyiwQcijJh6R2j1TquQSKhGOlmqMtF0WS1OLDvnjq3lEEZ1wYvuVb6khJeToaUNpwdoULbSwy8c9UI/9QFOjm0L5n6H8ntz3oDvhTZUm06F8BKp+l1Z0M5z0n6Ym/fW8OqS5zvMwRRM3312X+zQUhFy63DsglaFbRrhwo7vSAmeWTmHJwVawjHFYKBzATL+1ecOQQ5/y2LPl4HZ9SkzbHxX9OjPpzgR+t7h1QhnS8aOOVOb0Z64wGI+wc4bMk2DO7cuU4ADkCxdjvSy2cKQsbtd9xaQjPLf9MXhD3gvyrh+zntSQCnCZf9VFulPQk3UK54/ag4PbxQdRRkh099yOUyMZpfAfhz++XqgJ8mNsc4T68Rv8gUexQv2Wy5GFNHjur8nX4gFwsOKl63Y00oSaUA//CZg5qjdJoR2KZMvYKvis+ghOT466GenHnAQIIpKY6JEPokfiJTZO5XjazlPGDGUvJ1+BwUMNVJZFZrT3LkBI8QcbZUYXotUkAw2vL3Qt5O+Zpyj6d2gU//CGxlfANU2DkZSVxKzDuIfz5TCp/AxgHg3NZiIxGAFMh521ikwQc6+Lyinz/Yvf/oPhYxd8jK+OdpBwXQMGiZLTO/NqhMLgLqij3ZTER4VtbxWRfU1Pkrd5TcVXRdoleCCigQFB4FrZXo63cRtcCdoar/RHq2nF3ak3tO3HFlq5UzbUi74VdjPlOEm2O06ktS7N03O1cQhsIMm+ew8jBsjivff3VhE1jfLhhcKW5VF5ftdhNTM+hmIn9dsZtkzWUc4Ik6KmHMUqidrbiik2H3UacFlnzOb6oMKSUUpPn74lYRlXXVBhfBr0NF7n/PQ6kQB9hFfwguEItvqAPtl+24i01nH1Ju70f7636WvA0PDLm1KCHyoWIzKheDiTCECzPWVmpeutwEEI2KfHnC0jYmGGi0Z+jXiHYaYoUXTJJgDoBaxaiKj1qrRA6gZPSc6MHdb3yxvSS8ORpsvMHxGdunATg2KJnBzcBtj7GhHH7bQhiOgqJumbCRahKWw1xhcbt9i4IOyvThGXFW3yGcnDSQ8TVBhGMIH79bzje41MtkdzlnLb9nEirECl2MXrvviWhfAeasX4C76KF+BMPqWV3cGDtozK+jXJrCZw6w1NWI6MLGVwYERqnYzx6l+89Hez79mTa/MAqMfBoHQ4gMnQRx9p0lkXAg6tYYvdzh+1j6IRfSzPBcKoSj0uL8OOyxexcr7Gn3RzN4dewUGUsFx7HgLvjneSTWTajCV1JE2tNP4/4CZAo+al1j1ThLpMPGUSruaxR152Kafd0P3SiChNIjWf4liT2hfzQzl7pfDRUCfhAdmjgZBiDWCZoA4gturDrZa9TwMq01n6Q5I/2b8KsrT8luW+RJYnccgxz6Rm8p0GVYMi+MeLHK9L8Bhbmd1T3+ooZbHLQCUGTOPZU7QK0IzQHQ0miqeOTDvBggj6P1mpSDevH3HQghp/IaxtdI0N/3hUDipUwm3dTbNeHf0bQLRXqTyvtPMfgcDyrsncaTtn0FMb7w1Wz+uMt+Hd8T3Et8bNOZdOqECRT9Ib/4xpOyHApEc8XZQTrhDrSZNiPelKWF9+vLXgk+NCm6jLvXUNvKvGfrgWtLk46TsqeJPDfIqkcxZ2rNd1DxEyTsQ01uGT+fXJGcm1LPQvSlzQ+fF0H7OYqCPWjYBlTx/Ad3T4iOcwAXnDRJytTid2A8R5yT4pj3DyVKmpk+E7uF/VU0k5m4utLR5tTkwRqnKQTfPtQp355uszRW53mUhcYtcQb9S5yuGyOzUNDlBSsmBhlLbgS2lxIPWjvIFoMTvUmR6JSPInEjO3FtE6FYR2Hn+9u0tB7BUKkOK6hpOWtX/BU9O3jS5K8d02gfsbFcfNESgMR78FiP4o5F4MH2INhy19oAwQIFh2OmOqJrc0VNl17GPkQ64EdMuwgET5gQzgfNGL45pKszmvrzJkRXoLO/JagBcaJsVxg44qUXOsTn9R9zUNQLx4CLoPKNttwG5ddpx+GKBgkfQFvxHRE7vsyvgzcaMsF4PTiVd7NExkK1U2p81gyxCEZjnZga7AiMQxi6O1EQ+Az5VPtiosBKHU0py9VMUU9Ru+qUS7iAlIVyah5l/s9UUAqhuYA2Z9Gz5cUTvq117SX3Kon5eTTIvu/H7PbF+2b5BtvcqwBQzHe4DZwnkDU1wqmAqCNlfrrq8SI/Hhc7CSJIko+NdtOnWqYfzbA5JlugbMs1wvGZhL2wlfZeXOsb8ePT4EGwEQGFoE/uKJNpKSADU7BABoKjlW95l3X/Sb1BOOQCZhSuuHnOl7hZB9OnTciK6vOlJwOAUdvKBJrtXRD54DLdHSVdvI0xFPm2TDyHP7QdQEvhuKF+TXoDA8iKeNSnE8K8f5PINnunXFKqPFgKpLb0d8wRjESAVE1qNkVuiS1DUVnL9QD2bg1Y/ep21EXAUenaRy+bnW7SPgm/nhj+7PqP2h1s+v+1e6uy5fXF3EhvPTQ9eEeoVSsH+FvXDGCGAi9bz1tYFzbXmdqZZX+SY0GMsY1cfkF03SnbLzJha4KZjdazu2lqfpP9Ju2Gg2kKMJKh9j3rLbJe6+0JGPGNtoPZ8HhwgwHBaoAz8jhfqAFdBX+k1nXglbGW17y9SjHxnMcrqPon7KAeUtEju3qUyhQ2fz43nmLjy6Krn+rbO+FjbcLs/Uj7X+cisyJXRt0zPxQO3lcYNYRjbgVBYTUBGMCQfasoUVHcJPoU/vU0x7yT5gCS4KzQXPWjY+2BW31igBs6asvBDJy7rOFxcXjV+8YJP9fAlMnioT30/tD7Zh9DL09EXPbfdTyfkWH4xg4hcAaHnK1vyFb+ncQNJMFuTp0xhddODqpsPHABHcRW1Wleg4frKuqwbtPyUldUXZNoCsbcLEmvmvX9gv37sGR8DokXAjxL9yt+wtfQcqileZOgUcWITOg0sxOk1214V2zk0kE9f14cOi89WRoOoZJDG/T6lVNpk4bn8vDrv1VJMuTEYZMCmp/FbInvc7v0H3jeIqcioShcsAxCzDscAm2sjdM6bI6EOWkaZKQLgfCFHvxVeMrsSsX/cu/t5UOcyDtURnKoII6yRfweDkei/KBkLLdwvWRfp/LVPUm0TFZs0JVprnEkrIVjjIKey2DMrmIPP88YdBrxeFi9jizvAoC9jgdy6F0jkK2Ti//UhY6sRRZ1LQ9uBCLlUMbL/CuWK2j7ctCKinqkRVrgVg3Re5J+CjXTiXEO2d0Hm8KEhhYS5NdL0C87YirGbHHIKzz8l99Cqzga6EJ5nLwzkkyy/L8HxslEUaLxjHMftC+jLCP+4HhBt9Pnxf8ss2eLV5haYOalaoC37qrUvZJJpQ7gnsEqjMDXqh0JYVHQ+ZvhK8710/XvNm34kG4N9uHsZM15jTZ344OR3iy8UYemjPNUNfZMvnbgtyRz/ByOwFsTMD41hm6tzr03UrtAynuqjtxDOQLGMEzHbBN0X77kHPhCD3399NM2PkSvJgyEfARqDLg4STO6ndT8MSBl2nGrurERo10OsmHtjEoiAg+T13Ef1yoehjAWX9puFoDBy8/977Q7TsMEz0jstxgN/UFzwOtG1efp3GVEOkfPLCj/M46h9H5jdHL+I+vma178P6y/rdW5QxhUX3fHCwdOkHWmLLIK9qceJcgaQ4nqxowIH93lmsuS5bKQ3At0seyfrecHvS4bbEjAfLxM2NfI9mfazdtomOe2uBUWb7++7D5cs9U96PLaNzgV/iUD2pBcbnjovAUjoCPY6QLA05a1LgxyF4jinP5QhhVdppZ0gcXmzDW9pqtw6ZGt58F6vXdRsAGvcFcvfhNcaLNipQk2LvNjCTMA4coVH7dOjQFFXkzm3xBKItanLesDkkqjGREyxc5/msI9BORdOufRXhmHMxNNbiu692LIWw3Vn2JuFdXQO7GKk0uurWBjJ3pzytuK3xaxU6lArOgIkFILuobnzNRUDfuodMLmRvOcGj1+hKS5jnHGVXAnB1mjXEzwiFZV5jawKtpL6KqkdaHHRE+931klVVY7migl6RjTG+am2TpTN++K7Mz3qJO6d/aWUiivG+0Ja24JIf8W83E25YZxDOa58h083TrLXCC3WElOtKLMgyL7laEtzXGzm5+1/Q1A5JPDSCxbPtxhNCQWR0rRqYuRWgZ8tkbh9RsjnggDGqRTkFDmm9hJOO0+kaOF75NOFlxJSZxAKdIpvyS3JQTIoacsAtRlRYfVCwdL4xjLpI5D0jYCQK5KnNvdR0VLtM1cBNEaPQqR9w1YrY7/iLEjfmY6hPd5eah9Wiiq5qEpa7sz/+tMvX7yQjK7wZHNpROpaxR/EvShSVRfSC1FddkLYroNL8zbJZmSHZ5ufK6D8JS1IK6Tkdj7fKRWUPVoHX9FJ+5t0ZTEt83o0WEE0/PzXS8KxgHH4GAKKD3Aq9wvcHWuvXUCHp2fdZ/1cIABwhKRgk/Klt5K3xaZscxCfU9xO8YDtm6AKTkSDL16rZG/RV6oMxEU14dw0STx6ZEvYRXuaiQpel4mUmxbFDr0QbGNm1xQp7vWF/PsmxqmJUElY5Dd6YiFsUOPtcLxvyBJfzhxl/Mh7elK2083jMCZMrFCQc3tivVCsw6L2fQsdq1ImTPrsFRsu43YLpQYe6sYKUpAoSCSVph33QR/xcqYtZbu/+Oz9obUp3GZY97bcePv/JBIotQ28tJWXWgMvtROLqI+if994/ll/i6FvcfJ6DKZsCAv0VzUNdzuwf8pwReMJbfQqy3Zoh0bpKgjkByP5R6mLUh0A1l5oV3fCVheMipjebcpvJ1ZwqbpwksclrVIQ/cy/QqAk7OEvyAUBFfQgmdnGcG086oL6cXyY8SWEdOLyuyu67+gmzwBsijMx65WPL8fk0rm9WEUuQ6Rg69Z0qZ233A/mHzuvuZBgzX0wPJG3u1V1UCdmzOXL/Ivz3ObCaaNwyOp3jlQ4uOB82Z1qtZVqXV+gGjCKBnawfGwBWVkMjM6p+Y7sjOTaNWgtc2pRFuHNbCGBJ2Xyen+uR9m2xyH10wyc2Maov2+AE66oR1z5Yti8TvYqCLpv4lo0gY6xNGo4qggBnZ0Zu7y0W4ZYze25t2dcHvnuvif4tTyr0MkEENGv1LtTT41FUlwIlu/xtSdfHgLXa6ooavorvHYEyis7tfZHLCYxqjO1ODx3QMKzAXVQQoXbPPr4smgyrgPzYAowdNNe5IT8VGzWeqtL+rSIAyf5HmGj2V4eBe/53qgGgA2m7XQ2QQoVc2J41CTc+Aj4dDEeBQbWyOt4ZiHVB/TeHBEapSUBFe3IAK9cIo38Rz8YfrnExttrS/nqkCOC5QGLUyVqjNWO2oHeJ3dEaueiFu7PK3Lwpz+xpDGa/0/aEIVD0OY6RBlVtosOoS0x+zgZ1F60xjOnOjGTs3GECrT9agahRTbagClth4ntsRIEEpN/LacdUYgfwC0YCsc+GNfuR0V6QIY2rXSOdPG9YYB97Lai3ioO++pScsaxc3u7Kmmc4afKy3YY7zUiCQcA5YIJuvFYdGgp9Cb0aTFOpWuQfxwgEpxMzJLHGGXv93sJdXxj28tgAv0csWAxFmhLuHgfoLe1ozp6d6ptLIp2VARE4OB15jogyuAG+tPdqKAcwzMwUVt0uC6u8yvqwkx70Cd/NdHhDKD/coHKfT2zOO0WJYchHrP6B54c+3MtrRPBH6jbgJMqjHtnpxgDO21GMxEGWiGqcYZB8uI2xBJd9+OUmRb3tlCYSCuQD3lcf4lQvqFuL1iAZfDRbNx8Q7i6D4WQsvEgIABRYZhciVzB5JiXa2qcrNwL7+802OHC3nJ18NVq0F3i57abi8h7qvbVzJ6/pDScil4A26WjwK2JfA78BRI1iSAaLoHlzUl0LqIpbIjukG06OlSQXdsM2vcNG+eBjcENqkU9fcpmmDToBKqRF1u9Zzr4b7Ksjb3EP/KXz7Y6Cus8oQ8+0y+Fx3JvMYdn0KG5e+sQVR4EF/5Nj5w5iNbVsKSS2iLfF1RJqkrcQiPZU+vJavAEwixl/qmrI9hAYQIJ/EsI2YOZLlBb3FDyrjvyxsZ/X0KYqPfKQRbIK20yK3oAvcSP5S2Dwj1NOBtj2jzjjMwbeV2a70Gc5Rs0mTiXOIFBilREYrpef5KbQQ+JMaMrqIFYG6s/j7CPYZn8VPr87bmL/MSCk85GTgp0aK6+R55aHFdiw5HlMzEaNFBWsIAhP2Y2m6Djgq1sXGt25l473vkyilwlImrnf1BpCRD9kfsk+iA4IiHj0ooTNrneA+h7659EigQRG2xdT4CnogN2BUFGraicxz6dwRXFPLymu1R0xLfP6KpKsPtDfuBrDmhJ1MZpuQeW9mhQRLmXEe7JX2YjR+/pXRBP2+9laNp7UZ2TCB+wRtnKCnYQcXHC6mVB0SDDgOeye8ViQfJ+uz5m0JOIBL2X6na4cj3lZzhyrYnPF2VLVmqMC1yd2BjecrWNjxJ1B95Iqrk95fdMHdSfyjZ4SPxIjVbL4CILURW0BGiJlUMJcHZGoQivSXcVKnBzgXDyIMK/jWws2TovT6lrxgePdph28tJaozS8UQS+KC51iF04X92amGc0s+AzrQGUFNh1/rzfPpx91MwDXBokifnJHfiSwNErzsknDwoiUTIeFDNPkjmgWx0EiaHKkgXXYZkG8IscxArC/v/uPXGTG8UPzktYJPNbvbNXiL4g/zAg3Re4JJw1UxRGC1U1lTZ6CEQaobKMuPTilIwyx/Mz6V/r/BY4YoxLJLvxLMlJjuC3U6ukNSMg7o7xV+IF2NHpFsZs6FdquqCG4bTg+YVvla+QxHFybgfAa6pQPm4U0uAJ/4slCJLVgOJ8zifgpYN9AoRZ8GW2YJPoiMX1AZsxVU6VbmB0covgTrhisumvgmzPNsvDPDQSkM5CXR98PnzZd8cuvGtLLLINDh8nNEpayk9momKCNIsiwxDsl1V1gEcVAPjVgVfC03v1YuMUSGpvPmCVijFaJWvUbr47lhKJZsMlW1xxGabGpCocBOd3pHCvqInPPU6X5JDBD54B0m05opqRMmptOnJe2AVq3T8mS0Ou6w4p9RLueVdXVd3LJnUYEzQQQWflHt9i5+SXdKqF3NzmH8woRyDyfaBTcR0HAW9sqSyNwuDc5Q9ItZDizhh647Z/fOF7HV8E5PwZip1aUu6XxcTawNDFBYgcTGu7D5XMY3sZGXIsdStFAgkk8o1IMUF2ehQLEffpAD3kIu6JhrgdU+WMfp2XvspUskUcf60W184HxZqRk7h6vA7NrXX/au4Tosuj6QD1bPR33dbUTp39fxA7u3E8PaVLpI53rGfe2fL2L+oLjNqHPwmiOt94OclgwivaAtFdUa9LZiCpn4T/C99T2zBb78Dix5Ouqal3/3kagnWHrOZgcb7P8XLuRkOzDE+V8DPfC8X1Luyc05tccjQdlj4/8p3ldeL7yjSfGFZDJkBZIs/7hJsCn2LKNNWEW91WXsEq2khAO+r23hpwC4Tx28VXx6s/e8+a5XnyxQrFr5LyEJvRjRjYHiGkTxl4iVYtng1AJODBzSwiC4z1RWmzPYCxKMK2+ENMAhx+8e4ZE6ULt5d6qp7Qy8pOelx/1ts3Cq2cHFg6546SeJTc4QVXdb8B08S3HYCLzTOTkGtOWE3om/ERmion9C2LelDUdKhXUBUZU3uXRor6atAw39YZFf1mRAyaw6grm3KCmvZacIHhZry8nJY2qivblUytM5Qf56BnS9wDqse0akQuggzAUdtmZuwMKm6tfwr5XbxNqyqlriktZ3b5e2mBXsmHDX/9CtlcqQKEbKB2S8v5BJtyihHQ4X6YmY4ycroA2Bju0I9jnB+y1CwqtL7Dm3MOlwUiOeOBPa1VAr6HvODgdYeZOBZ99+8RE/UNbPgpRt3OYuQeWMMQ66uTaOa14JR80SPbDykTCplSNXpSRsXk9oJQF2bmuveGXLyR1nyJguk0CY8/QlxWWdSwVy5eY0QSQsRI73Nnaz7iNJP4wkWXcQFHGY1vfufMd+btWkD66g/kInHqBSsw6gJ6jBxzUc3ZVLo8xW1+ejo/uB00zEoQV9/1XQPzKtuRi9DS8qH7DEcVINxtU+xJYPQlJ4gZw0HQ2pTZTnhCrYIxw1/a58CXm0KyFL6sPhZAGL2hvihz7GYs8RgKrtGdYlYrFpYRq3/ghFl0h1er9NRsl2HLoygpGRwSmk6L0k1FeOvV66atVrIRQ6CGGAA+oz56zra4VYmCBFl1biw5D8PUAPgjxYXoqSsFzpbWFWsjCb84tY6UTk3W3G73oQ8GJTTfnfcjToaS94QBfig3hnzuvfR0MwwZTuxGyotFI/cD1JSPbgKsslKuHTaaA6YET6sYLv5OLveyvULnk/TleOYzsEZAXDRwbyGkXyckD+Ghe/PXaBmnOlXwxzET1x+N6qgBz9XUT4uE1CgjnUR9P3vHSP54nxlaqORALCzRTwtkFKy7cgtwFODiimqp4a+0JCmEbVhuWnvhpXYv7biOxJPAhFpcHHbvabP96NM2nvZcA5kYJAI8oLlsHX1wkNh6DehizqNMNUYI/8NsPi8fz8YkTUDt5tr81Tc5oXF992QQEv+WBh/4nj74H0mFnFPfkCo3v/7UDrprmYctS6CoUmfAhE7UrKAkAGwRY4pXfXo+iGq5eRnFXquFnZnmXOKe1DtlSzpzstODyyhVTOgGXQjJ1Q5lLQvlaTrIMvMRrUZafD7TCW5EdT+fBkQF3b+u6+fCBs0mOcmN+VEpuW1ek7ozA05Si2A74Vu1WxNrjgSd+vz+ppMmaSw5ipjocA6+2q5RjqewFkXNrcloIe7VoWpkSFyrTDh6JAK30rPKcXp+5qIUROtN/L9lahx0axQwHGJ1+SVmOFz2WGsh44Bjr1msv6pt05mU3/RGtB7vw8flyRoak/JF0bSEgkzSI+3S0/Wm1aBYEbWo2Kmame1CXwuiNS+8iVO29FAsTcXKK2t5Vh0s/ydEk9SGoyh1YOiUo37+EcCvuAQ0iAn0eZBWnyysbKipVmFsDNWQo0wn7TaU4llqMIvwfToGdJV8SsFNYlacHJSlITCCV1n/xD1BaYm6cKa4FTUvInxUiaX7H/uW6QucuYFTp/BEyeD734cFdHMK50a1O0wzwexaPntISZHK1JzxCsKM4bw8hG94oyJZ7QBPTrP/sBgL4Riv1/WoquaJl6pER8wUXfv8NAYa6NYRm9mIH1uqKB7ToWdkreej0b7THFLEG9KI7l7NcrCVQS0xGxtlZn18Tzk0KNzM20ACiI+SOM5bKZ+N9GHUno/yr5V2qFOBN0Pdtu+c970AAeqqiBX+dzGtZKimsOqoOofxRt3R7w2oQZlRL3nzdJirhmj7Qpm/IWv11M//w8kGlrGAJSvPPw6l1VXeYw1fZumsavkr3wYWEUBws96Jo/DRcBcSJ6IHh98hRl8tGRWXnO6gpoLnQ2vDC2NMMZDRSXSXfNV32ul3zt9e6DkJxZ7bkeeQCGe+i6cBlnYAgeIObXy0ZJBmYdcGAa4bq/H8/lAE+JKflGy27FUcwECWK+19v5eGLBJK1mZ+CTvTofQsiIu/4hhI/6h9UWO5HDgHcNL7xRoGtH+xUCSBCyJgkSF6Sxx7SI5HmXMMQGGqOaoJI7baS32lD4pMlNcAi3QUszb4G6tffxxSnlUZ1mokE7FrtTi/NxnK+r3GZr4uJZWY/a9f+3fbPVoV/YPDraaOn1qADwHOWQd0mcWGqNytTnV73JJU6fbZmch8hhbM2Z0cRyWXt3GtSIyXshLn5pcFDqGYCo6jOBnRFdm2WxSoIdfeSgKhFwmpKAr10k8y3LOa442S5eWEBcydH7EtBXOfjnBpz13eZ3IEuypq0BKxIN9FToDa/r0dIZ2fMqkKPd7ZGBBOf169EqNG9iEHoFcD/GfcuXKJ/0M/rzrUZLnNWFYGXVpYZnawAupCbWr88aJM+ireRU3LRV1NMDfC/6wkcoI/EO/cZNjLjh9AyYRVFTyqwlUP2Ka46GnKoHSIX4k4RJ/eKhGhlb0+gbAQt5W2sMYR/v+QTO8+Fc0DmZi0pCQjGBo4d6ogqX4YUwTu0Dbz453fpWw4wZ2r9iRnThWHkpVVH8aLWTTPQhoEc1x3+wAhv+pZL1bMZb89XacEpMnpss1byLYDWjhgDb4Dxm5smKUAd+WgpqwQURsx0cwjqL5f4a3IY22qyQjEvrNXiHil2QIm8RGrOyAmildKAFmXVJp8yb9V2KodGzYEdjWG8yKBkiesNrnjue2W/xeIDygbigdPPcuNKwHe7eNlKqsda4S28RLdfg95Wgj9f/9sRXCKfscCfGiASSGMGeEYOkAL9Mfx+Ek6I3mHCGCaczBxSI1fyvBMeu8d/xeSPO2Vpj3qI1+ka3Shz8t37GyFfp3bcJVyVR1FylK2b7QfjtapLYkiFNsz6/NyvYt0tfScnu76IpvClmKfGoHvn6LQxlfB84a1ZvrhHGbLGugPuxWNsMx61aZMhpadKS+t8uAEKOhlwBDfFtl/f6l+PaB+DpGb+pIsXCsMKYi5Ol6xeGy9BJOYInWYWzsPsnJTcUTcjtLss8lgU+kscyVYow4V1Baxy1p00qXG+AS4+MTOBlddJlhPGoFXULs7IYoLugc0wIujNEXik94Au0k2YF7zfx/X3+MZOsDabxkqXQYJeqRQAoeFiDhK9PFmILCipDQ/T5wMtGPw1BXjTDECB8Zh/LgevCfja/+iYVJPPhToCslQXuL8UCZk0yexMBHntFY5MxFKsEObv3NqFtOFiBY2i7CGnd5G/t4P3JlSERsq5itzX/rv7MaNx19mjAlv2BoU5yUIx/kSR92M36nyqWm/2PcxZqM8gtEgvKNFlRZtq5kH5YXOUfL3Tigk3gAv+HYjFOdjS9v7E0PZXtlyzYYtOdnjA9dPrjP7y+ZcC0/jKm/Q9FaXXVz/CvJLWaexpqMK8r/yo6B+2AEB4eK8MG78qfdXd8NDmQQDHjO5Roptxd6wxx8GqBbEGWZiJtHRj4Pt3mI12rSUL5Y/qlpITK8iYc5sEvqbM5mJsxmefxBcWEn/zJyPDsIwIWHlDVWovOOjnPk7JvGqCYbRwYNkxDWoEiTI6IfgC+kJ9qD5krTXBg7g/3cDKwt7/lluQx1Oj9ndVY/vMVGcLiEJKfoA9wUc3DJ2RWp75c7LT9USHtk1/TrOX5W8X5E3i7ur6DFy8q57GDTO0xdUb+xT3++lz2+ELDodd9DYloBQ3w9wRl9pIdj+qKdMlHLUwqVAGraXhLSNfkXuZnC0wJfqQ7xyNSpMz/tmRy0m1f4fIgNxREePWqa18bt55YST1fZPFEg8NpIABC1nytef2J+pm+YiJuE6i1sY0Q2S8Diy89irzyhm2L0JkyiJWBxVihvRjg867/DSIVWM8vJSKv6hBw4nDV9awknih/8OviBaKA2qnDzZF4wB1uFr4Bpb3VXL1FTfD1ZG/Szvnj7FRW3bLTjzwICvi2btx3zdtqtZftmq59GRUp0+9sNAdUT06anD1g9w9Th7+c6eLlRTbLmnNadDvyjG0/OhNp545GCkbW2YxZfdsS9LNIVd/ClPMcdRW4u2E3hB5d1MYqmG8k4nlTxVHgDSQ38OmbCFRfsIk9QfjcmZo0gjD4vHyRz9w0kN3PLEuQG8C/NVSuFK7UJKsuxkWMiZktj2P+vennWa0N9fHG6E7IT5p3vgCVnLTRlrRq9LIdjIOIVc/IzJ3NOPU0rOp59gWDVDhoGtjZvYemthaoZEVhqukCwmy0OUNnXa+kfUHCQYK31Pid6O1LlakT2kZ2V0XHvCs8EWU5WeuKEIpg4WCp/hUYwMtcs4ZQQ3/TaDFlLnXtE9bJSg7Pq2fmDHqeJ0vZWCfbybw5fhhY+iHkcYPsB/UmTO7V7pAUkUJ0aIRbpFQ+s0WCgY7zxkLYta2MKqIrFZp1dmR5dxciWT4iBzGdI5PCQWueax3icrGA7TeXVMXnfEGwZxUdY0MO+fzSM9WE2/129vZSdz7gBFZxb80ULlrqPiR8hRxkXXPQ9WR+Yh+HkjRuKTMDdWd+5T6ybxRkgqiPHrIsMJ18DQhbM1FjSnFFAN4MlancdvKdkd0Grpjd4rWdXyDrfozw+7kESObA9X4fu4gKfzepSWtDi5Dghp3Z71Z2FT7RDyIQZFtz3cifihlAt6gJqzdFZmdOUg67lr/mrd9FxtoiuAlVuQOX99HMLyNtJfeWsvl6qKo5ggBPTXu/LdigaCBZ//1aY40zFVcrrTQW60oagXuOoVC3rGBzykc11zCaxTt93Cs/+mROvs+c/0GrF8mkScLVyXgrZC9rTW3FHsg31zJ99SHXvVZMaHZnZrVDFSssPVoWtZQ3pG+yQGzrHXBeFXVcf/bcGGLD4MwB/JweC3A+fwmA4WY2zdXGRWZbjIyNRcy1OFX+NHO+7XP+lOevmB7D8yW25bh3tsVuRMic2GVDcFMBIOxlpb9lq8azWtGFcxlXnVoQ2RJ1fnuEcEyIM0L3qB4PcpPujeO8jxoQ2Lgnu1BbxYiM2rpIHjmETNKmXM45l3/OW6pvn3oMWVIAXM1CMZMXQCBI2pmAhL9mvidng+u9Y7Q5NyXoMaXquyqiGfNP2+vsh4eeT0kPQl02WZdF0p3mWu2FIOluoCFYcPiEDYp+oL+ceqxiAzswuwRcmzmILXPZ4zOeG4uMeFJNjhXZX6dYloT8nmRPyRukix6qsV3D9QUYUFKeFMszKFwwcpsgCxtuVLhKrOFXrzgey0UJqi1+iCMu/SAQiShLr82GqhNE2LyCEV6tmNCL8jtqbQM/SiTssw0cy87nrIIKk/qR52Fq7UgkrlAITJtxaGyTExrZw2r55b08+MrLmqghWtLV/9cb+C80C6qYZCPLW55/BVltTkF7ZdHzVa1qxd8odjrLbbfACB4G/LzssnBzV028PgeDsV6yQ1HhWHOKYqXPeH5NouQjLDpufkXEEp1T33HqmCWtoAhfFfQ9qg5Xg3GX20RbwRHLKk5FYYYrbfSzqEg1dMH+zZQqzyT2I0LhCvMUrqPr1W96sYhIPrBoE7FQgwEUBZoPKwkPuSmz1bNUK4GcR5IjcyLWeyPbjCgP0YsFYTGwDrMWEl5nZ0bsfwwvBfVR7vFzgefaXCQSHkU4LCYfswop94UcPy6YmheqQtBXBqJ4faZJZ+uRk55vQJNwi5GoNC/j69Uzsf74dMIiF0v/+2rU5+b10mH3eKnEnRuuPHkkIGh7sqNxr6WWCzCFR+7j+CKdU42nfDYEXudKi1HxpEWihm1lSBKejPUWoXecHiAS0hmYp6EV8BjRVvRe6mzbQ26uUSXTR7BJukkPiNoS3/x9K+N/i+O+0XbkjugXk5KB3hQPNWCd2G1qIO8crReK4fcJpisyY7wqs+3J3kFNFHEuBZOE6UGYR8xzK1pgrbGb6KQQlXum3X4CXnlD9lgTkYU+Y7qkH2yADW9Et0zBtMeQaMclYhKD+mQgyo5ma9RCimG4fLr5pqEzBSkilun26rXeVKhuwlgITIyqTKg2b/GOdE0At2VWor/fOHN3Z/+QvOOWHVmdXq2VOeUPAW0GI0MeftPX1M1XL3v1Yge9E6JnNRacOr+fp+VOXUaw7fq+SwENct6LC/kfsHDHeS4epct70OLH18SRRJTN+Gl4XRv/EjW9f/I6Di10JC9cC9y6IDqXIwleaBO+o6JW7lyvgqYqAHEQuqCnrFBESRAN65bMRI0LMTrXPl8Kvtfv4wM1qFTK2u70hw07ntnBlNL+3WNS2Pi2xlm1FuwUcWySavJJMZjRmpudqJSfm7ucaxIWoCtwXOc31w9W2PPs61BSMoBxUxTvKwCXktpyAJFWhr6jnFoLnnNeZN7AotE8pAHR2XNpv5rEf1Zb3xaEyGgwv2zMSojzLAWNRm1xfyviol4fXrP7eN+uxz3u5/XP5Twb4Yrfdfh/11g0zQ8JGrcxmH1GWUejPog26uKxH2CVh4nmKkGby2nsG0hsFzOlwoiuzhp95CocKQCnRWWWglPHYUswc0MGnIyQ57br9MM4NWWAt7F3iJFoACnIXAnXkjRDi9g27ZXq/Gj7WP3rZM6Bdn6mfQKPxYIB3TZPzGkeXNlF5ZEPlFLQoX9uAmCcOqvwTU8oJi9yF2R1BrymNXlJ/xDK1J3xWvPr2i3BblhNEzhX2Ntilo9I3awAdayLnIzNEK0VqIcCbRK+cxD0X9uo/rikXIWJVSWtvqKMdyxs2pq3VI3D3SRry0Iq3Y+K+UyzMjq/P3q8gfo3PXlsRyiTxpI6r0BkIF6P0JtdtznDhQIJFjWRt8ehIeJstSuwK4rrFXuLzfjFflJxblsMCTpGXcp2XryIl54O+L091Wv5iiDcouDaaJAbUsGvKLPy/YtorMwRAs+LyAkkEsZ02M6hHyscicAnzihfgvDhX4ZpQq2j+NaloPnoSIdPl0UMBYZDRerY3IHFl9q0wOW/3SIzdT2i7y8aCQYSnhEo68tBAaatx+cZK5xdgBOGmMDa/e5Qlp/JvNyIpwXZFQzN/3vYafuK20922SADu3WaT21D6OQVnlF/AwdFlWlJqN3DXA+b6tfLP8z+v4krM9so8tcvuX3PG4JWB5RlGfJthKljL1HCo1irRZM3Fp6GrgedgYt6sw1f5GuLLdWLiot89/wsuL1bGtBQbPSQLM3bMUxK0KI4/syrClfz4qlK1wCfQYxV9YJWDgDvNCSlTvmwxzaBLP8S98dGmjplcuLYwmvjxciWvKvIEYW8m5S1ys+K6ptDVuxfhFboQjd4mDw5F/p6sBevGZoRFMT5JVJLUOwIKOwnOxA3OV2NIC4dEgtW3zPkIOAqLPRMJf35XAoDExARV/sc/z5opYZ34USfIrwJDb40TT0b/eyUrBTkZe565JgFgJHZdX7RMgJcW8GN2YyLtFKZs5KG9qOY82es5UMADMbOUB8xWMyRflaVFffrhUcJumhQORRaeOJVNco3tqaTmdX4EXlSdj/3Hv7t9zbpIqsDBJlE9EV0wvkxddSqKaaluzX9X9jLDMqcFTmyByfyUlortxo0EDZoZwWvtaBA7mh4OU+3xIjz3BlcfV3iH9qnX7O+avqotJVaBx6s12L2IFhxwN6jFhNrYjpxUfy3c9OdWAhoFJjZW1pegC6KQiF8jPW8AB0JDdMSh0lrbSpyCgA5hygrhYRepox+EQxHju296qJIGOPkioRaJ2SfYK/mfRMySsckIp7u3Si+2wfJB76LhtjbI5YFFukwELUXLsMAgnjhOFb9MaPsWnW3j2ZKBMsczTjAGFn5oPHNUtg0aSDatSQZMV0QjsBEHMqBzdfHVjGFhT6ZdrqB45RnqCUrJachpO0RcelLsV5mg2u36hjxHA+A6oQ04QuwV7fuYHrj7MSJKrauWM006v2Oj4gnLWl1w73pE3m5ZTUrdQ1rC4CnSP9jdXhhFUfVdAQcA2aXTp4I3LSMIAd5UZggHqgOlzzV9R9soOaUrU89bM2YJNAzYklJCuTTp5Xp+gm4wjMF+T46+TR0JaK6lK+Wc/zC2hEaB+jB5Um9KcF6cpa3VI4KP74QlBYOZhe6CRxoAAA="
+
+ESCALATION_URI = "data:image/webp;base64,UklGRgRiAABXRUJQVlA4IPhhAABwsAGdASrGAdcBPm0ylUekIqIpJ3L66SANiWNuWI7m0Oi+GFf8UfJ26X2S8lzCe4Zqxc133lt8o+SkXnBuzD5wr5P/e9bf9V9RH+q9H/zX/uR6u3p+/unqFf17/R9cV6JH7kent+7XxDf23/0fuh7SfX789/4X/6O9F2C/lP2n+8/N/QR/nv52/r+hPiP87tRf8x/sHBL8R5iPvr+K8HXWq8a+wL5peIZ+R9QjyZ/9zy2fYXsJfsj1xvSVMqkETb5KUEhcO/s00aBE/Ekpnfzx8HCQxHvyi/sEj53wz7zRXSEyjm0ZiWGcI/kRBN7Z1rfqHWTDDxUME9FGM5bgKJ1DE+QlVOeOvfHewLtjsxPFMF9Ug6ryJ6PHFWJY/ud1su1tBF1tcinst9jT+xAZe7f4okUaoh14kC2auh5kW2DQufsDa3KfpICGVKe+xFjxT8NA22gAVNC7RU9ubeOG90V0+rlfT5iherqVt7LPo/AIzMU9+MRt/2qcsC0iunYzHfHKsccJTQcBLgcHAf7cEbWlX6jMWfaDZAcRCTTHd4qPAjJb51v8O0D0LfS7Wca5UkGcWMbdrEmKbgn9Rmz3GsbVnFn6NodAXrtbqBs68blvecxEL6wJeMnjqgbRWzZPVpAyJoyn/0cam/jj7KzGxSU/jIiA4f0m6Pg/X21M6bNnQHllMTIBBNfBtF+xTpdXH79ypR3BTyI1R5G0DTJ4hnXcGn9/ZO5STbxcPPp8D1X+FNGroC1sfNXs8dtRsVSxUzxX8AeWaRwgN/quYZbutSxUha/oQJmPK9oEq6SRxvxkhfFP3PUxyhPdMAiYe4biVLkgRv5A4OuZbC3YE0jTu9oD3BRBpujYRLf6GcKVyNuIvryJt6klseS41PtIVbfdQp6xNHI/tfXlEY75xf9jWwar5rzZvS2E+E5PF1QCchuCAleUJomFkfsGNjwH+dRM9F8/AKU7ZuaY9h8YODm1UwDKiKDXsRWF5KZuP85EpwYWfde6VdkGI4u2cP/a951XH41lVoc+D9a4OqLOfMOf6clEROmP+rQNSgO7S+aeK/yocQcaVCveVf4RkRnBfLRf38L70HD2U4DrjOnbUhnXlD86J1zKWW/NqrnL7HS6Lgb3AqdymiJsXzPC4sa16ylJDi10TsiQWl/bnJSNIE1Y9OzQQghtiv2X26Bz+mJMTv8/Y8fiGeOXbMAGaWy2tzY2MguJr0g69jGKUTj72Xa2pyPIAxKARgeYXtRGxc4mQKyUGx6sXesGmQ1W1Mdz37KP1J9XvC3X4bIJaftW3pvej8nhDgaRijvWfqwXabK7ht3KCbPRAl70slvtUG/KUztpkvbhD31UD7gzN8V5Ve9rUMpbSx/LLQdmqCHSuzAdD+h36WMwzIjvMllk2EXyo3C4XV8uXvqJLu/ckcULkefBGlp5xsOiH/jhULPqMqvmRY2MeVXQH2Z9VUzdXqHqbxGU2uSDumlr3XKyIbRA2DT/hoYfCcAFXrUw/cdRSZqpL/7kHPfLkROgi96ac5MJ04M1bwl4T2vfHOu3UNTnkBpLAW561kfXVsclJ+mgeh9U+snPYSOBdR47dNJYLh613lpL7LHmIoLAw43t1EyK9Hq+9ESQW9QJLZJTS1Z/B0kFhzV3ZqRmzLI4xg8sn2lCPgWDhgZ6dyWioxtLXMDQSPGWWAcOuvWHQm/N06W1auw58tPJYIf0C1in1uULv9rJcbyWH+eEBGTOuqbcLFS5ACW+PUPzXyN5SWCQkEzLj2Q0EffietrAeeRQedZuyA4XSbnBy9hBjAsqIuWTobdfTFZ3UZrgvhY3YkvRri0TxLHODIcSGVYi7NTv8Wv2KxMjWoeyZPS2IaiV+tmOt3dCV3vcsorLFIHezaprx/iByYV4xJxk8gZFGDhqZ+ATFRyiIf9GNYDBz21CaPCF4JaSx182QYPoNf5E0KYZWPWArRVg6FPByLLpGT/wbbeDroxpcERKfVvqBLnbvAIlzIyefp5x7UqmbZHzXjUTTuLfnyO8Nby9Y/7Y+Ev/unYQZXGwjK5FYjwQqwJcY+cnFSVlD5bcR4GneMQxjMddCUkV1Ox52nRdWgLt6xD7o3zZ9g7rMGGE/Q0GRrUKmamkUfbOwLUC2YNDK5Ku00eWTcVrz6C7ObOLdik2l4VZCHw/k8HEg46P6DXE4wzCvTFheJo6uEr1ZpZQaBWXr4ix7HCWkp/EZhEnEX5H8EYWxnwzYjYeUWFcYvdjlw2mtQYkf5Mu8vhOe0tqckaZQw/vI91Hn/6zPvolKhioV7XkDe/nO1gJsmv2OyOjHvK06YswvYtfhTWfnYJXes7MJI169HXrBClS8qf/sN7sPNoDjDyEdU7uT0c5WSEg3RmKOZu0J8Cc09dmoq43gPtzxpsuj0rGsFMReFTGgWMvSGwW8j0NDtTKLUwFsLOrpbdZSSB0eeo4TNzkbhYZeUsuDE4l1clHeEkbayo0DanQVDV1KrAR6ZLb5BdnYN1NpQ2qKOI160RwVowTAnWAEgJn8XqTWZV2P12W5cg8XFag2ACxevi65WrOEkH/46PYysD6R7Ezg/IMzwnwXrwd4eY5Ra7TbnjEyOUKfF8y0oufz+BxZzMMYwovDpLH2gjZUGeSjR31ztde5uANgBBJ9DIT4QUnadH/UrucNyHHqLIvv609p2KQjldBBinwtqzPzGSypKaIdpXIXd982v+21W4REHvORCUCwCdzm//Z9+PrLln7KpnlgewEYRR+jwgPNtEv8wImtcdt3KaokCFQ5iaGs3li35igq+bk+PdJwj5GH5pX/hH717eoKAS2gbA1/JVpibBEWaHHJ/x/KD6DdzQRId2ibSeFs4O7WPutj/jGg7wgQiRotymi85zVjk+NvKx/qUvR5ArFQLNBwx/cq0Q2GVZr8BjAHu5rRKpD0AyeGNRvt5cuq8RBF7YS+GLJX+K5tHrVUx/HERtwOzttUMd3nkzYzxjs/HOikdvDuuyiuRkTxau2/qersfKNn656Hk1EF+pUY8zQst7oBqTsuzq7oe3o2X5B5pLlxO5f7aHbN9PtBcn5h/wSC2irpWN5Pl0+ltiTvjjf0kCbTsqx107xZrogiYJcN7RwdeKxz/tq7xBWE9lhXMOTVqFPZf3Ay484oe1Au2xJnxAF/1EKwX3sI+ps65nPiQcCZGse3po2WVUJEPNVFfT0fEIaofXERawr/QZXzII46DDuCJp99yIAuDOmSVfblsN1IQ4eQ9awCw42bypq/t/2UDsn3e45YxR2vUht4O+sIbryv9d23IZa6GIt6htHYqfAQxLJWRMHeC//RS8lfk3L7OXrnZCC18juwg7syaF5OwAqR0XNfG7EmeSiKpyygEjNsp0AhjmXPv00+0nsyL65kueRNNZrubyOzAbw7TKE9y/F8L5UmbmwWj6oMF2I6gcO/yLNI49/8ByjLD58oauNY0vxmSBLR7jGW3nqFUwf/dcKnMn+dpp2u84YYG1lwkE1dcqDY+2zJ5ss2hRFmzmKEV83Bwlnp5mTR1VTyJ5BG3iYIXH9bD2SZoi0dsavORdLf3UvpGJZeoj4xG6HhqYvOxRfabFFkMJ/6s90+fvAM1BzpDG6Z+mGCS2xED2KSWAXZ9H++HnJdRPHDLSKb3p6rSo88lAAmU4+WnBpj31GGrqsh3vNmyJp6zNx8/VgdmT1161/9R6Y3Y8xgDlFRhQvU1oDi4SIlk1KeiLPK8a90Sp8OY+fX4wwMd6PDnvHf11vBI6maHMnDtVSbikE3ZEErUHGIAGeqlaykSyvIqvv9DLVWqzKy1qGdAzxlz3wydPpaT5Ya6uE2/3KzLQ0PbUipBclhYLKLg3Q1zcuNdXhieHuWXgZrDe/2YO4OtXt5D1WB7Yy4QCRAcjyuofFCi1T5itN6AXEtYxrIGVXdFWvll1JqIyyZB9LMaQ6MVMdA8SaJytOjRVkY4zSRUMlxARwRmbagw0YHZcBvxDRwKL8CK/PmB10ABE5sJ50t+SmcJ51E2NlpE1jUI3JZn3FlB4ZsLdD9nUXhypLx4G5H157UON6W2407LnIS3/Crb6v1POyKW56j48Q5QP5iXLVyrwAVYGwfVS8OsDlmSl1wyp1rKi+4QSKYAwyn6DAT4LTD/hCvG74Hf7G/gqmq1nmJfXEdOlbe6eGVyLvRzN5dpt+cBl6ijQl9jfd2z7/LAcrvItYaPaE2+/GC2acGjaPePnpuS7OuFkTC0N8z0a0Mr/RpHmSxxWaMQ88aYBLMWxz9ddlP16T2TSw37k7fD0v2zg/DWolvQSsSPxDoVrT6HL03ki36wwrIkM9LlnWmhFU0LNlP/0fOa15qm1yLFarW9HFBf/Y0zGr58UWiyZiSLH5OLx2y5JPAgQkV2uKZXzWQ5FofXmK4mlY6bI0cfDIidPGyBVbBq4oVpdMjwxU+XInxAFCtRJrq8FJUnHf5lbCs1ufKoNHkYwbyp2xCH0fC3VErQTPUcu7s/SlXtKxGw9cZzqB61MZNymfEyjpG4AGhm06wxKRUEQmMrtZ9tx35eVQdmk4xTkw0f/+wcr0PP9zX/CytUSe1BskWnam05TGOiUqXOMObfXju3JO0oLPAvbWe3z4ef5BowU8TKSqSYUs8AAA/vyv1P8H6zvCvtWsqdUGa4TTvh+2/to355FQiOwYypXYTbMx6w/r22R+0c5KBxwvzNfb0Gbtuiut/h2Z8ur5UvwRPQawCdkUERaKlu1DXPhsm+wro/NzL5MKK61H7DblSePs1TeyZPzxhoZpQyXPO39T56w3Zv6cQgPAQP1GYKs/AZU6uBqt31AXhJLPazTnjpU6w2kyPToa/lgJDmFnBFOBm/Sh2x0oSskFGqrmxEWa8otErigIHabdz6CFug5jWviCLNSugsTsaThgjku7QV8/1//8WB8+TksC+EhmvhTQtvClzEacr9jOnwFGKBrPRHSHXEl0kieoQfVGJjbqTjWdghzkG1h1k/p9DoPDJ2D4nmIYKq//H6w0sSAoPiMtegIm8DWwL/9vM5ypyHhXBmS798ylrulOF5tWPWg4L074fuwXpeQ7wpJ0nBC/JfGserPQJfcm6AQp5tXlWY1kH0GsRlCNadUPU333tMUBjwTbiA5PeUQu229oQJD8YEfWTAUjwlMhONw557Q9RbwAU9VN97+7xAA3UISQwCR3k9JXFxUMy6PmmjVyjjBCkYyVM0DmJ2CALuJzHcNO3mWyTg/Fg49/EoF0vZsZSRwcmhifz8bjn/qjpc2ZZJ06nXHXJqs4V3hhxgY/rSHVAiT+czM5vbU1pB4hPLlWIanVnmA8Ka5ezH25CrYv6mNQfGx/tJYtQA4xFAb9kNuhYXgtJD5awRRgzsugQN5LtsALcQYgAi0wNC9FS4chY+4m6IG3QToqkmlQQjL7bDYiz2Iy9NV1MTIGNK0dqPEevJoflquzVvT+GXJ2P5SA5BvbCdSznisQ4zRQq9Mbd/94T6aOo2sZbTL3Xpi5ZnQoe4cc4RC7bymSv+tq9zvak/VDPC0dr/049mHTiz0lW8JXr2rAewZhLI6ayXDdgLkmU09FVLwxOTEdWG1h4Gs0MxpVz0mtA5/1ituyCvGZKOQAAD531304Rp6hgj5AKl39HZDUckGtwlAckMKeWROIKUHK1r32pkJySsCawYmxOXtd2LsRCIiHwQew4gID7CYIddbPjlq2SrxSNDRnqhyOlIWAn5IkbNUDlPVTnhCEoCZnBRbitDwdP5ovM2Op8+kl4Udr4frasUg9Ml0erKwZP3Bx5gy0Ke4HQDUELwLMv07WTBJGtlvf7qD6LzflX3n66ddzijPE6LdIHabEKjxT+Uwrbuy4jIch+snLlRn7jwdxsLcuXCqOBpSfuC7gYI5x45tgdIyF3Z/lkwDJ+Kn2aaA8GtbIUefbBEuqge6jhNt1NRTqUexlGBkl1J8FrlD/rwLF0TdYqMDvcP1pwvHh6gCF/AGt3TYclRpQXjmMy7H3DDL3ix5oCNBroBel1xa7q0hsMOc9tBb7RlTseomy5r2zR+p4YEaVneRvQL69xxqhvEm9pmoD9ekzbp0UcawRNt4VRhcqAqrCJnKDTo1tVy/rpUZFZNCFVAgwcHw0XxqgLVhheafGUhrorFtfdn8QUDPsJrJoXFmyfoxCly9VTyA2XuYtfm98rQYMIjvjqmz4oZP2kClhdXbrT632i4dGhEpGEpioebzB9EGPaN66e6UX8cPIB1lPEPqP9LaM//Ez6PJ+Hl1Pf4/vcbwRpzGt8OJIfjnXR6mXD3FJqTPpf1ZaT5Xb5ioAKX+RmTHukeoFrmdwpoLTkzzUJ+kR40QTEWzzEuDAlBhljSqHSWc8ZnAITeptKoD7TP8fiNpvoASpfYUppQASubanq9spOn7zreP9/VQTvPb0Ho4ND7Jjtk7o9ERGkVCF7zaEhhHwpWxWGqZCCLhdnaOf5JAS3ABK7/7zuvMN8YiinQOR6ENn07p/9b/aM8dzddTuuESc0SeCz7uXYZYvy/d3Vg4UI81+x6c5ahfZ8hQPZYaneaYjZUtCPSC9geI2gaGOU07J1Mf78F+/mP0YerzpDu3UjA1p+A0pB2297pcvKpc9mVnnc8IJoEnlTQiP/aPjolmt8sacPhw4HrpClfSJPgFP7eB3dqP34+iz9wRTUsyHUDWLsPESxRaR4HZ9UItDRM4QlYHvtiIvMt29JILTOBBzll3rzOy+36DoqjzCvWWADIU/a3Mj9MfvUbtxXwn32TV5br0/Q/s3DZGt7HxIyACqu5O7+dFswRswDnj6NhPDe1HLMHtaLJy5XEeqx0Ens2p7EFfQx0I3orxg9nvZwllg1swNCSVoNZEDx/422hZTHSHUrSySUrCgS4asjXLg+2tnas2i+lQu3Kyu93/Agtps4JK1PPDpR9aRqGAhnIblpwE3FJpOOJd1GGEsdosq/KSEi7WljJLt5cErezmvtNrRxEDdT78IV2fwNkq0JiJs5hHO3hKqjnO0G6OWii/OdsTD64rCXccm52J3LHxf918F2dOcvMO74DxY/sMJpG/fYxh0QF1R+ScKJm72FdbEzvlVfEODk92aHEdTXDKHQ6Roctj5Pb17GMj5CdN75JbbeffLoJNLV2jjweXfOdqrJe7Sm787F67DcesiLTzKqD6YkaXsUj1onxJgMIM//iuHpnmWmpqYXazo6uK+8xeMrGIWDb4o1D0LHxQC69Qc9WXNzBMC537chto5hwFdEIL/lFP9/vO4jNEC1nIW0s4q7T1TVSsxnsLehJG7HHMxJ9S9LIzvSUmvMLy/F/2d8c5+Dg37QGwI6GaeebLxbyhL45KaxCxckZRQdAAgIrJ39+/kwdQMdVbZCOjZumN4OKXXvPaC1it/Qpu3cQhSkR+tuXuGbStEIzF8CLutT0FzYaPKSSzJ0HuDzypCQWiADRTNCipq577duQdSxTECuIy9J7I78fC7geqtUHgv3wwy5KuGCyeaLCH4T0zskBn3GRm/3O3wBvuqa2E1sY4IuX5Ubhitg2E3afeB4tBDLm6XaV7f109EDhruEJzipYyKkZQUiCru7DC2L7qcjJn3QnQYoC8FNWUb+3ohnud3pOsMG+dQSzs+M1QVuVrW9Unane0vMFxQKRtfeqHaJeWnkoAArsXeeWJWKR2+QjJVk2iizIvmZu7aJVxPwuPOH5jVJ/YNukNmx4LG3GSEzHr4p1PrWclo1zTZ5ZyNjTQeicqWKH8mn87ujRXlKtAefclBLh5lRPZUp2jGEl+CTQHDLGwkSGhZ7rZFfax42ySnhmvdsx/VtgQ7RqnkOLanD+Tjc6Dd0wxdmsbUxg9tdi2lk6c8/Y9TqFJUxzuQESIkiLIhx9NGxs39iyn86wk3wUqCn5qn3cwtQqF9nKTR3PlFUCE5Mr4sey9UhNzUnPc0/PkWjgL+NKgq6WbgibIgN20dAU2vP0FzVFY1+YTK0oLML6RXtwwO48genCpeF8RaguUcJ0DW9sGIbiE7lmf3ZvGedMWpsfOEK20FcIgbH9wh29tOLsNQTdY06LzPD4/deqwNSSYdOPLZI383moPtZ8ALVeV36ZrdWxlF52skeXa0/Z1zLc4JQ1inWSK7fBhCDVgm9NQM2aQjwsNqY58sbJ+YgpgMzIUek4JQQsHna2PgI7cl7njCFZqXjQPs/OtsizCUb6hCq0VzrL3djmjXvWCGMcpd1mIhQ8bvZMLQ4xxxzOR+NKs5gStITit72CPrR8wjdEDPUmDVv5cxUdNXgVUDGNcwgXguWq7hFv+8i+DSTx8cFC88kbnv1hUApe9PWbJ8W0zwVXmnNc1rt+u7uTam1fMpxqYKYIvAUeUH6jch6aGxXVD8uJZh6gB7AGDgUUZ6qjaPRFKKZf4B4x888pgRy5ZMra2slcDqcQfUHHXwhKOb527+kjuVmIYt+ITxNnYBDHFRVyjgY7gLMNj+JLcnYrTgyaWcYZCWNAYYmC6ik4ImZ+w8I6Zr9eJ8yGDKSczuvH9jGPJc60zV92TgqEZVU2V/VW2eGgzAkov8R+hTvaVgEf2MHruHIkT+3lnRwPs/ZlhdF5Xl9mH7F9foVLdhX2h4POYl360JbU2+Rzqb4op4PJNneI34CZgprWmqA85VnxL2/ryQ/lCxjoBUb5Nc2lvPApRT67Dl0uDtPNdIUNiBADvUuy3/A+FqAynjf5i+jE8iXUIgJRV51is4/qNndJqvKLW/b/kbLWF1+yIvIOvwz+dCQppOd1KF2XTX22sZ9g40Unz8loLgEeJi1rDiMgFNMm46ACflzKP2aOl1jFRa5/60758J2ldOt/LURKNipDVrt1g/8hLe60XxPZ5lTFHKKBquZ43fuJ1kTXSKRIb3oZwWMAvNfYzW8+0uIn1hbwDVmnkpuvYTLzwIzpJxHdIFa+eL8lwdEpEDIL1E3GZVz34BbAspqHDabHbE7CAGjacoIAZFtVnN9Qf2orOlIA2jAnda3rGZOwGR+2N0WU9A2hmSY1u5LaAUwJlDf/CZbKtLTQxYC5154nD5BCtqhgQ90raFdCe0jYv7vEv0NljfVHpYAGHMhoKdz/6Hu2/3wZ9Oi/cPN5iiwzXa1TBk8hcu+mVLJwyQpf6gpJwPJ8h8jyKXE56kEMO13URtdLJcxWPELAKGzVtZ6vQsGyVZK0+G5eLWDyuUHEtIq716SdPOLRsP1Ed+JR9b0LnFcb+tSwPqw3V25iKxaX+FDLJCwK9OwXbZPTupf8Q0TILyaTKGmKLsoQ+nfbG/yYZOTbUzmKZG4joLcJ/ZuL/0oESS/+fO/ekvcrHvPqBt6Ut4MHlJ9NwdH7GsmYkTz0B0iRdNonqOokMZoHl/rmqP9CcWbLa+EGZP9S1qjwQMrikj0QUZnrUVOflwMyq1XIC1DBfflXkN5o23OFrhsWuClAPM6tMIJOItC8qxnBy51dcsXIEkfBE8r7zijezvJxle10euqFAQugNhdL2rPbqcl1cfodkGLrTMDNjTma1NFDJW3UYjdE9wb0k9P0WUGW7SXWwr+8Ko6wTDnjdgJadyty8lEe7BUl43NlzqOdQj2CB+DZ0FJYjcE828sALm6cdh4yLIZ/d8aP6zDmbFVtqG76jJDvwsIrGtVuKryo0VBe5vpxOaIf3Lbz/3ncnmLXi9OjVsGWSFGsxhPcg0P7fuQik/hzHDUfaBjRQTN9e2Z+dxhgCrj1W2ijAJH0KSgo8fC/fZj72XT/B2tlQoFcPMlKvPuZn1++XzANlyRgXTFjZJHEKZZ5OzA7PFHawI+G+lama1SBW92xQ862r7EJHvPB6tr5CFAvuJAU1nPOUi9ppKFYM0aUyLfT0ApPbirg34qHfjpOP3Df0QZykz2PwCYr6+zGN/Fs6CZij0pC+ZaqkiLyGgKKSLL0JjVm4T1iofOgi7PqXIPCZNZNrvs41wJL7lARvFopOKawwDWo8tYa41bXmLZxA6rjFC5W76wPajuEeDO9ViO65ctdKUcSXsACcAxWPjXWJDyDx9UCZVN9FloR0tc+7knHRUSrEMLxrlnFk3PO0fvw36lSlWy6hZ9RNoWKkDhF7MXHrl6Zy+BbNKXEIM+CQs1exVg124HuC+dh7igexZ0qVKN1W+jnJm2Yusg0XxyRDze8oFRGoUY9XO97ja2gYXf++AktlABpjelxpbxaImS6sJmvAnw3CTZYYQZffWywnMrNBi9c3bKIFR0nf8J1eTXGx5/zvTDO0WHB5TAFOjZo0oYGo9RfGBs2tV7h7pm5IJ4/9UR+Okf3AALNm83ipa55LtkJ8LUKNnzFVAE0wkWFgNpnH8TIogZCXr4q/L9T/w8aT20ArcOVarkhjeEqfxtJj4KdDDlPNyoyDqLixsUphRMLywoBZXScGUTDvOmVgHRbGeU+voO6xbASNvSfdYbFhtMlj6xknKN/KC687p6B86iob7DnA7o7VK/iuZ2XCu2c83hkH1FYXWcWz77gFq1bwgnJwgseNPQbNlidrSw3zk1/26UnITXkasNio+qeBHKenwIyIm6p6AGnF39BvRGz9g2EHIxOD1pUXTzaFu8Lh9PQsJSNDaOW0o+L4EiWVjy59G9+h/+S9r5dkyYGB//YaCo3hbhCInDfjtrDCBCkad4WGtXe130zpbwWvmkptvVqxpb7JQm5dO3kHmyQOYj5B3RWRhMcsSkbYOrfbaAR9/jZaFniXhfw19r0wsosFzGl0X+WigtjQjHFUqF8cRWWwgMviaQ+idh3bbqjUnurmYnhh28wwZsLuID7ItzSan3zlKUL1yDSrFMbeEDAwkU4e/7Manas5n/pxrUmC2O2IdBssP4Ysq316zr7TtDBjC56lo+ZuOf7ShRXHthnPHfgOkHXPccmdtO5UZzTtPVlSVwvj14MQNXKoI9rZoK7jRyI0Md7QU/FDxZjSmYWKWJE9REWNhtJyUgk9YKvbwYpS/dWe75L939nBKaMlZyz81vEWSENA1svch9vhYb6hFeExsSqiNJdfEQITCoGXeQdVVC5yERYuNDKP2elEAx0B60zcXX7xIOclAENC6KB/EFauy7EcXGA3cNMH72aO7A+0sq6ELe+2z78o5J21mIOZJem8DU4hrlA8d8CfqlZDc4wh+NySBg++iw/qE3M+GoRKMrgd4DTL+iFaeC7en8T8T8XBhVRmz6DApFVI3+d5zfcKhvOx4H5mDUDZE2bZCR7wdfeevQ+YaU90MDH+qkoqYwUlZFuZ2fiAEJt1K7ACdXuL5DViarRGb3mEcr5o3mty0iwsBEvf6+TaP6cvvcO8f4PXMWYUUqf6YeFQ2+3tLpT8qJBeetpm+tPsNBJ0EcxtyORU3bys43tlr1GUqHTMu0aOEkyteOf3YaaBg50PRRK3yqpYR94BLqdBb03JCBzNgoWqz16QDnR1YOlsUKk4durY+YQeTQhhcpUZQ14FS0VsvvKVWWKWd8PfnRszF6YLjwWbvCfUsWwncWO7tHvl2hEA9Mpra3MiPO7JfwPl47eHUUFtHCB2+jVbFJGZH/1icQ5ayup2TujaVU1erXTOo2Fraff3X05FEJIs9Uimhu8EUhS4WUFtTU+j9tTY/nErDJ4t3qnzZhHuhcgfMU+arX49dtXi/keBVHDTvfjqr4GlriYmqqAUjYJpaxyG2GaHJ/v85GaJQOOMj2+s1fo9JAbzZuQghbY8U8le9zutaJ+PMWmSpuHs43Od5WMNSvH9J6hp3RO8DSSURm8Ts97u5XSe5Ae9CRZQfqLncCSXrueifeur55ooYWvAKwtbxYqvV16RhElNeFSCzWGQtsm5MiR4x80JQG65KZUfloTk6dYDY1YIn3X0M1RSeP+U87akRRhgTGUrT8Sq9oFxNUj3DB3JWOd8kXyPYeYKICm2teGwxYS5PBiHgfenKIdcarpoGGIfihn0ylDVX/g2KoIXOKaZ/8c2YlPOOcJT7KUtMbPEbF8nPPdykp1ktXhenpiIzcZVXIn0T+HLzohmqw4aFhq2IWTNVH/rbUG8rs/p6jPMUeB9EK+FD1IIF5lwnhnlzK5qAepaJBluwWeFI5R4KZBm2iHwRbyhQf85NzHBF+DX3fV0okiy/zVPv+333f+z6CABXkP2QNnyt1jza+xshLhIY72u+w3j2+LjwZ+fiUiSMfrfe+0GNvLpgUJwe/fUz863DyWaw/nfvk1e4EIZnSCh/aB5mUG1zaIhM/2DXZxp0b4i/WJ84bs2QI+7nOVBoedCe+Zkb2wr/nrEuEvuaAOEw5C0LCusf9rs1CaPNAV3NeXkaQ4JjzEjtpZgVFQXTcEnRWqhb0rMwART3AJrzcAAxKoFFUU1/d9jiD8UrCRc0vj+jzYXTf1BgJuU04G3e36jM/IkuNEXhnVIhR0BwB42X/MjCZzdIWSVxh5dDPNZv7x5bb3SiVp4a/6HxHkD5LDFbO1f8KQvopavbFfC4vi/vds22J2TuhiWuq5GTdvFDipk8/sxhyuZwjRjG9TUeb8tUezl5OmzmKDTw39yEpPK5nXWE476QjDoUmV8X2BMKc57EZP3YlFeKMGvwWVj4DPh3eV52s4rimj29jAuTDVeOQCpr/1ZhaWgjxzw1GspLzkpIGTg8ZSpWGX8AVEIPkmUx5Zhtqu01GI2Yw1OmYH/YPsftz7iwcTE93Km97Y4el81UJD761LdBhylyap87t5yO7UH6hQkHrWj35WI8qAEJBCP06eU/5/4xdkN+9FG0xNsrUZGgCqIA1yFKvuzZFyD0cXSMehKsEBFXooQaoCqhbboG9cKu8EceFzlHJprf8hsSICApgr6taoI7wB8lgVPfoXt7OOr/wQ+ccX43vSDF8Yr+2kMIRgWVvrGWlkvYQbsLvCcEcMMXACdStPfCwQMToumYI1JDtxpYSg3pCdf3wHsr49V6mQiqF6X2DG5vH6qX8uYl63IA7n7m6RnyxK3HDrwovj5HV9iQqmViJC/T9n/rF2MHQLndaqSlMHztKHQPtkNgPGu/1cX6DhvXVJUUf8qX0SBASqmPdcf+9AR5dkmzOYywCM5KN8Vzo+2RRIPj2hdYFZntFt+9ExcmjMHkHoADJW0ZfIA05Bz9nh0SxB8dzdvDO7XNH1sImVX9aOZ7NVUBTsC9jXlQ9IMr9HIGMLxs1qdLirVYMOwaA3rtsRc4R5UzxdTaMjlzcOwfIYUB5cxOSs2edO0fKFmJspicp78UKOeIBzG1t/OgOCoxr1I4nOwG9+RNT+Tx3dDtG6o9BB3Xdb/Ehi7fDshrQrvAiHgirWOwYlUxM8EApq2l5kSyBliU6Qtqw9oS+v0M4Kfgx0yl3Zm6nD+HvISmP4/kKeYP9BukaFyEY3wDVci0luaNTqrp5KzUyS8N/wzFTZaYkKvzsGjWK69Ek8OjJV2KKEvbKx9xIrP7AR+EFjiJobVfUUXqYRgLAnvP5Ur48AF7d3mXgKZKlnSjHHM9mTjwMM3trJm0PqQY/VTBiuV/Vr7WaSNE8A2Pxms2Ihe0Km6i2srdPMstioqmYvbHRD9e+qr2I0IbULkZmgp0QGtFr0E4fWVoH6DGNKxIqRIaNK3Y1mveCkH6LdZUVQz1RtsBrxOqkIXojZKYxHWYcoIW1q90l8d4TSIKsLNWpd4oG98sqC8TCCnpmTitU4jua/BqAWwdPpIgJDCB1pYvYCYyvYeZosj/0Yalvo91ixYkMqRyWc32ZoorPWL/XhU6r/jZRawFYd+icqLIMZgxArYNNnUKh8dyO1vzFxCvqw2bhoX4ennnOj4JT6YyjZ1vTw5flkPJeF+XSyqM+06uesPSXcrP+7dsHbkqGm5uMXx8MnM+UH9BMkWi6dVPMkA7vEnluJ7fLDBFXho6U16WO1yH6NkPIM8wYlV/YiyfWHPHT7iTPSIdUhGHwPS9hgrkzqSGJdNpOykP8T8s31BguD2DkTGRG5xjskmxZ57HXQkS23yhBiRhpv96v7uvkQKbdpm53f0CNdrWqL2YgPWi6jhyY5nU55dqzlKC3GembMgV8Lfh+xWwf904dSkbUprE51j11e7tsi7k84pculXRMMseifCqLESEhPA5B94UVx4Xp7ZBsL4YNH+woCxQeJTzGo0+3G6PDNzTUD65tNGUABGXR214c9QmK6+JSG/7AIZ93DnAh5wD5un09JAbwp6STqVqGfL7iTtTNX7z5N1uWm9m+R1+hMnJKRi3L320PwetQMym542E7gR8ty9bEIkaT6rEy3aj6Loi/AHLI3ttQpv1TFFByZthjmgCiUjddqcX3U41JEcMA76NTooD442rf6nq3jhEFsTJbgNOYA+hTR4kLyLhTk5xDGMKp57rLIeF+SZ1afpsJQXvVi+SIr9Kw7dtnEduq6bSeCBFmMrC45mm2yGiRpEXrvmHGCrFfLSue4GRZ2L3ZTOX6J8OwKF4Dq4Kh/DC6GQbNUfyTEb0jIGdTHcQqeW5EoB6c6zKga3MkqrbSMDsPCws0+mf5jgw3aWGMoErhvGJ0f8n1LQz6h1fFpDVR2UiEnykD7gFAPGz+Gf0wG0Ci+QG/qOVULEwl3VnXXirakjPUn9liUbws83LMfo4CMcCUqdltobgQeUQlqiPY6KsTSWxwms4d0s0DsLVC6C/HHwdp1qa3YjWRRq7eu2aVfXVQpsnbj0hx4zayu4Aa0cAWYOgwg5tMApXPGUoc6TT8u7Vdql7PdnAPaUiZIEIXBZZyLXYsivUIiTLaeEHh7+kGacwv/4ZTKQbw9TD5IEVvrdyoxtgY+qd1WV9p3pNoaL8UsyS8JCvIWI2EJfYyibpjlIdcpf9AzFW61oXtkVdUgNh8dRXff0Ua+QoyKkPdNfIstK3jaYu46GuTpQ/vL1uQTWntJQD6oh44cjEwwePpJcm6D+35Ya2BBrHZvxuBr6K3eH9wpiaWGQxeTcNgW8BVtgDhv0rWu0deW7kKxvSyaRL5Y83Nw6PEVJIdL4Qt8x43/aqrnp0p9jmQNNKz3+ikveM1wH5A7iYhNJ8Gc4dlyOWok7t0OhAsP2n9nWvU95x9H2B8sxcppMUZR1golIKdczIsVjJNmYM64fLaNDrRCft4KGsW9AQFbVQTWjBbIdpo+RkxcoUGtXIZgUAWtGMDHdSdEQKzH2g6CDy7UbeCqNXWGAVAvdP8M/BMykxnuL40Q15F1lp4k9QFZnG7GSUcpqpDvATr0MJkJ+9xVIRIAzofFeZCiwRMJ2CQcOFgnGJ7qFDstPwMFM4OpA5WXPkFfJJ1SoPxbP4hABtchT0uDGbVWNdmTHDCgup1lVaJVPXjHgKnSYlq/EOv4S+ESCSwhGn9aU1g1vCfZRDIzbQV+0YRCPax58JH2hsPsP8QE7EfPJq4in9/ZolcuwszPMq8EnZ4rMdsZ0WqC81qcqSz5Y1kOV3WDXAV0emCfp4AR6cCz7xqYlsVHSMkc7NkyDMFQXBY7jUirSMMgUfyd+kwffSI3+vIzwThUNgAhNVwrr8YH07myI9ShFhLoXMNycHRTkNIRj1byItt9nyC7E6NPzmjqVJMHEj23/U9C/W+H77j1gs26YhX0qkYHnNT7kpRMpZrgJO9fufVghIfvIixU7jgI3GSZxhYuo/m69nMuIaGq89jQ9QlOBxcKOT/qZJtxbfrLG9emca8yyVHq4PEPtWVXiaai4vupvB2QuxQRlKGx5YsgZFNbkuyQfq8+5dPpybLKSCm2F82O15zuUFeRo1jGrfe2T7VfgqDycCWkrVTY/vTi/aV+lRvnRYGYb40TuWAnZaFrZYw+i2zMtQAGslBe+LzF69tvkdyxlBFpm/ENPZ4JZMTVdgeYDV/KDBkvKbB/K3kSGygOCnUxOBEmVZeyPPcuYExbbeJNDTjn+WXqbd+vs2dg06VvC91vfitNg3c4yf1yylj9p6edowiW6T4IujX0AveyIYIlDv77fEbiB2+RKz+G9baRrRTc8lr26CvawLEVvxqIIYwhY/sIzR7xBbfsJhkyRnfv4wSewqW9Uh+FHleOr5KffnHqlJlIyZrTiVC2m1ggXNVX4EeLlTDp+USDAzFhxDb3r/CfcVrpT2gwmokvI6558ww6530gwLGEha8HEl1HxT3nb1wG8EuVDhW05r6qUHw8hIn5To5yekdbX6aI9f3rmTDSe0zOTbxINOcAZgqrN3gKMD26EyiP6UCLuuIeWFFsArlYgOmdrYfwCOErmHFnRSP8p5h1dxhjoqULt6luXthWZBCAYW4pazQokeAupeMaD7N3pKLOnJJIsUXVcnNO7+ThOW14mQ8dWSOS2ziusl239P/AYuYhQvSc7Q57YhXj+gfsE33taicmIMhz6qLHg+C0XYCid1B0dI7UVJ9I+Iq63hBLfeCAe3Go/Y6WpVbCAQQI12aGYpD57lz5rXXbCEEZ2jamqpiYNHPGVuSFRzpxKk4MpDLtfsnXIbvn6W4cEGpiHflBVJxxtRUzxfB1vGfqKEPdpY56ZvkatV5dV9CCAxxooFcSnCCTibgDPPPRQb464Z6ifJPR+GYXrVnayBYd6fgppnk81gfWNs42AIbUqSa9V1m+9jQ74ZI+uODStCUNjBHFwNNpccDySmBZpe3PJeeOYISjcvrJ9WKsjsvrOgmbvzv9iqB0io2CM2i4kwa3GInMG9VuqM54EE8ANHLxpkSIVjy13JyxlNT54+Th2XciNDyvG0v6V4KrkVKrl9AYiWH2Ra0Vth3SBak08TIvV+Fn3fYlGiaPwMnNWB2NuuR87F9msHnSa3I3u9xdGmjKa1vlrP5BFNag21GJSHAvZOSCZc8LoOgqJ19rvP5Sx2qrFmxKbgdGDkq7r3aeQCEBWKx/OLJE58yZzNZgSa5d+Sw30GpfpUeK9wxjCB0LHGhpgoi9CNenlA+uwprhD9IVVzi9G4PiPH37gcGRui8B9J/EBSqWWYiotb1SbPdIt+qEErlwcbcjMHNkx9z4roLgVBAMA88J+/3cKvn8IHUcyeDWee0s2F/I8yJkSi78IozvCzO8GWb+FJ16Bui+zohNNBPru3b3nXNA3mUglTseruYg1K2Xf0UyyRrOVBiyq3AikCCtLNUCgzcdogzyYjOcfufKkFzCUfQKiJMzQyAiXja3tmQpBp54UNZJIN/8g/7G7xLYgtfgvVUnn4KIdze3izRcaOSlDmREykQ7ycatjBsO7ij2VtpwoQwb1ZnguMLVcWV8miTb2FXzPJ/HQ8mXFyeD2JzL9gp9JId6D3+GHM49njEEgfSrUbati6xIMUnCrMGDjvbT5SCSEtliGF19iWp8PgE5n66onZPAbduApv+fLm5o9SxXv4vQC5OJJbazJZvxOYbL6HMMKZJEmkaic8DK0dDmgro865FrKhHOs9u4+iG2KLgKy7JcsRKxvRgqZleLy5wqufeiSdbyyz5Tg/bgjyNWH6BYaRCQnK45MU3DtTLZcmkpznGMnWn4uGs6fCsxwGFoLm9uebkVhTXe4z9I1TvPR4nhZvwTbuC8O6QW1vyUg5QsT9bdOkx3TdU4BGH06sNNsmOx8uvUQo+OSDhBjugGTlMsBC3QX1+zbh1wERnl3XR/Q0cXDzioDbFjRM0tYfVTlwuvmneKZ+3619eb2eqFTj5BubXiLSGD/ewTF30cOMEmyV58sQFVGf7UfHq/2pvl02Y/dgYLEnlsRjr0wLmfCDZdLlwKkOJWjyCeLyh8sEtfJphJnBh9MKzs16pHMuSvIrZ1lY9y3rl4mghBl5Ld2bbHyRNvS2TBDC6MvWtfKSqQOhImuQBUfQ6nQ00CFOaCEpf6nuM9TsXQ8lu5HuwmCN6bDGMbC2yLMKY7AVanBKFDF/xdU4IbY6yH32epTErwD8ENhOG2rils2Jmr9MO7ZbppbOTGUK8jaiGjNoI7nl6/0mz0YaZ8Gj6uUBteqSNZx68g2D45QfhpO4zlaD/7VYsTmKNgub59vKaCY4wzaRpgmorm5Lkd5RJaTLVtRANy+jK9BWIR4AGUTkRBzR6VgjkKbcuE89fUd036K/ZDifsVIPaOzqjndggSAcUnlBEhSHP+q3aEiqJNN/MZUnyi6DB2X/43AMJaTd8WITuGVJ+wOzTzcF7vGOGKpCJ3p07FuBtgis6h3rPsF8TsPMliTkCkeylGOAR0KwwjdeucHvj6Yb9NSkgmg9sryTFuZpTGy+SXfK7wRc2KwlisOW5Yqa/58R6dS/DsXHor8dVgy/4MN4P0d1xpS37sNbRd8wUov4dT5+e65u2mvOsv/7kqoxJ9DoKEnVb8e1cwHFVX7KH9ceHuEEjfTTX/PZHsZbOQWSXMfM4r2ehewxtzMcpJZ8VlIS2cklw0tgc4iG5lVavlio1w5R60AoS3adJbrKWrww9fCbPAFzuzKKQG3YmfbTeH3rIRrDNqRhcsShGaHv16pTbyND1GhhGi0FleCx+bgZRCkmTpHNtzreWjNdv3d19ymldLP8F+NkJPtVsN98pQLiKlO+uBekUMUHkOLrs5X+n3Iib1aPAnimg7S1xAeNQ6x1b8j6NIFOmYKs9xZZ6zpp8dHa4znKGbP6wqs/O5uasMjG7GLU0VPn0wJ/DtM7jHhQCsspCLvYmHhr+ulzR117Z0BEPbk6UFW/OJEi8RYHxOmBuDfftYFHK8Of1oBwEKrTU1MybLXMXVrYiWulGp5XYMVugX+CbkHf+ahNbEPNQTFPe+itwkDlbPPRMkucQEPhHpra5f5qvA85YMW9Glp8OJviRzwlLwwZQnB36YZOKlP7yKeCnnTbbnWU/QXRdq6MRFe6aENfA35itGzCT67PJAtQDpV3yCShwaX6CRY9KOjMev1gBzwDhZt/vurxOa/WMJUFsWi/bZ+nNAY0qcd5J7Rp9r7leWLAGwXAMerKyQ6xWzFF6DcRUqlbBDzv9QG1yJML9k4exh41i3z434qyJOj/469Rcn+OwOXev0WkIYkXd7PA0DyC9ncIr7sDH15TNAKtdQpbvbRIvpUZI8S4Fn7tEmwpRuzPO0O3PBT4ktI+pATF84CyoigqVIAvrXwlsGUCN1uAGXaNdBNQRmM3hPByePb03uHrbaYCzSVTN3vgGDFDJv52EwwoI2F4yyfKs7OkrmWZFZgkzbZqn58GTbv8EMr+4pr7bmV1rdwvh5/yi7LRR9AEOwoj4jS75o+850ZLid9Qqw8LfaRYOOO2C2fENPKa9vFx8gn8EcMAL/RYSHfryeTdgph8kjPe8ncwmP8RHqAy5Ci1Q0fQ5rBDaEDRQIO7KM2Qho67TspXtfIAd52+eMszG90cEJBxX4MEuFkWiK9Jdx2lefl+emP+pBmP2kGcfSdAC9uJEfs3wh8POfCHcZx3sJhzYwAcT+T2N6A4v+RYVTN3WbIXlphbMAG++PEmL/xWj7bVI8BjOT4y7cON7U4cvhzz5krqRD+KDb/WPBaKGhEXafwMnrKMHRrnz46vyr2L8Q30Na8Y6k8kcUjFyA8BBr49Fu0oP8EEdOuDQ3wX/NrZQopy6HyvmHuFhFFr2Hp9+GGRa0ZpFrq6nLBq6l+NHyzIVYqsQjs6bcC57/fsBrt48kz4Tctmo63j0SwvGMKGnq13OUwqn6L3XWx/Y+/+be9WbMRaBPAy40XYwaxHtCKC02wk+pT4IjJzuwlzKlapyJvaQuZwRDmUfbZhZ3Ipgzv1YGnhPPjX29WrL9H6aUrt3OQwFgJTqa4VLjxfLgN/ANuvVMU4dJZyFpk+dKxYo4ybQ4JKicXqUIhgtDTPy84ZFMt5t80SP5MsQ+gC3KMTTOWAzZOVyuiUCtxinkF3yHBQScxDIsQECGVjzvnFQZeV9ODvWQf/Vd66h4h/gSxF0h3RW9xo2wxAoIycjftmYYmpI05GznZrPCBjHnZWaGcp3jG/zv8EAOxrDuUbp/pDmRrk/M5BgNqAZXTvokmrrb0xo7nr+f6EEATCN/fP5W/iXz7c7BRyzWL6Y471wLB9FhsOLg4fCO9f867zwdshjKQ3cxdA+23PxUYsUmC9dFOcBK7RdO+u/ukdS3Bc4jJ19UmvMu+dQAE5WeoscmE22iptr8QCVYH1nXLrBl94VLJmyffHGeY6DlpRC8Q+ZoGsyWMExUCIteaWRFTFXxvwrD/U+83A/qGysaxaGYbyxWJz7RM3tJ+MQ8pXEqgDY4GuPrcFC4daNxZ0KJPngv4Kpgokw+YooYrvVDuhvpcPZQaXa2pOCSf5wXJ2JbGBBWTZCvEWNLoGfkMK1+FjNmsMOb5C4LysHipt2VbHJDRY3pkE+jJiiuJszmWBCEIbaIH2B2DLJ3cHpgT+sdJqagqKjm3hd+H8vnpnIQdkfrJngQexwHIF3nvdLTwRvw2htZiBR7YMObfXPiYBdUW5pcLSh9/P0nm6Zqdr2mn/POdul6wSkWQM48BJDYCzUM+pGX1hGmqRTVdQq1jo8poT3oHcZtqZb4l1Y1L5+zsz2+N5qKaEbpO4i5ewu721usiOPrV5srcl5AbfI67gpOrijzigpqBC8Ic69PEYX38oCtE/s3JPoNKPdZsZVFVMfECLFD743HtaNdc8S+g36fwECQCcMZ0NpGRzl17DZmEypxOnzwPCFzXeEOZiaKT1tfJApRS9iSw4gATo4ws0G6tRCS+8IFTdXh6MPv/qEFAHBk7BCAuBSF7isOTxTAHs8epQkejGcotEizif1Y+riO20jnWhEPD/JF3vnNdrGktn98xn88CD/87YDsyRzbSVs+QPofEXKFBXf4PEO4vm+/M3Ex82JKtoE7LHJMX12lGm5HxX4lzYgNEgE7aE+GMMPPRf6XWxRZMyLnz1BZkMfV6t8LloOPgfI7ie0kc2yrGMFStpyqAgCg7N+3ZRc55KFnpbkYaOCtxoaot9f/81vexqNU+NF8dGOhForJZFhfuSvM+44pg2n/UNpTmXvBYlmQCxOtIghUj8Y2BFc6XoeIsQqS/hUikxSHSEMndFwHMXaOUwFCYZvPyLzWYmcwo9/48B4AQxWjvyIX0ovS/SUfh7pfa0AwZqQJzukoq6c44SE1Jct0F1oowqDWoHR1q2NHqFN170cpWHBehKZ8LUwtanhxMno7DiuPbeZ4mjhYQ8wl04QCt9Xj3Tj8X8CnRIT8OAnW+p2656XwdeKvEf8wrWrY12bi4fpRefOOHeUpVGDjws4pBlyT96MTdc3MADSN6dZmv8oAY+XdtEpx9NNCwVcwk3ZzyuZtGhqru3MFGACdIIgX6rA5muW0QYVdqFNFghvv6ti7PHxtHlDHSf1yCp4aw9s7vkvHfwn5NBEvnFsNispKZoxHIureXPxlKg1ZFrzUZdhK5dAWpv/hitg3mFOnws0Q2zXcO1r4znQNRCbzRz62RLRnr9Y+JwZiw7QhnVVzurIipeR2SZHtH+S3UquewVLJ3Fu3ZUh4e8W+XJEIng02r5AoDLwwH9k0vmm0LrLyzcwQwuQ0VvEhR78jUvr9YpH4pVgC/KGpEOBTPR58/3QnIbCPP9PZZiDVkWr6uLsxbBwgjBMVAQXcI8gGXixQ8bM0+95HkPB898rPFbBj8ceLowVNuzBZzSSzGyTpa0vnCMlbeliLWilwRxTygiSlb+zhm7c/VJvMlb9RyR4W7mIL6hClv8jOGJAAhee7Xrmng+2DjYVD9nwcDpHDrjvy+89TVko8fj776hAVA+iD8nW69GGcmbkNY7OjJOr98WVmFkVjO/qly7Wre6AAeIx1QN3wNM0FUlWmkpI9ru9/SdxNdUYt4Ti+jc5NWnHhPH0se4Va1rawR4R/hdwbt31Uwey5ib+uGVVzvoqxmEx28W4TTVNe0cNgYfPuNQEIAz9F+hWX5t/g2YugkA0wEjryRw3evepR+lfqE6Ozbik0oFZchBBr0Djt3AG5HSTFiJF76Jamy7daZp0aGx3r3QBJnCqFIKYm02KPB6fEr+hrb+aZmZm4LZPdddlh6RIY86zauWnooZjVMIecdcqLC3mcFqNNSYZSaE5Nnj9nxoG1UqLvmGQ+xKsyagAHf1H+E+5cBwbUHDmwrsBV9FiblTWjFHuw8gXK0SKCNadLZrWyTtY/kR38bIo87p+LX4Or1QHtVj/Dd2Pn/UKUk7EFxXLJc4K84mym6OwWWK1kPW7xhZXVo5IrVwtQVtP7QdkwqeixNJclvf9997Hz3kD8tTxX850zVsLDwHGVSEiGdZ5AkH1vD4+FGuMNC96gAXVYIHcKXUmU7xs9/H9Q5NLIoD0nYXsnrD+CePFMZjnDd97DTJ0vw8beuW9g2ixzYigZubhJxRx5kV38a/Ib1m55lKdYJ75a/8IX4SmiaM2oQfPtNzS1quz4AZ3tyF5Xn8lDTU85wsSAu54r8ULmIBqBeWC7w4WR4ejM2mTzclwbEv3x7yxyIjC1oIMwftDRt7eN40WcuXo46DMBwkxOf/SvSyg509XeCn5Kp/7I8W9I3jh4met6UtMUZXzBo+R6m/R2KDyEz28FFNXwz2D9UsAqE2PACJBlIhAZm7CYpjnGUrgbjBnyJ37ssILvtq/9LKfbKtt6IotpBp6jJauz7DVQ7w+Bkle2rfuvRV16OK5Xw3yTicKwdSSWS5QQxNNqBGFWpjH2gAgVqhkQRJLU/EaMOvoxiSl7mrHUACUWwCQDcKboZB9AVIqzOCD0CqTFtDGa41+NZewwhhNcmSwWe3wiwJfzGgFVyeNtOMhbHbUoINhepmtrVvGt5MuDjynbEChkealocAtqvfws0iT+opQtArJOlWEcE9jNFyWD+KIsMaN9yWtVabYCCPvroG03+TuGE4YpL1RRkTuJEplpDavB4qoleRua5AJ4g4shAPcXf1ayTyMdY1n9YvJVeJBU+UGirzhcdP0cytaLuV+Sjfp1P97Llx5IukAwZ0RDwC6GrQ1aPnGoUHpRj2MvMS1nZOQEIkNcAywhC7t10oIGF1lzCuLWHgbI3V+svxyTFkawHn2/vAm9GwqJqMsHnh8LR4j/lloadbq6xOx5Jp3Jm2j+Ba5m76mlWMPx/q4kOFVVdBsLAtlIKShio6VO/KzFyiUu1oQkom3jHc31tHY757HNCiYh+S2Lqt8LFk2oVpnSjc65SazwZGXAmWPJMBwyXNoXD0kZJgYcMJoEG0dclao44O417AEw0LI8xrbx24SLJm99XQcx/V6JXYtUPTVy9wvy1PyS+aifVIi9QCtDvFYqcLS9Gk5Mp5+vDo66egqw8gS8GVpjR4IAqjXe4DXTZ/1mGLofT2oUDpj/xrOcV4tf2iMLB6DWrrPfyczrlil1Cb23B7tcKN2QpR6uQf7IiLpWOvCH14weRIh3Kl1XhkFsr3Ir/z0TQNfHuxbYGXraf0cjvQTP43kejYd2h32hFxYV/f4gHvTyfgORcDlAix4qvaaUzVahQ39AgmAFfzS8YF6gU45FgX0jTKYS0vf+WPQEqN6eYAlzcmnD/lSRYcbmBoKGdRH0z0BT/2t0LXkXwhMTLXU287gQ+8FWeubEGoHFKlycO17ETxhI73dUHD90D/DCohUeOFGfhNVf7CiDgO48YfAG3OWi4QANdMNoL0IULgOBh07xhdTlDPXG0fy/J57+x0PMKIqRSjoKNNAbwqyt85XFXqHXMTXP4UREkO84k7wj7BOXXgldvm1vnrLsBhVVxinMcwpJtaS/eXLUZUQIFp+SxM6OQQglNTHlCN+7Tp86mLezbsuziA8qIpYCyqDT6oSkaE9mlJSoD7TdAQUu/oPie8cHid/rjPy8bUGua6dok+nclDCdo1Ftka+bNoKkfwvR0D2QEPkwCAObv9AQ9+gc5glqM1riFMSrnHF0B9XrjHvT5OdmhPVOdvUcimQ/P0I8XsDWzNmT8pz1nid57Ix29f/P9NVv9BXIMSveg2bzmRYftjwsP67V8SorT5unQM61L0QXJkPhYwXPBFjjE7xQzRvUo+cdw5R3rJSnZx7q3F7oZkJuYeGO+dWH6LaonXry78aOR5q46k4VBoRG6cYPpUKhHDKfn+7KyjB+Fvig5hsGavQ+siXRCjjM7quehGq5Rmkl7efMqiet5q6c+ELJLMAe8jwSzNWDHQwGOYlA4h9otJuRXev0e0riH7pB4/ke3I2r3P61aA+/UY5BgPstMx1tNePTTy1lDZE69DeDxmiFXPyhVswulxlzD0UgkoLYJa7O1a3IibC5hjwaZAugFZXkh/ktu1B9saeocwT0umNlcRLtOF2zfC2gURiM8RBPJa7GLz1DFqd0soW9n1aO96dEwdi1Cb6PeWn05GRusAZZF0mEHQ29cOJqWFHG3xjMF/IgAeH4Fy/D0vxtjXxMczPJmTy4a/mY0gxJNWwOummyDo/Zp9jA+1aU3UHZ0LfSTEi2UrIRcYUMdibBOte4hwIE7i0RlveplZFY0GW4MYn1Y8H+9ZxeuQRnFWayLG0U7C/sPLN8uy/kA8nCeKPaH9fmrRd19zc1HMEuOiBu/8ULjRcmyyHGRdubCzl0Bydpvouzm02ceYjWTZjAN5vX7aQrn3js4Q3VxkfZz2ddPbM0SVwE7lvKFylgFbLom8sTROhvNnqzyVmu67M/wPA9uINMYhNkBMavvb6Wc2lsWPX9Z50+CqsfWsQpV47K2SQhZXK+V5IZ+TWqZyJLqhVZ8IeAi6JxmXnaEWZn1Q859pzaIkZpfdhm3Z+KgVDTBzOox81LLoC+AkHVHraHRO8DkvLgKDY6gSpK+47Xbe6M0kD92E03V3Rc+qcJo1WvMzwTqlQ7PCYsJY+prS35oj4tSe1qJzmPBZwDa4mxDWwf1VgpGEQdSt1p/vW1mrRWtjzFXqmFrfg8UEVqN599fKNMjJIHH82rigU/R2xaaIQTehUUE2mQWgw3XJPMn+YFf6ooWxMAvw//csWB3xvVU6lTPrxPqmME1tQU7YUWyw/AFpYRxvvngXPRrH8YuqvcxsoCTCAg/gPzz+ItO8aHd4oNJ0167utbT+2pv92xMu2npuelFo8DSNIKzJq7CJn8RaqNRBWFiBkX9lkni8A/8la9f2HzFC/LjbIf5HBaJ5LLlOBhoGRNwGFpBlxP/qzAEmbF5bMKoJuA33v0IdysNQO/Ev+UKc+Zow7s3E7DrTFBDD1iCMgTG7xBRLGJ3y/CMIHZdOh6p0lgvWiDT1KNx0YN4RgkNTlmBy1WdR03I81vCIIHb65YJ6RZxxlt9GihqeD0YwVgzq3EhG+DiCzitNkEEa39Xuligk+wt1GZPUkQh0qGnsOFTXdxHxqt9Xp0ynUVjXZ3INsg4/T3Qi/N1EO7JlvqKMaI+ajFsC9GHVLGW1UOvBkU1ZtV3adhCubEdcwcdwDcaHc5FhuUHh4CF1PZaf+W4KuOrtkvROS3AdSbW0qrsgEP/uvyGGxycbhlm6BJGGygBYq4Pl+NzbtBOArR7GRrSXXXybgeja9LUFZkCO/zNBW6figjU45TBmRWw3ZTGN0xLaTNouORGuzMRHp4qbB4gNwd5UP1V+qTnYijijMA/4umxPFwEP2VbWxbvn2tiK8OgFtSgazowqPbugztnkQYHytqwJCfyt5Ef+qbWbhGS16EK1LGao1+Mq+r0spxKrNmujlm5gviB3f8GQUwBlCb0zOUCdgSVx75YjdfbtMEXtQNOSxr7GZI+WXNd6e5KQTfm4e/QYliEdGeKkE5RpunrvH7itbqBkQ1RztanlVFTcyQqrNNCY2DIYw68of5dDjsR54BBtwgc4zz+bOnk2PBz2xTqhGawp9v0rbp39mpZ+x79u4POpj16fOKolCvNZzu0mmAFK6DM8CqD5hyIG5o4ojRAIvY4vC2diXAoDzFG/PI+uk4L0u27+tHBAzwdwkRgent8JSYn3GqM1kC+N4LlNRKCBRGqHqcomhUX+1f1pCJoDN8yMevAAsA3yMxnJSHwLegTAY1USBx1mmrkz1qnkYEF04BT1JOkX+hharmLzm/nsDfYgCs1VQ8oo1g82e+g9CQm8si2AxJCaJEIG1MlHzlmCND8fR4zKHmga549oJvpSNnDVqag46hGLpANj0NHEQ4J7YjCR7KL0I6UQLxYHLft0wjz8jNClGFPcnbFfMEkVzI4zbyEi1zl6xhDUwDpPqsUnd0QDASxb+AOVP5pp3uA7+CT4v8CD4c/mtpKX62JcnvyNsjkCARgtY3nfXHPwM3ZD8yx0vhCi73BPA33mChWY7NwnqTK0qYdl/hoExHaRe0Z98nlMKSfXm1RxnoCCDX4uc0JHfyq1jGkvTjUvoiOr9f67w2Yi8lyaQ7xy7hCBnQVEtcrFYVDHrD/q2jNbDI3Q6RC93tAhnM5PnMMZIrCrwA8q1rRiOhaxkwrsZHVyU+ehqkU3kdErCHjrqT/NDholHB7KVy7Z357hm9wKq2Zqcx4oWD+e7UrWd+rJPRUEKd4R153CIs/k1SH9HwAfn00ylCZCr9GiWwZMXvwJpsi/jknKYcxfehWyXhR3mJ7NuXTqnXHwZat9NkXq/xv3o1zg+GmFMqmtAHGbbT4yrl9x73xfqSUqLjb/Uq/2kt/aU7873QnnZm3Fra0w4Is8dseMkSBaaJnmzn78Q6SLWwjzbvRHcCE16erjM57qtc/NlKw/ThAeF6N+oY4S0aYU3LlzQQghYMD/ToSphcRQ+K+EI3349gIxofY9pGlvNPZ+JBg1jd7ynccZdtx7pQvmE7KCDZ4l1ES3zZ6agRQIkvMSYgAtzdDNR0byGsSzf3bYZdSNPzRLjJW2raA9Jgb+bktrCnbWcc4mC3ioNA+gH3buRDcHAfd3KBPz54PLLJirDBkKrJvoiSalgaGDlNgp1c/V/UtrPvTys12DkIUwpCUQxByHf+CQXUtORzPOXMCJ2eaT+XCs6mCdecUBo/I0M6sVy7QpQoJrMCZ2czvE1wHFYy6cADyWBkeFYvPDhS2s6CnlQzyGMoPTk4WFVXa01EKJhZ9AZo2/e0ibZIeVMmy2CPX0zVjXfGrXcx+8DoiQUA7UEYJlbO9afF8yrBzUzB014W1CZ51i9yrNYDLvcmpOEtJkiCgZVSqupPPKk8N8YfSkEUlHvEfOBWRTwbcZy1UIV+aE/BtW3xdC7wbsBHkZhvxKIjpkNllcL4tUAFMXgLgndSwhmuDqog8A1Fmaiju1XcvKvCkNW3cFeeCoeFMeyfLTaeBGJbAWTRm4SMQ+/fkstILLwmP+svXPIg/8FOvBbeB2yQNn/KktFKjweVrvqrnt1aBJcLRYP8V4mbZfrQWB4xhOu6ZUo2Un3mVI/tk1hywebiHOytxpzRgkA8gflQM4xPunwKNLuJbiuwql1vSkDFB9Z6R73LoLBQ9EK9Wo59eS6eBPj36bY5arl3ndGakx7HFhVWtEK9ihfZ6h4REeDZPdF+6yWQ219cTaaG0/mHt/j1xc5c46sF6yhpcaAClUDgsH4NcQQVd9fcRl1+Z/d64LH1db6YXtGLZi1DbQthAf0HjufDfw4W1Q/o5m3EtjosHVTmDzlwsmJjlGKKX9h+N2jJhGzVVWGtiev214EBb6cvBmZ7fR25VHasnElTuVxRGdsAoo3X+xXZ5YV5lrWjopWXcOHHcdGSuFe08gq5sVC1OFUgQ5Lp92Eh1h5ZkLUpiAzZMxo2mdn9O4J/ZA1I7t8srwbK85hVI4/BaR4gQblXkqBnDiojH8DMpcWxFcS/7F0No4d6yvKGVQw9aZIRBpdPmvwULfrUtklfSAlVMP5FfFLg2MXQr4oDW7Kcv4+gXL6p35sgXcOGn25GP4b0/nx2irkXsfJ56lr7+9ZllTwpveU2TKNEMxqGcK6yST0NrkO3ckK38ovWtwJdmwa0Zw1DYI8wZz7HrNUwW3yWYcte+mU2kl1L6heyAzUccmupGRF4OJaOcKX4CDvDkakW376dxPyhifCQzIkFARljHZ/xFHgq8bx/F+Td+3h3+4LEWw0JbXOul/eu6dnAyoXiSR18iBrkdLHsFZ59uuzm1ivKPtdD9Dg7+FX9pn62ySRSuvlsFiYyb7QZntugjwIPLZGk63A8cBo0XPuGxvNkn9nxXTD/bI4879LepRGLLBn/cB2v9s23y0oc7YV+vxcn2KYr4sJveKiOnnJQKQeO3OgRdvKXcL/76x97E7gGkOHUikPidzpPQNEj1i4O8zOss32oiCNdto8wjL0C6fV51M85TdjG7aRt8qPR+aN+Y9za65bB6QKCI+V6OBQxERV2TIH1NvmXTzTVH6rUMVpj0ds1tsXJj5yjp0Te6fdF2hGb+zjYEFNwZTAVW0X0eOld/qvIQRLyZqLTO2+bWniOPCq61PkxN8TNYs1wrYWVAWxaW9Jn5qxjKTcxIWNFamwTtyVOy+35D6Mg0mjJ+iWjz1W9PycGWFEaRQikHwyD+1V0iJDp7SkfBs55+IsAxi4jjvA8azZFQeJDmm0aHuf5gMTEm+TlpePxzsvNdOsGZsFyVelrZuleCvMTaH142xdSfkWdvD3R6TB3SmtsWx3uIsUlhcfLlxeA2syhxocx2z1FfjLkHGHcC8hkXvXykiZbnbVb/0WtSTuYFnDQwUTMwLox7yZiSLOTjbsRkdVkVbIAsJf42uqJ9xTIUZel59HAyDLQH18A9SM+AzF+NIGB5cRvys5ZdMffZOXkgobbVB/N6zE4ffdHUPSp+Vt8k1Kb3X7RTzuTdin/5/QEItQ7cDHNq00k30ZqaHiWhdahAu3GxHV4pJPh8ojWeAlJhqdD/SvIqwqu6KhvNPJw5EwYdKZD/1xtiq2JMYwZH8PdfnWZmMpnJ9s4/VturNxH3Wez9WrGMxUsD5/RSbPLBjClyRQkft5lI6p1gKxV+w8Nj5cLLL5iWthDqkBbQ9AgJYhGzbLeSLzMoEO4CdNmKbzSWcoS+sYT3aiT9E4BJm+GzyW/Fk+ZR/5Rr9plEajOU9eH8FasjWYl4POCRmZyJVlomJhIAKNuWGPbOKiQbibQkytPLvq+u8EwXj5COTVsul5aXroWoaznGIrnBbT7n8NN2YBtBKsAZPAUdGiEYO0x5HFm5z22Tq9tJSCyRqCXyLZ232txvDmTpVAln75uHEgYFYY79yYpalUulJinSqXovJ+jf08cIUbUEpP1Jd5jqE9nNl8YdqLJJV8gSoZ5cDJTZDFB8rnRgaldZt3pTT2ycs4AZnlyNp2p+cYP/Uf1s/OWSzE1sLuqYsAct9oal5N5rEmuPgjZEPV+PdWmlwlNeqwE1Mlbe6fe2iFMm4U3DYSwTXPoBR13kZU4ixK6QmblRJdBf+0bY1u0C5MRUEwKYfeNdoP81AcrMhoc317G6sjk+nfKG9y2ZR/MI0OXoGsYtJ+c06hP53LXxihmUrTTjtD7yFxZMxP59u50F8nvGt6n2bCg0bIpRZSGhzEl0Yjod8N9NPtPgUoSOV8OfMuHfK/Qu5SLY7XflVCBmDs+bBqNo8Tzv3j7dyxZ4Yae/d5jIWtDOLwOSLko2kz/fADDyEAzR5FzLmrlMQEXA+qxSPDe7yUSogNp11mK8L51Yx1xVN2LeiKFXz46oWpDzF4QOftV6EO2WIFyIAnofqd4+DwQ73asvgi7vF3KoBxWia5WfGoe33uPhIOB+S0KkDUCS0/kojq5HpFAPOCk+Ky1VXWnTlQRcFo8T548kyAszicbuDG0htFWB6cErSyF8bpiacXljJNnNUJyKNyDRsnMuQkulVozLjpYR2bkSx+fNd6nVmiFODxDepHqWfHmz1jyP4n15HQW59RxKyvJHY4a77IZGYLo083Fr2HvNP8aJNdGqNrcpjb/jFwXey429BHWE6f9yJ8YESXZfr/5uyRix45JIfoyzuTSDZazWcL92BZX/MVDulhcrT+YvogIchz9zVc77oPU8pZDerWQCC6Rpxkj5h3j/8VN9XCz41ZfnbhkRb+wEpYpgNaamz6FJ04DEsgRkbl9FNJCtBDtSQmThWKLWFSX9EyTK+FHQKUtF0yYbJxK2sB254DSpmls+APJ+iG+12mGhK9pjMkrwU94BjSvZP7K3d6fLmsD1jyttrFCzgVfuROdKqml3eFFrJBpKiierktiSPUuH8g8rV39ls4E2a0+LWms+MPFqr5hUfiwAlJJlCoROXQlyUtbkNzq4fThigQZqYLPZfTt3WNb7+VEEKrjTenL6fBuT4u2RjOrO1w1its18Zw5DGY6ijUl41A8elP8HpcQIl8E60HgS90zpV/ptIgbjUhKKAtQ+kbkXZuoCSrW9FTBSKFQjxaItPUo8ggJv33jp7vyNuLH/xxmDHTDpwea0deTcPZwURTlKBq4AMrGOa6m4vOHrGP6gGK1FrCossud8sVPxkvqzBKOyY+y0tvK5zdKhk52xHsR1bMoE0BEBfpwHY6sQtCMVk1UDfTTYKrcBnC8h/+oxMt7VuIR16DuyYlju3sUZLpvhFT5xanVzxVZ//DQeA8AguyDg7jVC+7hIivWG4RuBdy1HI+DqRgVdbxNaQKb+HZL1Js2MRCDUOcXHrZG+GoT7gWPozpVYH/W3xCGHkFGKvPa+KOW2W09YoshVtrVbxNsK+o7x6jeYmuRI7jBAFqIqjCaDDHWMUMuUPysxhdytEn61dFU6G0RMWHZ89cpZ29SNceENTp3XLxCMakjL10U3AiQLD7FtOkKK2yj9JS15FEzrPo2Y2L9w6zhv2+65UDh27k94G1egeqKV1rGk8EXJrXE2nKlC0EYT2cQ0cnHVbUpuDjYx09v+iFKqEkEBOpc7aLkk958RyZ9okxaNy2dZljpnuYCrijJbRsMKJx+UVM5LZPK/7IJFsgFQK1TvqRyzyOktD7eofYcC0gv94OEJ/d0eyjX1Lmp2i7eFAhwm1BYYHb9rBm8wQLj2VSeG0JjiosUYuoTM8Aspf8mPjLaXbRnp4yI07gE8Paeg3VERLsmpWb7nRS/bdSqZxZxR9pz8PBAzL1G24M+Cq5TfFeQRxUNHxX2BvupM3FS06gJeTnv56bi86s3dI9ssbKwu0tzFwYF4fPgyHYndnFsS+ctHloDHevbCHsCLNHPch45lhQWjUNOFdccvOAQbgsFJs1urPfBjWDRPZWkshT3bSpS6+CKGnn3M2lwqkUwVgPBhMyffno4JKmeF+cFughjmzadNJDtp8jrb6w9sFoibmWrg4qI0a1Ao5FSik6BO3AvoL1yQhifDYA/CbHCzIim1ocX9YgbpM4BpMDMECIJ3QkPt4RxgtuWBXeJOOOKOxFXfqJexPbQz+P8Z8/4U4/uRk3tJsI3Y0BrmBcpvIVmeVfdApTREXszUrmWdEojuLwyYUGDwozAsyxpHZafW8Ip7XTMm8xQNUUwO+zgvc31dJ8eWx9aLtbWZqFEJ8YX8+640hcfCeaMZvLLVLWw+HC6pF3BHGvcCEjRlQbSiMPR+Cf3WWfthGzjM81V9mVoWQJQlHGInMLQk/li4ceYv1LjmaeVzQo8APNeIyAN/MmqswYEaMpRpyLSqZFYPrVpeqxji1qygG70TydSZhJ65p3NdpO39RdkGu3+ulkdAHN34zKh0igAimmgRiXMq6+UNoYd7wfevZSqimto2XkgRoJV2B2fVum6+5QlJfDYn51fnSdg8Hi99QEoS6itXZdjIPROvGFgX8ZZ71NZ9epS6R4ZsYnEIzj3mE14lXoG24pRFiaIntSlWJNiu86Ts6FY4+y95EN2jmzq/uZBnPWtmrOa2Tl8PKlUqs+fOJlFIzhc0+qpDF7DbF/QQfoD8HIlDswslXGJpZ9VrlqHqWaDvnDy4nzlvy2yHmnyLCTzr+u5iHLAWd6tcXChJ0hUn92nfS1N+hC7u13n3gNLn49Rvw7IUa+9Uvu+TXszNxzelm9CnIegTVqz4bcK4qjJiBrrhuL+pshRKC7G1x1wNDlqq0xQJEzzwYpr5yWkmYFW3Yrx3J1PLYRqBONlG3wiXj95+UcpAljyJ5sk+sZV9HAgPGqbav/65n450G8Nl3QYZVTQQrC5HvNbDNd716pCmoFNVlhVoFyX709gExT7LkHHwoJoBnKWe5DwV0P0JMX25gLA4xOqWSdmHIbDlz2p1YkEReqCgsril+WD+5fNSAHe88cDUa19A2vhQpcivKnz7QnFU9c23ED3hbfyJp9jjUHxR79gLch7suH56ECUdHNlT/KB2dVJszEeXEIbmb6loiSJ3XL7kQXMRjrjadbMmoXXekNW/Q4a4JlXArZjkFUH2iDXWwQjaJZKpUkd3mL5xo0WO/2hT0U8mttUcG2fMw7aBBVvXXcMmXWOmelX3ooO48wX7AvePX9D4IOOLVrlUUCCsv7yf2A3F22SYFjPnxTk2gBqPECU11JL4cUkI1cbdGAyxB+2ENbpuZcAYVUOWmjUR+Wh5j/UrxrtxgEuQuyuMvXHxZesTa3X0IRTRQ9QaOu6b8xf9+z9okUAci+ZDf1W/FcXt3+K4VTeOyPrRYzxE7RdLqp9Tp9MRBYDgZEcVW22C86TqQI+K4xcsJu6L2fOsrWLlm/ZMeLj+Bl/azMMNiqv6qZl9gN+tf9vxudUSXN/hnC5R+FcCVfTzzR+oVpqC29AhpWp4qKAFfmHmKrqvWlBXI0+U6/q9xZBm2s8THcFKjJ3O+7r12G3YdhwgMZvtdFvOSdzeVPu7qfr8dpAVlN/krinZGlMU/xzNwF0YcOP7mNvxBExj9fy11ufo7hogjPLCAhIjheFHhg5A9MkL47qyhRSq6TpiMYq/Mfz3wWHM4XI0SJTPVRNo9gDk5TL3v3AZkQLhLTytrxWVH041mTyq7m5st9gNZTdquw1AqekjksLP+HrVne8MOBnpUsr3TP24EV8P2Oy0XYG8F5ZPfUDnpsWg80kRvBSBxZ7jFC+PznDpSS2HpmO0fH4Si2Ts+Tz62TUA4UVD2Ijf4xKEZ76Pp1CCb++AiYPDd/BkKigbJoNT5zxduIYy8NzKxx8NruF3ZZS0EV8yIoIL282z26tDOVjtZMz4GfeuRNd/2VDwhxfnrh+oR3/2zrVebPNhIEwl++vmmR7KTTEyAxHsooeJ0xWulLXfoCDSjtA80ptfIPHznwrd563TmaOIKEcBLCqJmYAn/NUNWVsobXXszXwOM7qsr/H853F3NSWCm8sIN5eMEPuyZGNy07WDTi1Dh8F3XWOkq3oq6wTKNtibOZrkC96Jg7uSxMWZyt5WyLZ/CiSdPeo0KlNnVnzUEt/G9iRmEbvqCGAZ9hZEVkiDthj0n6xO88F839oTa+gcuTeD6CKUt4cAY4hOvIBJYdPgVtCnd5VRGoy6oZ8n/GxkbB5r7LrE1YqJ+23ZPtyMaj4HVDw0K/NLrgP3HmWaIaVoJH+XVfsbZvN6JxNGL/0VjHoLAPKEG3je5evXUbh/+0acwBlJu+u9oAqCvmDfujVX7J6q8fyv1s026+PZsAvCGukpMML0iihUPlJeKjd4DsAbs2Sj8KTord+exchY2Xt/pxesXnKnFC+ODipwpe/ku7gkVH4GDNc/pJjhdEEus9A/isU+DFzsZDYuUnXMEVhGKC4zBzer2S/1eCP2y+HldOzvRSh7wrOb6wdwAq6kAAAA="
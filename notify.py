@@ -1,35 +1,179 @@
 import os
-import smtplib
-from email.message import EmailMessage
-from typing import List
+import functools
+import logging
+import threading
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
+
+import streamlit as st
+
+# smtplib / email are imported where they're used: most sessions never
+# escalate, so cold starts shouldn't pay for them
+if TYPE_CHECKING:
+    import smtplib
+
+logger = logging.getLogger("maxe")
+
+# Module state survives Streamlit reruns (only the app script is re-executed)
+_SMTP_LOCK = threading.Lock()
+_SMTP_CLIENT: Optional["smtplib.SMTP"] = None
+# Seconds per SMTP socket operation. The client is used under _SMTP_LOCK, so
+# without a bound one hung server would stall every later alert.
+SMTP_TIMEOUT = 15
+
+# One worker: sends share the pooled client under _SMTP_LOCK anyway, so a
+# second thread would only wait on the lock. Alerts queue in order instead.
+_EMAIL_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maxe-smtp")
+
+def get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Streamlit secret if set, otherwise the environment variable.
+    """
+    try:
+        if key in st.secrets:
+            return str(st.secrets[key])
+    except FileNotFoundError:
+        # No secrets.toml at all (StreamlitSecretNotFoundError subclasses
+        # FileNotFoundError): env vars are the only config
+        pass
+    return os.getenv(key, default)
+
+@dataclass(frozen=True)
+class SMTPConfig:
+    to_email: str
+    host: str
+    port: int
+    user: str
+    password: str
+    from_email: str
+
+@functools.lru_cache(maxsize=1)
+def _smtp_config() -> SMTPConfig:
+    """
+    All email settings, validated and read once per process.
+    A missing key raises and is not cached, so fixing the secret takes effect.
+    """
+    to_email = get_secret("COACH_EMAIL")
+    smtp_host = get_secret("SMTP_HOST")
+    smtp_port = int(get_secret("SMTP_PORT", "587"))
+    smtp_user = get_secret("SMTP_USER")
+    smtp_pass = get_secret("SMTP_PASS")
+    smtp_from = get_secret("SMTP_FROM", smtp_user)
+
+    missing = [k for k, v in {
+        "COACH_EMAIL": to_email,
+        "SMTP_HOST": smtp_host,
+        "SMTP_USER": smtp_user,
+        "SMTP_PASS": smtp_pass,
+        "SMTP_FROM": smtp_from,
+    }.items() if not v]
+
+    if missing:
+        raise RuntimeError(f"Missing email config keys: {', '.join(missing)}")
+
+    return SMTPConfig(
+        to_email=to_email,
+        host=smtp_host,
+        port=smtp_port,
+        user=smtp_user,
+        password=smtp_pass,
+        from_email=smtp_from,
+    )
+
+def _drop_smtp() -> None:
+    global _SMTP_CLIENT
+    client, _SMTP_CLIENT = _SMTP_CLIENT, None
+    if client is not None:
+        try:
+            client.close()
+        except OSError:
+            pass
+
+def _get_smtp(cfg: SMTPConfig) -> "smtplib.SMTP":
+    """
+    Return the pooled, logged-in SMTP client, reconnecting if it went stale.
+    Caller must hold _SMTP_LOCK.
+    """
+    import smtplib
+
+    global _SMTP_CLIENT
+    if _SMTP_CLIENT is not None:
+        try:
+            if _SMTP_CLIENT.noop()[0] == 250:
+                return _SMTP_CLIENT
+        except OSError:   # smtplib.SMTPException subclasses OSError
+            pass
+        _drop_smtp()
+
+    client = smtplib.SMTP(cfg.host, cfg.port, timeout=SMTP_TIMEOUT)
+    try:
+        client.starttls()
+        client.login(cfg.user, cfg.password)
+    except BaseException:
+        # Connected but not usable: don't leak the socket
+        client.close()
+        raise
+    _SMTP_CLIENT = client
+    return client
 
 def send_coach_email(
-    to_email: str,
     subject: str,
     body: str,
     reasons: List[str]
-):
+) -> None:
     """
     Simple SMTP email sender.
-    Requires env vars:
-      SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, SMTP_FROM
+    Reads from Streamlit secrets or env vars:
+      COACH_EMAIL, SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, SMTP_FROM
     """
-    smtp_host = os.getenv("SMTP_HOST")
-    smtp_port = int(os.getenv("SMTP_PORT", "587"))
-    smtp_user = os.getenv("SMTP_USER")
-    smtp_pass = os.getenv("SMTP_PASS")
-    smtp_from = os.getenv("SMTP_FROM", smtp_user)
+    import smtplib
+    from email.message import EmailMessage
 
-    if not all([smtp_host, smtp_user, smtp_pass, smtp_from]):
-        raise RuntimeError("SMTP env vars not set. Set SMTP_HOST/USER/PASS/FROM/PORT.")
+    cfg = _smtp_config()
 
     msg = EmailMessage()
-    msg["From"] = smtp_from
-    msg["To"] = to_email
+    msg["From"] = cfg.from_email
+    msg["To"] = cfg.to_email
     msg["Subject"] = subject
     msg.set_content(body + f"\n\nEscalation reasons: {', '.join(reasons)}")
 
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.starttls()
-        server.login(smtp_user, smtp_pass)
-        server.send_message(msg)
+    with _SMTP_LOCK:
+        server = _get_smtp(cfg)
+        try:
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # The pooled connection can die between NOOP and DATA (server
+            # idle timeout): reconnect once and resend before giving up.
+            # Anything else (a refused recipient, a DATA error) is an answer
+            # from a live server: re-raise it and keep the connection.
+            _drop_smtp()
+            server = _get_smtp(cfg)
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Don't hand a dead connection to the next escalation
+                _drop_smtp()
+                raise
+
+def _log_smtp_error(errors: Optional[List[str]], fut: Future) -> None:
+    e = fut.exception()
+    if e is not None:
+        logger.warning("Coach email not sent (check Streamlit secrets): %s", e)
+        if errors is not None:
+            errors.append(str(e))
+
+def submit_coach_email(
+    subject: str,
+    body: str,
+    reasons: List[str],
+    errors: Optional[List[str]] = None
+) -> Future:
+    """
+    Queue send_coach_email on the background pool so callers don't wait on SMTP.
+    Failures are logged, and appended to errors if given (the worker thread
+    can't call st.* itself, so the app shows them on its next run).
+    """
+    fut = _EMAIL_POOL.submit(send_coach_email, subject, body, reasons)
+    fut.add_done_callback(functools.partial(_log_smtp_error, errors))
+    return fut
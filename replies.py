@@ -0,0 +1,20 @@
+MAXE_REPLY = (
+    "Acknowledged.\n\n"
+    "If you need a substitution, tell me:\n"
+    "- what exercise you’re replacing\n"
+    "- available equipment\n"
+    "- what feels limited (pain vs tightness vs fatigue)\n\n"
+    "I will preserve the intent and keep risk low."
+)
+
+MAXE_ESCALATION_REPLY = (
+    "Coach notified.\n\n"
+    "Stop the session if symptoms worsen.\n"
+    "If you have chest pain, fainting, or severe shortness of breath, seek urgent medical care."
+)
+
+def maxe_reply_for(_user_msg: str) -> str:
+    """
+    Reply for a non-escalated message (stub for now: ignores the message).
+    """
+    return MAXE_REPLY
@@ -1,57 +1,251 @@
 import re
+import functools
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-@dataclass
+import ahocorasick
+import re2
+
+@dataclass(frozen=True)
 class EscalationResult:
     escalate: bool
-    reasons: List[str]
+    reasons: Tuple[str, ...]
+
+# Patterns are lowercase: they run against the lowercased message
+MEDICAL_RED_FLAGS = [
+    r"\bchest (?:pain|pressure)\b",
+    r"\bfaint(?:ed|ing)?\b|\b(?:passed|black|blacked) out\b",
+    r"\b(?:can't|cannot) breathe\b|\bshort(?:ness)? of breath\b",
+    r"\bnumb(?:ness)?\b|\btingl(?:e|ing)\b|\bweak(?:ness)?\b|\bface droop\b|\bconfus(?:ed|ion)\b",
+    r"\bpalpitations?\b|\bheart flutter\b|\birregular heartbeat\b",
+    r"\baorta\b|\baneurysm\b",
+    r"\bblood pressure\b.{0,60}?\b(?:high|spik(?:e|ing))\b",
+]
+
+INJURY_RED_FLAGS = [
+    r"\bsharp pain\b",
+    r"\bpop(?:ped)?\b.{0,80}?\bpain\b|\bheard a pop\b",
+    r"\bswelling\b|\bbruis(?:e|ing)\b",
+    r"\b(?:can't|cannot) bear weight\b|\bcan't walk\b",
+    r"\bshoot(?:ing)? pain\b|\bpain down (?:my|the) (?:arm|leg)\b",
+    r"\bunstable\b|\bgiving out\b|\blocks up\b",
+]
+
+NEEDS_COACH = [
+    r"\bmax out\b|\b1rm\b",
+    r"\b(?:change|modify) (?:my|the) program\b",
+    r"\bskip (?:this|the) week\b|\bdeload\b.{0,80}?\bnow\b",
+    r"\bwhat (?:did you mean|do you want me to do)\b",
+]
+
+# Matched case-sensitively against the original message: "PR" is a personal
+# record, but a lowercase "pr" is usually an abbreviation (e.g. "pr." for per)
+CASE_SENSITIVE = (
+    ("requires_coach_judgment", r"\bPR\b"),
+)
 
-def _contains_any(text: str, patterns: List[str]) -> bool:
-    return any(re.search(p, text, flags=re.IGNORECASE) for p in patterns)
+CATEGORIES = (
+    ("medical_red_flag", MEDICAL_RED_FLAGS),
+    ("injury_red_flag", INJURY_RED_FLAGS),
+    ("requires_coach_judgment", NEEDS_COACH),
+)
 
+# One piece of a \b-bounded literal alternative: a flat (?:a|b) group or a
+# single character, either optionally followed by ?
+_LITERAL_TOKEN_RE = re.compile(r"\(\?:([\w' |]+)\)(\?)?|([\w' ])(\?)?")
+
+# Past this many spellings an alternative is cheaper left to RE2
+_MAX_SPELLINGS = 64
+
+def _literal_phrases(alt: str) -> Optional[List[str]]:
+    r"""
+    Every spelling of a \b-bounded alternative built only from characters,
+    flat groups and ?, e.g. \bbruis(?:e|ing)\b -> ["bruise", "bruising"].
+    None if it needs a real regex (gaps, nested groups, inner \b).
+    """
+    if not (alt.startswith(r"\b") and alt.endswith(r"\b")):
+        return None
+    body = alt[2:-2]
+    phrases = [""]
+    pos = 0
+    while pos < len(body):
+        m = _LITERAL_TOKEN_RE.match(body, pos)
+        if m is None:
+            return None
+        if m.group(1) is not None:
+            options = m.group(1).split("|") + ([""] if m.group(2) else [])
+        else:
+            options = [m.group(3)] + ([""] if m.group(4) else [])
+        phrases = [p + o for p in phrases for o in options]
+        if len(phrases) > _MAX_SPELLINGS:
+            return None
+        pos = m.end()
+    if not all(phrases):
+        return None
+    return phrases
+
+def _split_alternatives(pattern: str) -> List[str]:
+    """
+    Split a pattern on its top-level | (not the ones inside groups).
+    """
+    parts: List[str] = []
+    depth = start = i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            parts.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    parts.append(pattern[start:])
+    return parts
+
+def _build_matchers() -> Tuple[ahocorasick.Automaton, re2.Set, List[str]]:
+    """
+    Literal phrases from every category, in every spelling _literal_phrases
+    gives, go into one Aho-Corasick automaton (one pass over the text,
+    however many phrases there are). Whatever still needs a regex goes into
+    one RE2 set: a single linear-time DFA scan that reports every residual
+    pattern that matched, by index.
+    """
+    automaton = ahocorasick.Automaton()
+    # Case-sensitive on purpose: patterns are lowercase at source and are
+    # matched against the already-lowercased message
+    residual = re2.Set.SearchSet()
+    residual_reasons: List[str] = []
+    for reason, patterns in CATEGORIES:
+        for p in patterns:
+            for alt in _split_alternatives(p):
+                phrases = _literal_phrases(alt)
+                if phrases is None:
+                    residual.Add(alt)
+                    residual_reasons.append(reason)
+                    continue
+                for phrase in phrases:
+                    _, reasons = automaton.get(phrase, (phrase, ()))
+                    if reason not in reasons:
+                        automaton.add_word(phrase, (phrase, reasons + (reason,)))
+    automaton.make_automaton()
+    residual.Compile()
+    return automaton, residual, residual_reasons
+
+# RESIDUAL_REASONS[i] is the category of pattern i in RESIDUAL_SET
+PHRASES, RESIDUAL_SET, RESIDUAL_REASONS = _build_matchers()
+
+CASE_SENSITIVE_RES = tuple(
+    (reason, re2.compile(pattern)) for reason, pattern in CASE_SENSITIVE
+)
+
+def _warm_up() -> None:
+    """
+    RE2 builds DFA states lazily during searches; run each matcher once at
+    import so the first user message doesn't pay for that.
+    """
+    sample = "blood pressure is high, popped and now pain, deload now please"
+    RESIDUAL_SET.Match(sample)
+    for _, pattern in CASE_SENSITIVE_RES:
+        pattern.search("new PR today")
+
+_warm_up()
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+def _phrase_hits(tl: str) -> set:
+    r"""
+    Reasons whose literal phrases occur in tl as whole words (like \b...\b).
+    """
+    hits = set()
+    for end, (phrase, reasons) in PHRASES.iter(tl):
+        start = end - len(phrase) + 1
+        if start > 0 and _is_word_char(tl[start - 1]):
+            continue
+        if end + 1 < len(tl) and _is_word_char(tl[end + 1]):
+            continue
+        hits.update(reasons)
+    return hits
+
+# Every pattern in a category contains at least one of these lowercase
+# stems (enforced by _check_stems below), so the residual set is skipped when
+# no unmatched category has one.
+MEDICAL_KW = (
+    "chest", "faint", "passed out", "black", "breath", "numb", "tingl", "weak",
+    "droop", "confus", "palpitation", "heartbeat", "flutter", "aorta", "aneurysm",
+    "blood pressure",
+)
+INJURY_KW = (
+    "pain", "pop", "swelling", "bruis", "bear weight", "walk", "unstable",
+    "giving out", "locks up",
+)
+COACH_KW = (
+    "max out", "1rm", "pr", "program", "skip", "deload", "what did you mean",
+    "what do you want",
+)
+CATEGORY_KW = {
+    "medical_red_flag": MEDICAL_KW,
+    "injury_red_flag": INJURY_KW,
+    "requires_coach_judgment": COACH_KW,
+}
+
+def _check_stems() -> None:
+    """
+    Fail at import if a pattern could match without any stem of its category
+    in the text: the prefilters would then skip it, a silent false negative.
+    Literal alternatives are checked in every spelling; regex alternatives
+    (and CASE_SENSITIVE, lowercased) by their source text.
+    """
+    patterns = [(reason, p) for reason, ps in CATEGORIES for p in ps]
+    patterns += [(reason, p.lower()) for reason, p in CASE_SENSITIVE]
+    for reason, p in patterns:
+        for alt in _split_alternatives(p):
+            for text in _literal_phrases(alt) or [alt]:
+                if not any(k in text for k in CATEGORY_KW[reason]):
+                    raise RuntimeError(
+                        f"{reason} pattern {alt!r} has no stem in CATEGORY_KW"
+                    )
+
+_check_stems()
+
+# No stem from any category means nothing can match: skip all matching
+TRIGGER_WORDS = frozenset(k for kws in CATEGORY_KW.values() for k in kws)
+
+_NO_ESCALATION = EscalationResult(escalate=False, reasons=())
+
+@functools.lru_cache(maxsize=512)
 def check_escalation(user_msg: str) -> EscalationResult:
     """
     MVP escalation logic using regex patterns.
     Returns whether to escalate and why.
+    Results are cached per message text, so the result is immutable.
     """
-    t = user_msg.strip()
-
-    reasons: List[str] = []
-
-    medical_red_flags = [
-        r"\bchest pain\b|\bchest pressure\b",
-        r"\bfaint(ed|ing)?\b|\bpassed out\b|\bblack(ed)? out\b",
-        r"\b(can't|cannot) breathe\b|\bshort(ness)? of breath\b|\bsevere shortness of breath\b",
-        r"\bnumb(ness)?\b|\btingl(e|ing)\b|\bweak(ness)?\b|\bface droop\b|\bconfus(ed|ion)\b",
-        r"\bpalpitation(s)?\b|\bheart flutter\b|\birregular heartbeat\b",
-        r"\baorta\b|\baneurysm\b",
-        r"\bblood pressure\b.*\b(high|spike|spiking)\b",
-    ]
-
-    injury_red_flags = [
-        r"\bsharp pain\b",
-        r"\bpop(ped)?\b.*\bpain\b|\bheard a pop\b",
-        r"\bswelling\b|\bbruise\b|\bbruising\b",
-        r"\b(can't|cannot) bear weight\b|\bcan't walk\b",
-        r"\bshoot(ing)? pain\b|\bpain down (my|the) (arm|leg)\b",
-        r"\bunstable\b|\bgiving out\b|\blocks up\b",
-    ]
-
-    needs_coach = [
-        r"\bmax out\b|\b1rm\b|\bPR\b",
-        r"\bchange (my|the) program\b|\bmodify (my|the) program\b",
-        r"\bskip (this|the) week\b|\bdeload\b.*\bnow\b",
-        r"\bwhat did you mean\b|\bwhat do you want me to do\b",
-    ]
-
-    if _contains_any(t, medical_red_flags):
-        reasons.append("medical_red_flag")
-
-    if _contains_any(t, injury_red_flags):
-        reasons.append("injury_red_flag")
-
-    if _contains_any(t, needs_coach):
-        reasons.append("requires_coach_judgment")
-
-    return EscalationResult(escalate=len(reasons) > 0, reasons=reasons)
+    # Lowercased once and used for every stage except CASE_SENSITIVE. No
+    # strip(): every pattern is \b-anchored and stems are substrings, so
+    # surrounding whitespace never changes the result
+    tl = user_msg.lower()
+
+    if not any(w in tl for w in TRIGGER_WORDS):
+        return _NO_ESCALATION
+
+    hits = _phrase_hits(tl)
+
+    for reason, pattern in CASE_SENSITIVE_RES:
+        if reason not in hits and pattern.search(user_msg):
+            hits.add(reason)
+
+    # Only scan the residual set if a category still unmatched has a stem
+    if any(
+        reason not in hits and any(k in tl for k in CATEGORY_KW[reason])
+        for reason, _ in CATEGORIES
+    ):
+        for i in RESIDUAL_SET.Match(tl) or ():
+            hits.add(RESIDUAL_REASONS[i])
+
+    reasons = [reason for reason, _ in CATEGORIES if reason in hits]
+
+    return EscalationResult(escalate=len(reasons) > 0, reasons=tuple(reasons))
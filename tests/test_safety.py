@@ -0,0 +1,73 @@
+import random
+import re
+
+import pytest
+
+import safety
+
+# The reference: every category's patterns as one plain stdlib regex, run the
+# way the patterns read (case-insensitive), plus CASE_SENSITIVE as written.
+# check_escalation's prefilters, Aho-Corasick phrases and RE2 set must agree.
+REFERENCE = [
+    (reason, re.compile("|".join(patterns), re.IGNORECASE))
+    for reason, patterns in safety.CATEGORIES
+]
+REFERENCE_CS = [
+    (reason, re.compile(pattern)) for reason, pattern in safety.CASE_SENSITIVE
+]
+
+def reference_reasons(msg: str):
+    hits = {reason for reason, rx in REFERENCE if rx.search(msg)}
+    hits |= {reason for reason, rx in REFERENCE_CS if rx.search(msg)}
+    return tuple(reason for reason, _ in safety.CATEGORIES if reason in hits)
+
+def _pattern_words():
+    words = set()
+    for _, patterns in safety.CATEGORIES:
+        for p in patterns:
+            words.update(re.findall(r"[a-z0-9']+", p.replace(r"\b", " ")))
+    return sorted(words)
+
+# Pattern words and their fragments, spelled variants, near misses and noise
+VOCAB = _pattern_words() + """
+fainted fainting blacked numbness tingling weakness confused confusion
+palpitation palpitations bruise bruising popped shooting shortness
+PR Pr pR 'PR' PRs 1RM pr. per programme skipping deloading painful
+hello ok x , . ! ? - my the a i
+""".split()
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_plain_regex_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(10000):
+        sep = rng.choice([" ", "", "  ", "\n"])
+        msg = sep.join(rng.choice(VOCAB) for _ in range(rng.randint(1, 8)))
+        if rng.random() < 0.2:
+            msg = msg.upper()
+        assert safety.check_escalation(msg).reasons == reference_reasons(msg), msg
+
+@pytest.mark.parametrize("msg, reasons", [
+    ("I have chest pain", ("medical_red_flag",)),
+    ("my blood pressure is spiking", ("medical_red_flag",)),
+    ("heard a pop and now sharp pain", ("injury_red_flag",)),
+    ("can I max out today? new PR", ("requires_coach_judgment",)),
+    ("one set pr. rep", ()),
+    ("great session, thanks", ()),
+    ("I blacked out after my 1rm", ("medical_red_flag", "requires_coach_judgment")),
+])
+def test_examples(msg, reasons):
+    result = safety.check_escalation(msg)
+    assert result.reasons == reasons
+    assert result.escalate == bool(reasons)
+
+def test_literal_phrases_expands_groups():
+    assert sorted(safety._literal_phrases(r"\bbruis(?:e|ing)\b")) == ["bruise", "bruising"]
+    assert sorted(safety._literal_phrases(r"\bpalpitations?\b")) == ["palpitation", "palpitations"]
+
+@pytest.mark.parametrize("alt", [
+    r"\bdeload\b.{0,80}?\bnow\b",
+    r"\b(?:high|spik(?:e|ing))\b",
+    r"chest pain",
+])
+def test_literal_phrases_leaves_real_regexes_to_re2(alt):
+    assert safety._literal_phrases(alt) is None
@@ -0,0 +1,49 @@
+import re
+import time
+from typing import Iterator
+
+# A word plus its trailing whitespace (or leading whitespace on its own)
+_CHUNK_RE = re.compile(r"\S+\s*|\s+")
+
+# Short words are batched until a chunk has at least this many characters,
+# so a reply costs about len(text) / CHUNK_CHARS stream deltas
+CHUNK_CHARS = 8
+
+def _word_chunks(text: str, typing_speed: float) -> Iterator[str]:
+    buf = ""
+    for word in _CHUNK_RE.findall(text):
+        buf += word
+        if len(buf) >= CHUNK_CHARS:
+            yield buf
+            time.sleep(typing_speed * len(buf))
+            buf = ""
+    if buf:
+        yield buf
+
+def type_text(
+    text: str,
+    container,
+    typing_speed: float = 0.035,
+    pre_delay: float = 0.6
+):
+    """
+    Types text into a Streamlit container with a short delay.
+    Streams word-sized chunks through st.write_stream, so the frontend
+    appends deltas instead of re-rendering the whole prefix.
+    
+    text: string to type
+    container: st.empty(), st.container() or st.chat_message()
+    typing_speed: seconds per character
+    pre_delay: pause before typing starts
+    """
+
+    # One slot for placeholder and reply, so "…" is replaced rather than left
+    # above the text when container is a st.container() or st.chat_message()
+    slot = container.empty()
+
+    # Initial thinking pause
+    if pre_delay > 0:
+        slot.markdown("…")
+        time.sleep(pre_delay)
+
+    return slot.write_stream(_word_chunks(text, typing_speed))